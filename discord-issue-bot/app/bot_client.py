@@ -1,7 +1,8 @@
 import discord
 from discord import app_commands
 
-from . import config
+from . import config, store
+from .github_api import shutdown_executor
 
 
 class Bot(discord.Client):
@@ -13,6 +14,11 @@ class Bot(discord.Client):
     async def on_ready(self):
         print(f"Logged in as {self.user}")
 
+    async def close(self):
+        await super().close()
+        shutdown_executor()
+        store.flush_history()
+
     async def setup_hook(self):
         # Sync slash commands (guild-scoped if provided for instant availability)
         try:
@@ -9,7 +9,7 @@ from .env_sync import (
     load_env_file,
     sync_repository_variables,
 )
-from .github_api import http_get, http_post
+from .github_api import ahttp_get, ahttp_post, run_blocking
 from .parser import parse_labels_input, parse_assignees_input
 from .utils import build_body_with_footer
 from .store import recent_repos, remember_repo
@@ -277,7 +277,7 @@ class IssueModal(discord.ui.Modal, title='GitHub Issue 作成'):
             payload["assignees"] = assignee_list
 
         url = f"{config.GITHUB_API}/repos/{self.repo}/issues"
-        status, resp = http_post(url, config.GITHUB_TOKEN, payload)
+        status, resp = await ahttp_post(url, config.GITHUB_TOKEN, payload)
         try:
             data = json.loads(resp) if resp else {}
         except Exception:
@@ -295,7 +295,7 @@ class IssueModal(discord.ui.Modal, title='GitHub Issue 作成'):
         if status == 422 and isinstance(data, dict) and payload.get("assignees"):
             retry_payload = dict(payload)
             retry_payload.pop("assignees", None)
-            status2, resp2 = http_post(url, config.GITHUB_TOKEN, retry_payload)
+            status2, resp2 = await ahttp_post(url, config.GITHUB_TOKEN, retry_payload)
             try:
                 data2 = json.loads(resp2) if resp2 else {}
             except Exception:
@@ -401,7 +401,7 @@ def setup_commands(bot: discord.Client):
             payload["assignees"] = assignee_list
 
         url = f"{config.GITHUB_API}/repos/{repo}/issues"
-        status, resp = http_post(url, config.GITHUB_TOKEN, payload)
+        status, resp = await ahttp_post(url, config.GITHUB_TOKEN, payload)
         try:
             data = json.loads(resp) if resp else {}
         except Exception:
@@ -419,7 +419,7 @@ def setup_commands(bot: discord.Client):
         if status == 422 and isinstance(data, dict) and payload.get("assignees"):
             retry_payload = dict(payload)
             retry_payload.pop("assignees", None)
-            status2, resp2 = http_post(url, config.GITHUB_TOKEN, retry_payload)
+            status2, resp2 = await ahttp_post(url, config.GITHUB_TOKEN, retry_payload)
             try:
                 data2 = json.loads(resp2) if resp2 else {}
             except Exception:
@@ -481,7 +481,7 @@ def setup_commands(bot: discord.Client):
         # 1) default branch if not provided
         target_branch = branch
         if not target_branch:
-            st, body = http_get(f"{config.GITHUB_API}/repos/{repo}", config.GITHUB_TOKEN)
+            st, body = await ahttp_get(f"{config.GITHUB_API}/repos/{repo}", config.GITHUB_TOKEN)
             try:
                 repo_info = json.loads(body) if body else {}
             except Exception:
@@ -492,7 +492,7 @@ def setup_commands(bot: discord.Client):
             target_branch = repo_info["default_branch"]
 
         # 2) get latest commit sha for branch
-        st2, body2 = http_get(f"{config.GITHUB_API}/repos/{repo}/commits/{target_branch}", config.GITHUB_TOKEN)
+        st2, body2 = await ahttp_get(f"{config.GITHUB_API}/repos/{repo}/commits/{target_branch}", config.GITHUB_TOKEN)
         try:
             commit_info = json.loads(body2) if body2 else {}
         except Exception:
@@ -504,7 +504,7 @@ def setup_commands(bot: discord.Client):
 
         # 3) create lightweight tag (ref)
         payload = {"ref": f"refs/tags/{tag}", "sha": sha}
-        st3, body3 = http_post(f"{config.GITHUB_API}/repos/{repo}/git/refs", config.GITHUB_TOKEN, payload)
+        st3, body3 = await ahttp_post(f"{config.GITHUB_API}/repos/{repo}/git/refs", config.GITHUB_TOKEN, payload)
         if st3 in (200, 201):
             remember_repo(repo)
             await interaction.followup.send(
@@ -617,7 +617,9 @@ def setup_commands(bot: discord.Client):
             "🔐 値を暗号化して GitHub API にリクエストを送信しています…"
         )
 
-        result = sync_repository_variables(target_repo, filtered, token=config.GITHUB_TOKEN, dry_run=False)
+        result = await run_blocking(
+            sync_repository_variables, target_repo, filtered, token=config.GITHUB_TOKEN, dry_run=False
+        )
 
         if result.failed_count == 0:
             remember_repo(target_repo)
@@ -694,7 +696,8 @@ def setup_commands(bot: discord.Client):
         await interaction.response.defer(thinking=True)
 
         try:
-            result = sync_workflow_preset(
+            result = await run_blocking(
+                sync_workflow_preset,
                 target_repo=repo,
                 preset_name=preset,
                 template_repo=template_repo,
@@ -818,7 +821,8 @@ def setup_commands(bot: discord.Client):
         )
 
         try:
-            workflow_result = sync_workflow_preset(
+            workflow_result = await run_blocking(
+                sync_workflow_preset,
                 target_repo=repo,
                 preset_name=preset,
                 template_repo=template_repo,
@@ -847,7 +851,7 @@ def setup_commands(bot: discord.Client):
             f"• 対象キー数: {len(filtered)}"
         )
 
-        env_result = sync_repository_variables(repo, filtered, token=config.GITHUB_TOKEN, dry_run=False)
+        env_result = await run_blocking(sync_repository_variables, repo, filtered, token=config.GITHUB_TOKEN, dry_run=False)
 
         await log_target.send("**workflow_preset**\n" + _format_workflow_summary_text(workflow_result, repo, preset))
         await log_target.send("**sync_env**")
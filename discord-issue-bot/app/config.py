@@ -18,6 +18,9 @@ ENV_SYNC_ALLOWED_USERS_RAW = os.environ.get("DISCORD_ENV_SYNC_ALLOWED_USERS", ""
 REPO_SUGGEST_ACCOUNTS_RAW = os.environ.get("DISCORD_REPO_SUGGEST_ACCOUNTS", "")
 REPO_SUGGEST_LOOKBACK_DAYS_RAW = os.environ.get("DISCORD_REPO_SUGGEST_LOOKBACK_DAYS", "7")
 
+# Worker threads for blocking GitHub calls made from slash commands
+GITHUB_IO_WORKERS_RAW = os.environ.get("DISCORD_GITHUB_IO_WORKERS", "8")
+
 
 def get_env_sync_allowed_users() -> set[int]:
     allowed: set[int] = set()
@@ -52,3 +55,11 @@ def get_repo_suggest_lookback_days(default: int = 7) -> int:
         return value if value > 0 else default
     except ValueError:
         return default
+
+
+def get_github_io_workers(default: int = 8) -> int:
+    try:
+        value = int(GITHUB_IO_WORKERS_RAW.strip())
+        return value if value > 0 else default
+    except ValueError:
+        return default
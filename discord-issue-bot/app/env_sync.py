@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import base64
 import json
+import threading
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, Iterable, Tuple
@@ -13,6 +15,11 @@ from nacl import encoding, public
 
 from . import config
 
+# 公開鍵はほとんどローテーションされないので TTL 付きでプロセス内にキャッシュする
+PUBLIC_KEY_TTL = 15 * 60
+_public_key_cache: Dict[str, Tuple[float, str, public.SealedBox]] = {}
+_public_key_lock = threading.Lock()
+
 
 @dataclass(slots=True)
 class SyncResult:
@@ -89,34 +96,46 @@ def _call_github_get(url: str, token: str) -> Tuple[int, str]:
         return 0, str(exc.reason)
 
 
-def _get_public_key(repo: str, token: str) -> Tuple[str, str] | None:
+def _get_public_key(repo: str, token: str, *, refresh: bool = False) -> Tuple[str, public.SealedBox] | None:
     """Get repository public key for encrypting secrets.
 
-    Returns (key_id, key) tuple or None on failure.
+    The parsed key is cached per repository for ``PUBLIC_KEY_TTL`` seconds.
+    Pass ``refresh=True`` to bypass the cache (e.g. after a stale ``key_id``).
+
+    Returns (key_id, sealed_box) tuple or None on failure.
     """
+    cache_key = repo.lower()
+    with _public_key_lock:
+        cached = _public_key_cache.get(cache_key)
+        if cached and not refresh and cached[0] > time.monotonic():
+            return cached[1], cached[2]
+
     url = f"{config.GITHUB_API}/repos/{repo}/actions/secrets/public-key"
     status, body = _call_github_get(url, token)
     if status != 200:
         return None
     try:
         data = json.loads(body)
-        return data.get("key_id"), data.get("key")
+        key_id = data["key_id"]
+        sealed_box = public.SealedBox(public.PublicKey(base64.b64decode(data["key"])))
     except Exception:
         return None
 
+    with _public_key_lock:
+        _public_key_cache[cache_key] = (time.monotonic() + PUBLIC_KEY_TTL, key_id, sealed_box)
+    return key_id, sealed_box
+
 
-def _encrypt_secret(public_key: str, secret_value: str) -> str:
+def _encrypt_secret(sealed_box: public.SealedBox, secret_value: str) -> str:
     """Encrypt a secret using the repository's public key.
 
     Args:
-        public_key: Base64-encoded public key from GitHub
+        sealed_box: SealedBox built from the repository public key
         secret_value: The secret value to encrypt
 
     Returns:
         Base64-encoded encrypted value
     """
-    public_key_bytes = base64.b64decode(public_key)
-    sealed_box = public.SealedBox(public.PublicKey(public_key_bytes))
     encrypted = sealed_box.encrypt(secret_value.encode("utf-8"))
     return base64.b64encode(encrypted).decode("utf-8")
 
@@ -143,7 +162,7 @@ def sync_repository_variables(
         failures = [(name, 0, "Failed to retrieve repository public key") for name in items.keys()]
         return SyncResult(failed=failures)
 
-    key_id, public_key = key_result
+    key_id, sealed_box = key_result
 
     base_url = f"{config.GITHUB_API}/repos/{repo}/actions/secrets"
     created: list[str] = []
@@ -156,7 +175,7 @@ def sync_repository_variables(
 
         # Encrypt the secret value
         try:
-            encrypted_value = _encrypt_secret(public_key, value)
+            encrypted_value = _encrypt_secret(sealed_box, value)
         except Exception as exc:
             failures.append((name, 0, f"Encryption failed: {exc}"))
             continue
@@ -169,6 +188,16 @@ def sync_repository_variables(
         }
 
         status, body = _call_github("PUT", target, payload, token)
+        if status == 422:
+            # key_id が古い (公開鍵がローテーションされた) 可能性があるので取り直して 1 回だけ再送
+            refreshed = _get_public_key(repo, token, refresh=True)
+            if refreshed and refreshed[0] != key_id:
+                key_id, sealed_box = refreshed
+                payload = {
+                    "encrypted_value": _encrypt_secret(sealed_box, value),
+                    "key_id": key_id,
+                }
+                status, body = _call_github("PUT", target, payload, token)
         if status in (201, 204):
             # GitHub returns 201 for creation, 204 for update
             # We can't reliably distinguish between them without a prior GET,
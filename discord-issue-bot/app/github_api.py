@@ -1,7 +1,15 @@
+import asyncio
+import functools
 import json
+from concurrent.futures import ThreadPoolExecutor
 from urllib import request, error
 from . import config
 
+HTTP_TIMEOUT = 30
+
+# GitHub への同期 I/O はこのプールで実行し、イベントループ (heartbeat / autocomplete) を止めない
+_executor = ThreadPoolExecutor(max_workers=config.get_github_io_workers(), thread_name_prefix="github-io")
+
 
 def http_get(url: str, token: str | None = None):
     req = request.Request(url, method="GET")
@@ -9,7 +17,7 @@ def http_get(url: str, token: str | None = None):
         req.add_header("Authorization", f"Bearer {token}")
     req.add_header("Accept", "application/vnd.github+json")
     try:
-        with request.urlopen(req) as resp:
+        with request.urlopen(req, timeout=HTTP_TIMEOUT) as resp:
             body = resp.read().decode("utf-8")
             return resp.status, body
     except error.HTTPError as e:
@@ -17,6 +25,24 @@ def http_get(url: str, token: str | None = None):
         return e.code, body
 
 
+def http_get_with_headers(url: str, token: str | None = None, headers: dict | None = None):
+    """Like ``http_get`` but sends extra request ``headers`` and also returns the response headers."""
+    req = request.Request(url, method="GET")
+    if token:
+        req.add_header("Authorization", f"Bearer {token}")
+    req.add_header("Accept", "application/vnd.github+json")
+    for name, value in (headers or {}).items():
+        req.add_header(name, value)
+    try:
+        with request.urlopen(req, timeout=HTTP_TIMEOUT) as resp:
+            body = resp.read().decode("utf-8")
+            return resp.status, body, resp.headers
+    except error.HTTPError as e:
+        # 304 Not Modified also arrives here
+        body = e.read().decode("utf-8", errors="replace") if e.fp else ""
+        return e.code, body, e.headers or {}
+
+
 def http_post(url: str, token: str, payload: dict):
     data = json.dumps(payload).encode("utf-8")
     req = request.Request(url, data=data, method="POST")
@@ -24,9 +50,27 @@ def http_post(url: str, token: str, payload: dict):
     req.add_header("Accept", "application/vnd.github+json")
     req.add_header("Content-Type", "application/json")
     try:
-        with request.urlopen(req) as resp:
+        with request.urlopen(req, timeout=HTTP_TIMEOUT) as resp:
             body = resp.read().decode("utf-8")
             return resp.status, body
     except error.HTTPError as e:
         body = e.read().decode("utf-8", errors="replace") if e.fp else ""
         return e.code, body
+
+
+async def run_blocking(func, *args, **kwargs):
+    """Run a blocking GitHub helper on the bounded I/O pool and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, functools.partial(func, *args, **kwargs))
+
+
+async def ahttp_get(url: str, token: str | None = None):
+    return await run_blocking(http_get, url, token)
+
+
+async def ahttp_post(url: str, token: str, payload: dict):
+    return await run_blocking(http_post, url, token, payload)
+
+
+def shutdown_executor() -> None:
+    _executor.shutdown(wait=False, cancel_futures=True)
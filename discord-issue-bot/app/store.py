@@ -1,30 +1,80 @@
+import atexit
+import itertools
 import json
 import os
+import re
+import tempfile
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 from datetime import datetime, timedelta, timezone
 
 from . import config
-from .github_api import http_get
+from .github_api import http_get_with_headers
 
 
 HISTORY_ENV = "DISCORD_ISSUE_BOT_HISTORY"
 REMOTE_CACHE_TTL_SECONDS = 300
+REMOTE_FETCH_WORKERS = 8
+REPO_INDEX_FILE = "repo-index.json"
+REPO_INDEX_VERSION = 1
+MAX_REPO_PAGES = 50
+QUERY_CACHE_SIZE = 256
+HISTORY_LIMIT = 50
+FLUSH_DELAY_SECONDS = 2.0
+JOURNAL_MAX_ENTRIES = 200
 
-_remote_repo_cache: Dict[str, object] = {"timestamp": 0.0, "repos": []}
+_remote_repo_cache: Dict[str, object] = {"timestamp": 0.0, "repos": [], "index": None}
+_remote_refresh_lock = threading.Lock()
+_remote_refresh_running = False
+# Persisted per-account repository index; only touched by the refresh thread
+_account_index: Dict[str, Dict] | None = None
+_NEXT_LINK = re.compile(r'<([^>]+)>\s*;\s*rel="next"')
+
+# 履歴はメモリ上に 1 度だけ読み込み、autocomplete ではディスクに触れない
+_history_lock = threading.Lock()
+_history: "_RepoIndex | None" = None
+_history_file: Path | None = None
+_query_cache: "OrderedDict[Tuple[str, int, int, int], List[str]]" = OrderedDict()
+_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="history-writer")
+_index_versions = itertools.count(1)
+
+
+class _RepoIndex:
+    """Repository names in display order, with lower-cased keys for substring lookups."""
+
+    __slots__ = ("repos", "keys", "version")
+
+    def __init__(self, repos: List[str]):
+        self.repos = repos
+        self.keys = [r.lower() for r in repos]
+        self.version = next(_index_versions)
+
+    def search(self, query: str):
+        for key, repo in zip(self.keys, self.repos):
+            if not query or query in key:
+                yield key, repo
+
+
+_EMPTY_INDEX = _RepoIndex([])
 
 
 def _history_path() -> Path:
+    global _history_file
+    if _history_file is not None:
+        return _history_file
+
     custom = os.environ.get(HISTORY_ENV)
     if custom:
         p = Path(os.path.expanduser(custom)).resolve()
-        p.parent.mkdir(parents=True, exist_ok=True)
-        return p
-
-    # Default: use container-mounted volume at /data/history.json
-    p = Path("/data/history.json")
+    else:
+        # Default: use container-mounted volume at /data/history.json
+        p = Path("/data/history.json")
     p.parent.mkdir(parents=True, exist_ok=True)
+    _history_file = p
     return p
 
 
@@ -44,135 +94,376 @@ def _load() -> Dict:
         return {"repos": []}
 
 
-def _save(data: Dict) -> None:
-    path = _history_path()
+def _save(data: Dict) -> bool:
+    return _write_json(_history_path(), data)
+
+
+def _write_json(path: Path, data: Dict) -> bool:
     try:
-        path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        # Write to a temp file in the same directory and swap it in atomically
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(json.dumps(data, ensure_ascii=False, indent=2))
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        return True
     except Exception:
         # best-effort persistence; ignore write failures
-        pass
+        return False
+
+
+def _journal_path() -> Path:
+    path = _history_path()
+    return path.with_name(path.name + ".journal")
+
+
+def _load_journal() -> List[str]:
+    try:
+        lines = _journal_path().read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return []
+    repos: List[str] = []
+    for line in lines:
+        try:
+            repo = json.loads(line).get("repo")
+        except Exception:
+            # A crash mid-append can leave a torn last line
+            continue
+        if isinstance(repo, str) and repo:
+            repos.append(repo)
+    return repos
+
+
+def _move_to_front(repos: List[str], repo: str, limit: int) -> List[str]:
+    repos = [r for r in repos if r.lower() != repo.lower()]
+    repos.insert(0, repo)
+    if limit and len(repos) > limit:
+        repos = repos[:limit]
+    return repos
+
+
+class _HistoryPersister:
+    """Write-behind persistence for the in-memory history.
+
+    Every update is appended to a small journal on the writer thread right away, so
+    it survives a crash. The full snapshot is rewritten atomically at most once per
+    ``delay`` seconds (or when the journal reaches ``max_journal`` entries), after
+    which the journal is truncated.
+    """
+
+    def __init__(self, delay: float = FLUSH_DELAY_SECONDS, max_journal: int = JOURNAL_MAX_ENTRIES):
+        self.delay = delay
+        self.max_journal = max_journal
+        self._lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+        self._dirty = False
+        # Only touched from the writer thread
+        self._journal_entries = 0
+
+    def record(self, repo: str) -> None:
+        _writer.submit(self._append_journal, repo)
+        with self._lock:
+            self._dirty = True
+            if self._timer is None:
+                self._timer = threading.Timer(self.delay, self._on_timer)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self, timeout: float = 5.0) -> None:
+        with self._lock:
+            timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+        try:
+            _writer.submit(self._write_snapshot).result(timeout)
+        except RuntimeError:
+            # The writer is gone during interpreter shutdown; write inline instead
+            self._write_snapshot()
+
+    def _on_timer(self) -> None:
+        with self._lock:
+            self._timer = None
+        try:
+            _writer.submit(self._write_snapshot)
+        except RuntimeError:
+            pass
+
+    def _append_journal(self, repo: str) -> None:
+        try:
+            with _journal_path().open("a", encoding="utf-8") as f:
+                f.write(json.dumps({"repo": repo}, ensure_ascii=False) + "\n")
+        except OSError:
+            return
+        self._journal_entries += 1
+        if self._journal_entries >= self.max_journal:
+            self._write_snapshot()
+
+    def _write_snapshot(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+        with _history_lock:
+            repos = list(_history.repos) if _history is not None else []
+        if not _save({"repos": repos}):
+            with self._lock:
+                self._dirty = True
+            return
+        # The snapshot now covers every journaled update
+        try:
+            _journal_path().unlink(missing_ok=True)
+        except OSError:
+            pass
+        self._journal_entries = 0
+
+
+_persister = _HistoryPersister()
 
 
 def normalize_repo(repo: str) -> str:
     return (repo or "").strip()
 
 
-def remember_repo(repo: str, limit: int = 50) -> None:
+def load_history() -> None:
+    """Load the history file into memory; later calls are no-ops."""
+    _history_index()
+
+
+def _history_index() -> _RepoIndex:
+    global _history
+    with _history_lock:
+        if _history is None:
+            repos = [r for r in _load().get("repos", []) if isinstance(r, str)]
+            # Replay updates journaled after the last snapshot (e.g. before a crash)
+            for repo in _load_journal():
+                repos = _move_to_front(repos, repo, HISTORY_LIMIT)
+            _history = _RepoIndex(repos)
+        return _history
+
+
+def flush_history() -> None:
+    """Write pending history updates to disk now (called on shutdown)."""
+    _persister.flush()
+
+
+atexit.register(flush_history)
+
+
+def remember_repo(repo: str, limit: int = HISTORY_LIMIT) -> None:
+    global _history
     repo = normalize_repo(repo)
     if not repo:
         return
-    data = _load()
-    repos: List[str] = [r for r in data.get("repos", []) if isinstance(r, str)]
-    # Move to front, unique
-    repos = [r for r in repos if r.lower() != repo.lower()]
-    repos.insert(0, repo)
-    if limit and len(repos) > limit:
-        repos = repos[:limit]
-    data["repos"] = repos
-    _save(data)
+    _history_index()
+    with _history_lock:
+        # Move to front, unique
+        _history = _RepoIndex(_move_to_front(_history.repos, repo, limit))
+        _query_cache.clear()
+        # Journal under the lock so replay order matches update order
+        _persister.record(repo)
 
 
 def recent_repos(query: str = "", limit: int = 25) -> List[str]:
     q = (query or "").strip().lower()
-    local_repos = [r for r in _load().get("repos", []) if isinstance(r, str)]
+    local_index = _history_index()
+    remote_index = _get_remote_repo_index()
+
+    cache_key = (q, limit, local_index.version, remote_index.version)
+    with _history_lock:
+        cached = _query_cache.get(cache_key)
+        if cached is not None:
+            _query_cache.move_to_end(cache_key)
+            return list(cached)
 
     results: List[str] = []
     seen = set()
+    for index in (local_index, remote_index):
+        for key, repo in index.search(q):
+            if key in seen:
+                continue
+            results.append(repo)
+            seen.add(key)
+            if len(results) >= limit:
+                break
+        if len(results) >= limit:
+            break
 
-    def _matches(name: str) -> bool:
-        return not q or q in name.lower()
+    with _history_lock:
+        _query_cache[cache_key] = results
+        while len(_query_cache) > QUERY_CACHE_SIZE:
+            _query_cache.popitem(last=False)
+    return list(results)
 
-    for repo in local_repos:
-        if not isinstance(repo, str):
-            continue
-        if not _matches(repo):
-            continue
-        key = repo.lower()
-        if key in seen:
-            continue
-        results.append(repo)
-        seen.add(key)
-        if len(results) >= limit:
-            return results
 
-    remote_candidates = _get_remote_repo_candidates()
-    for repo in remote_candidates:
-        if not _matches(repo):
-            continue
-        key = repo.lower()
-        if key in seen:
-            continue
-        results.append(repo)
-        seen.add(key)
-        if len(results) >= limit:
-            break
+def _get_remote_repo_index() -> _RepoIndex:
+    """Return the cached remote suggestions immediately (stale-while-revalidate).
 
-    return results[:limit]
+    When the cache is older than ``REMOTE_CACHE_TTL_SECONDS`` a single background
+    refresh is started; the current keystroke is still answered from the cache.
+    """
+    if time.monotonic() - float(_remote_repo_cache["timestamp"]) >= REMOTE_CACHE_TTL_SECONDS:
+        refresh_remote_repos()
+    index = _remote_repo_cache.get("index")
+    return index if isinstance(index, _RepoIndex) else _EMPTY_INDEX
 
 
 def _get_remote_repo_candidates() -> List[str]:
-    now = time.monotonic()
-    cached_timestamp = _remote_repo_cache.get("timestamp", 0.0)
-    if now - float(cached_timestamp) < REMOTE_CACHE_TTL_SECONDS:
-        repos = _remote_repo_cache.get("repos", [])
-        return list(repos) if isinstance(repos, list) else []
-
-    repos = _fetch_remote_repos()
-    _remote_repo_cache["timestamp"] = now
-    _remote_repo_cache["repos"] = repos
-    return repos
+    return _get_remote_repo_index().repos
+
+
+def refresh_remote_repos() -> bool:
+    """Start refreshing remote suggestions in the background unless a refresh is running."""
+    global _remote_refresh_running
+    if not config.get_repo_suggest_accounts():
+        _remote_repo_cache["timestamp"] = time.monotonic()
+        return False
+    with _remote_refresh_lock:
+        if _remote_refresh_running:
+            return False
+        _remote_refresh_running = True
+    threading.Thread(target=_refresh_remote_repos, name="repo-suggest-refresh", daemon=True).start()
+    return True
+
+
+def _refresh_remote_repos() -> None:
+    global _remote_refresh_running
+    try:
+        repos = _fetch_remote_repos()
+        _remote_repo_cache["repos"] = repos
+        _remote_repo_cache["index"] = _RepoIndex(repos)
+    except Exception as e:
+        print(f"Repository suggestion refresh failed: {e}")
+    finally:
+        _remote_repo_cache["timestamp"] = time.monotonic()
+        with _remote_refresh_lock:
+            _remote_refresh_running = False
 
 
 def _fetch_remote_repos() -> List[str]:
-    accounts = config.get_repo_suggest_accounts()
+    global _account_index
+    accounts = [a.strip() for a in config.get_repo_suggest_accounts() if a.strip()]
     if not accounts:
         return []
+    if _account_index is None:
+        _account_index = _load_account_index()
+
+    # アカウントごとの取得は並列に行う
+    with ThreadPoolExecutor(max_workers=min(len(accounts), REMOTE_FETCH_WORKERS)) as pool:
+        fetched = list(pool.map(lambda account: _sync_account_index(account, _account_index.get(account)), accounts))
+
+    changed = False
+    for account, (entry, updated) in zip(accounts, fetched):
+        # A failed account keeps its last persisted entry
+        if entry is not None:
+            _account_index[account] = entry
+            changed = changed or updated
+    if changed:
+        _write_json(_repo_index_path(), {"version": REPO_INDEX_VERSION, "accounts": _account_index})
 
     lookback_days = config.get_repo_suggest_lookback_days()
-    threshold = datetime.now(timezone.utc) - timedelta(days=lookback_days) if lookback_days > 0 else None
+    threshold = (
+        (datetime.now(timezone.utc) - timedelta(days=lookback_days)).timestamp() if lookback_days > 0 else None
+    )
 
     collected: List[str] = []
     seen: set[str] = set()
-
     for account in accounts:
-        account = account.strip()
-        if not account:
-            continue
-        url = f"{config.GITHUB_API}/users/{account}/repos?sort=updated&per_page=100&type=all"
-        status, body = http_get(url, config.GITHUB_TOKEN)
-        if status != 200 or not body:
-            continue
-        try:
-            data = json.loads(body)
-        except Exception:
-            continue
-        if not isinstance(data, list):
-            continue
-        for repo in data:
-            if not isinstance(repo, dict):
-                continue
-            full_name = repo.get("full_name")
-            if not isinstance(full_name, str) or not full_name:
-                continue
-            key = full_name.lower()
+        # repos are sorted by last activity, so the lookback filter stops at the first old one
+        for repo in (_account_index.get(account) or {}).get("repos", []):
+            if threshold and repo["active"] < threshold:
+                break
+            key = repo["full_name"].lower()
             if key in seen:
                 continue
-            if repo.get("archived"):
-                continue
-            if threshold:
-                updated_at = _parse_github_timestamp(repo.get("updated_at"))
-                created_at = _parse_github_timestamp(repo.get("created_at"))
-                if updated_at and updated_at >= threshold:
-                    pass
-                elif created_at and created_at >= threshold:
-                    pass
-                else:
-                    continue
             seen.add(key)
-            collected.append(full_name)
+            collected.append(repo["full_name"])
     return collected
 
 
+def _repo_index_path() -> Path:
+    return _history_path().with_name(REPO_INDEX_FILE)
+
+
+def _load_account_index() -> Dict[str, Dict]:
+    try:
+        data = json.loads(_repo_index_path().read_text(encoding="utf-8"))
+        if data.get("version") == REPO_INDEX_VERSION and isinstance(data.get("accounts"), dict):
+            return data["accounts"]
+    except Exception:
+        pass
+    return {}
+
+
+def _sync_account_index(account: str, previous: Dict | None) -> Tuple[Dict | None, bool]:
+    """Fetch every page of ``account``'s repositories, revalidating cached pages by ETag.
+
+    Returns the account entry ``{"pages": ..., "repos": [...]}`` (``repos`` sorted by
+    last activity, newest first) and whether anything changed, or ``(None, False)``
+    when a request failed.
+    """
+    previous_pages: Dict[str, Dict] = (previous or {}).get("pages") or {}
+    pages: Dict[str, Dict] = {}
+    changed = False
+    url: str | None = f"{config.GITHUB_API}/users/{account}/repos?sort=updated&per_page=100&type=all"
+    while url and len(pages) < MAX_REPO_PAGES:
+        cached = previous_pages.get(url)
+        headers = {"If-None-Match": cached["etag"]} if cached and cached.get("etag") else None
+        status, body, response_headers = http_get_with_headers(url, config.GITHUB_TOKEN, headers)
+        if status == 304 and cached:
+            page = cached
+        elif status == 200 and body:
+            try:
+                data = json.loads(body)
+            except Exception:
+                return None, False
+            if not isinstance(data, list):
+                return None, False
+            page = {
+                "etag": response_headers.get("ETag"),
+                "next": _next_link(response_headers.get("Link")),
+                "repos": [entry for entry in map(_index_entry, data) if entry],
+            }
+            changed = True
+        else:
+            return None, False
+        pages[url] = page
+        url = page.get("next")
+
+    if pages.keys() != previous_pages.keys():
+        changed = True
+    merged: Dict[str, Dict] = {}
+    for page in pages.values():
+        for repo in page["repos"]:
+            merged.setdefault(repo["full_name"].lower(), repo)
+    repos = sorted(merged.values(), key=lambda repo: repo["active"], reverse=True)
+    return {"pages": pages, "repos": repos}, changed
+
+
+def _index_entry(repo) -> Dict | None:
+    if not isinstance(repo, dict) or repo.get("archived"):
+        return None
+    full_name = repo.get("full_name")
+    if not isinstance(full_name, str) or not full_name:
+        return None
+    # Timestamps are parsed once per fetched page, not on every refresh
+    times = [
+        ts.timestamp()
+        for ts in (_parse_github_timestamp(repo.get("updated_at")), _parse_github_timestamp(repo.get("created_at")))
+        if ts
+    ]
+    return {"full_name": full_name, "active": max(times, default=0.0)}
+
+
+def _next_link(link_header: str | None) -> str | None:
+    if not link_header:
+        return None
+    match = _NEXT_LINK.search(link_header)
+    return match.group(1) if match else None
+
+
 def _parse_github_timestamp(value) -> datetime | None:
     if not value or not isinstance(value, str):
         return None
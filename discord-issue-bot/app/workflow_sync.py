@@ -330,7 +330,7 @@ def create_or_update_file(
         WorkflowSyncError: If the operation fails.
     """
     import base64
-    from .github_api import http_get, http_post
+    from .github_api import HTTP_TIMEOUT, http_get
 
     # Check if file exists
     url = f"{config.GITHUB_API}/repos/{repo}/contents/{file_path}"
@@ -369,7 +369,7 @@ def create_or_update_file(
     req.add_header("Content-Type", "application/json")
 
     try:
-        with request.urlopen(req, data=json.dumps(payload).encode('utf-8')) as response:
+        with request.urlopen(req, data=json.dumps(payload).encode('utf-8'), timeout=HTTP_TIMEOUT) as response:
             if response.status in (200, 201):
                 return "written"
             else:
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 import discord
 
-from app import config
+from app import config, store
 from app.bot_client import build_bot
 from app.commands import setup_commands
 
@@ -10,6 +10,8 @@ def main():
     if not config.DISCORD_TOKEN:
         raise SystemExit("DISCORD_BOT_TOKEN が未設定です")
 
+    store.load_history()
+    store.refresh_remote_repos()
     bot = build_bot()
     setup_commands(bot)
     bot.run(config.DISCORD_TOKEN)
@@ -1,11 +1,22 @@
 """Command line tools for the Gemini Actions Lab."""
 
-from .secrets import SecretSyncError, SecretSyncResult, sync_repository_secrets, sync_secrets_from_env_file
+from .secret_ledger import SecretLedger
+from .secrets import (
+    SecretSyncError,
+    SecretSyncResult,
+    sync_fleet_secrets,
+    sync_organization_secrets,
+    sync_repository_secrets,
+    sync_secrets_from_env_file,
+)
 
 __all__ = [
     "__version__",
+    "SecretLedger",
     "SecretSyncError",
     "SecretSyncResult",
+    "sync_fleet_secrets",
+    "sync_organization_secrets",
     "sync_repository_secrets",
     "sync_secrets_from_env_file",
 ]
@@ -0,0 +1,59 @@
+"""Content-addressed on-disk cache for template repository archives."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, Callable
+
+from .disk_cache import BoundedDirectory, xdg_cache_dir
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+def default_cache_dir() -> Path:
+    """Return ``$XDG_CACHE_HOME/gal/archives`` (``~/.cache`` when unset)."""
+
+    return xdg_cache_dir("archives")
+
+
+@dataclass(slots=True)
+class ArchiveCache:
+    """Store zipballs under ``<root>/<owner>/<repo>/<sha>.zip``.
+
+    Archives are keyed by the resolved commit SHA, so an entry never goes stale. The
+    cache is bounded by ``max_bytes``; least recently used archives are evicted first.
+    """
+
+    root: Path = field(default_factory=default_cache_dir)
+    max_bytes: int = DEFAULT_MAX_BYTES
+    _files: BoundedDirectory = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._files = BoundedDirectory(self.root, self.max_bytes, "*/*/*.zip")
+
+    def path_for(self, owner: str, repo: str, sha: str) -> Path:
+        return self.root / owner.lower() / repo.lower() / f"{sha}.zip"
+
+    def get(self, owner: str, repo: str, sha: str) -> Path | None:
+        """Return the cached archive for ``sha`` or ``None`` on a miss."""
+
+        path = self.path_for(owner, repo, sha)
+        if not path.is_file():
+            return None
+        self._files.touch(path)
+        return path
+
+    def store(self, owner: str, repo: str, sha: str, write: Callable[[BinaryIO], object]) -> Path:
+        """Create the cache entry for ``sha`` by letting ``write`` fill a file handle.
+
+        The archive is written to a temporary file first and moved into place
+        atomically, so an interrupted download never leaves a truncated entry behind.
+        """
+
+        return self._files.write(self.path_for(owner, repo, sha), write)
+
+    def evict(self, keep: Path | None = None) -> None:
+        """Delete least recently used archives until the cache fits ``max_bytes``."""
+
+        self._files.evict(keep=keep)
@@ -0,0 +1,351 @@
+"""asyncio variant of :class:`~gemini_actions_lab_cli.github_api.GitHubClient`.
+
+Requires the optional ``httpx`` dependency (``pip install gemini-actions-lab-cli[async]``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+from .github_api import (
+    API_URL,
+    DEFAULT_POOL_SIZE,
+    PAGE_SIZE,
+    PUBLIC_KEY_CACHE,
+    REQUEST_TIMEOUT,
+    USER_AGENT,
+    GitHubError,
+    PublicKeyCache,
+    RateLimitScheduler,
+    SecretPublicKey,
+    encrypt_secret,
+)
+
+
+@dataclass(slots=True)
+class AsyncGitHubClient:
+    """GitHub REST client for asyncio code, mirroring :class:`GitHubClient`.
+
+    All requests share one pooled :class:`httpx.AsyncClient`, capped at ``pool_size``
+    connections, so fan-out with :func:`asyncio.gather` stays within a bounded number
+    of sockets. Retries, pacing and the public-key cache reuse the same
+    :class:`RateLimitScheduler` and :class:`PublicKeyCache` logic as the blocking
+    client. ``transport`` swaps the network layer (e.g. ``httpx.MockTransport``).
+    Use it with ``async with`` (or await :meth:`aclose`) to release the pool.
+    """
+
+    token: Optional[str] = None
+    api_url: str = API_URL
+    pool_size: int = DEFAULT_POOL_SIZE
+    public_keys: PublicKeyCache = field(default_factory=lambda: PUBLIC_KEY_CACHE, repr=False)
+    scheduler: RateLimitScheduler = field(default_factory=RateLimitScheduler, repr=False)
+    transport: Optional["httpx.AsyncBaseTransport"] = field(default=None, repr=False)
+    _client: Optional["httpx.AsyncClient"] = field(default=None, init=False, repr=False)
+    _key_locks: Dict[str, asyncio.Lock] = field(default_factory=dict, init=False, repr=False)
+
+    async def __aenter__(self) -> "AsyncGitHubClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its connection pool."""
+
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    def _headers(self) -> Dict[str, str]:
+        headers = {"Accept": "application/vnd.github+json", "User-Agent": USER_AGENT}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        return headers
+
+    @property
+    def client(self) -> "httpx.AsyncClient":
+        """Return the shared HTTP client, creating it on first use."""
+
+        if httpx is None:
+            raise ImportError(
+                "AsyncGitHubClient requires httpx. Install it with: pip install 'gemini-actions-lab-cli[async]'"
+            )
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers=self._headers(),
+                timeout=REQUEST_TIMEOUT,
+                limits=httpx.Limits(max_connections=self.pool_size, max_keepalive_connections=self.pool_size),
+                transport=self.transport,
+            )
+        return self._client
+
+    async def _sleep(self, delay: float) -> None:
+        if delay > 0:
+            self.scheduler.record_throttle(delay)
+            await asyncio.sleep(delay)
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> "httpx.Response":
+        attempt = 0
+        while True:
+            await self._sleep(self.scheduler.pacing_delay())
+            response = await self.client.request(method, url, **kwargs)
+            self.scheduler.update(response.headers)
+            if response.status_code < 400:
+                return response
+            delay = self.scheduler.retry_delay(attempt, response.status_code, response.headers, response.text)
+            if delay is None:
+                raise GitHubError(
+                    f"GitHub API error {response.status_code}: {response.text.strip()}",
+                    status=response.status_code,
+                )
+            await self._sleep(delay)
+            attempt += 1
+
+    async def _public_key(
+        self,
+        scope: str,
+        stale_key_id: Optional[str],
+        fetch: Callable[[], Awaitable[Mapping[str, str]]],
+    ) -> SecretPublicKey:
+        cached = self.public_keys.peek(scope, stale_key_id=stale_key_id)
+        if cached is not None:
+            return cached
+        # スコープごとに 1 回だけ取得し、同時に来た呼び出しはその結果を待つ 🎯
+        async with self._key_locks.setdefault(scope, asyncio.Lock()):
+            cached = self.public_keys.peek(scope, stale_key_id=stale_key_id)
+            if cached is not None:
+                return cached
+            return self.public_keys.put(scope, await fetch(), stale_key_id=stale_key_id)
+
+    async def get_actions_public_key(self, owner: str, repo: str) -> Mapping[str, str]:
+        url = f"{self.api_url}/repos/{owner}/{repo}/actions/secrets/public-key"
+        data = (await self._request("GET", url)).json()
+        if not {"key", "key_id"} <= data.keys():
+            raise GitHubError("Unexpected response payload when fetching repository key")
+        return {"key": data["key"], "key_id": data["key_id"]}
+
+    async def get_secret_public_key(
+        self, owner: str, repo: str, *, stale_key_id: Optional[str] = None
+    ) -> SecretPublicKey:
+        """Return the repository public key from :attr:`public_keys`, fetching it on a miss."""
+
+        scope = f"{self.api_url}/repos/{owner}/{repo}".lower()
+        return await self._public_key(scope, stale_key_id, lambda: self.get_actions_public_key(owner, repo))
+
+    async def put_actions_secret(
+        self,
+        owner: str,
+        repo: str,
+        secret_name: str,
+        encrypted_value: str,
+        key_id: str,
+    ) -> int:
+        url = f"{self.api_url}/repos/{owner}/{repo}/actions/secrets/{secret_name}"
+        payload = {"encrypted_value": encrypted_value, "key_id": key_id}
+        return (await self._request("PUT", url, json=payload)).status_code
+
+    async def put_actions_secrets(self, owner: str, repo: str, values: Mapping[str, str]) -> Dict[str, int]:
+        """Encrypt and upload every secret in ``values`` concurrently.
+
+        Uploads are fanned out with :func:`asyncio.gather`; the connection pool bounds
+        how many are in flight. A 422 means the cached key was rotated, so that secret
+        is re-encrypted once with a freshly fetched key.
+        """
+
+        public_key = await self.get_secret_public_key(owner, repo)
+
+        async def put(name: str, value: str) -> int:
+            key = public_key
+            try:
+                return await self.put_actions_secret(owner, repo, name, encrypt_secret(key, value), key.key_id)
+            except GitHubError as exc:
+                if exc.status != 422:
+                    raise
+                rejected = exc
+            refreshed = await self.get_secret_public_key(owner, repo, stale_key_id=key.key_id)
+            if refreshed.key_id == key.key_id:
+                # 鍵が変わっていなければ 422 は鍵以外の理由なので再送しない
+                raise rejected
+            return await self.put_actions_secret(
+                owner, repo, name, encrypt_secret(refreshed, value), refreshed.key_id
+            )
+
+        statuses = await asyncio.gather(*(put(name, value) for name, value in values.items()))
+        return dict(zip(values, statuses))
+
+    async def get_org_actions_public_key(self, org: str) -> Mapping[str, str]:
+        url = f"{self.api_url}/orgs/{org}/actions/secrets/public-key"
+        data = (await self._request("GET", url)).json()
+        if not {"key", "key_id"} <= data.keys():
+            raise GitHubError("Unexpected response payload when fetching organization key")
+        return {"key": data["key"], "key_id": data["key_id"]}
+
+    async def get_org_secret_public_key(self, org: str, *, stale_key_id: Optional[str] = None) -> SecretPublicKey:
+        """Return the organization public key from :attr:`public_keys`, fetching it on a miss."""
+
+        scope = f"{self.api_url}/orgs/{org}".lower()
+        return await self._public_key(scope, stale_key_id, lambda: self.get_org_actions_public_key(org))
+
+    async def put_org_actions_secret(
+        self,
+        org: str,
+        secret_name: str,
+        encrypted_value: str,
+        key_id: str,
+        *,
+        visibility: str = "selected",
+        selected_repository_ids: Optional[List[int]] = None,
+    ) -> int:
+        url = f"{self.api_url}/orgs/{org}/actions/secrets/{secret_name}"
+        payload: Dict[str, Any] = {
+            "encrypted_value": encrypted_value,
+            "key_id": key_id,
+            "visibility": visibility,
+        }
+        if visibility == "selected":
+            payload["selected_repository_ids"] = list(selected_repository_ids or [])
+        return (await self._request("PUT", url, json=payload)).status_code
+
+    async def set_org_secret_repositories(self, org: str, secret_name: str, repository_ids: List[int]) -> None:
+        url = f"{self.api_url}/orgs/{org}/actions/secrets/{secret_name}/repositories"
+        await self._request("PUT", url, json={"selected_repository_ids": list(repository_ids)})
+
+    async def resolve_commit_sha(self, owner: str, repo: str, ref: Optional[str] = None) -> str:
+        url = f"{self.api_url}/repos/{owner}/{repo}/commits/{ref or 'HEAD'}"
+        response = await self._request("GET", url, headers={"Accept": "application/vnd.github.sha"})
+        sha = response.text.strip()
+        if len(sha) != 40:
+            raise GitHubError(f"Unable to resolve {owner}/{repo}@{ref or 'HEAD'} to a commit")
+        return sha
+
+    async def get_repository(self, owner: str, repo: str) -> Mapping[str, Any]:
+        url = f"{self.api_url}/repos/{owner}/{repo}"
+        return (await self._request("GET", url)).json()
+
+    async def list_repositories(self, owner: str) -> List[Mapping[str, Any]]:
+        """Return every repository of ``owner`` (organisation first, then user).
+
+        Private repositories of a user account are only included when ``owner`` is
+        the authenticated user.
+        """
+
+        try:
+            return await self._paginate(f"{self.api_url}/orgs/{owner}/repos", {"type": "all"})
+        except GitHubError as exc:
+            if exc.status != 404:
+                raise
+        if self.token:
+            try:
+                login = (await self._request("GET", f"{self.api_url}/user")).json().get("login") or ""
+            except GitHubError:
+                login = ""
+            if login.lower() == owner.lower():
+                return await self._paginate(f"{self.api_url}/user/repos", {"affiliation": "owner"})
+        return await self._paginate(f"{self.api_url}/users/{owner}/repos", {"type": "owner"})
+
+    async def _paginate(self, url: str, params: Mapping[str, Any]) -> List[Mapping[str, Any]]:
+        items: List[Mapping[str, Any]] = []
+        page = 1
+        while True:
+            response = await self._request("GET", url, params={**params, "per_page": PAGE_SIZE, "page": page})
+            batch = response.json()
+            items.extend(batch)
+            if len(batch) < PAGE_SIZE:
+                return items
+            page += 1
+
+    async def get_default_branch(self, owner: str, repo: str) -> str:
+        repo_info = await self.get_repository(owner, repo)
+        default_branch = repo_info.get("default_branch")
+        if not default_branch:
+            raise GitHubError("Unable to determine the default branch for the repository")
+        return default_branch
+
+    async def get_ref(self, owner: str, repo: str, ref: str) -> Mapping[str, Any]:
+        url = f"{self.api_url}/repos/{owner}/{repo}/git/ref/{ref}"
+        return (await self._request("GET", url)).json()
+
+    async def get_git_commit(self, owner: str, repo: str, sha: str) -> Mapping[str, Any]:
+        url = f"{self.api_url}/repos/{owner}/{repo}/git/commits/{sha}"
+        return (await self._request("GET", url)).json()
+
+    async def get_tree(self, owner: str, repo: str, sha: str, recursive: bool = False) -> Mapping[str, Any]:
+        url = f"{self.api_url}/repos/{owner}/{repo}/git/trees/{sha}"
+        params = {"recursive": "1"} if recursive else None
+        return (await self._request("GET", url, params=params)).json()
+
+    async def get_blob(self, owner: str, repo: str, sha: str) -> bytes:
+        url = f"{self.api_url}/repos/{owner}/{repo}/git/blobs/{sha}"
+        return (await self._request("GET", url, headers={"Accept": "application/vnd.github.raw"})).content
+
+    async def create_blob(self, owner: str, repo: str, content: bytes) -> str:
+        url = f"{self.api_url}/repos/{owner}/{repo}/git/blobs"
+        payload = {
+            "content": base64.b64encode(content).decode("utf-8"),
+            "encoding": "base64",
+        }
+        return (await self._request("POST", url, json=payload)).json()["sha"]
+
+    async def create_tree(
+        self,
+        owner: str,
+        repo: str,
+        tree: List[Mapping[str, Any]],
+        base_tree: Optional[str] = None,
+    ) -> Mapping[str, Any]:
+        url = f"{self.api_url}/repos/{owner}/{repo}/git/trees"
+        payload: Dict[str, Any] = {"tree": tree}
+        if base_tree:
+            payload["base_tree"] = base_tree
+        return (await self._request("POST", url, json=payload)).json()
+
+    async def create_commit(
+        self,
+        owner: str,
+        repo: str,
+        message: str,
+        tree_sha: str,
+        parents: List[str],
+    ) -> Mapping[str, Any]:
+        url = f"{self.api_url}/repos/{owner}/{repo}/git/commits"
+        payload = {"message": message, "tree": tree_sha, "parents": parents}
+        return (await self._request("POST", url, json=payload)).json()
+
+    async def update_ref(
+        self,
+        owner: str,
+        repo: str,
+        branch: str,
+        sha: str,
+        *,
+        force: bool = False,
+    ) -> None:
+        url = f"{self.api_url}/repos/{owner}/{repo}/git/refs/heads/{branch}"
+        await self._request("PATCH", url, json={"sha": sha, "force": force})
+
+    async def configure_pages_actions(self, owner: str, repo: str) -> None:
+        url = f"{self.api_url}/repos/{owner}/{repo}/pages"
+        payload = {"build_type": "workflow"}
+        try:
+            await self._request("PUT", url, json=payload)
+        except GitHubError as exc:
+            if exc.status == 404:
+                await self._request("POST", url, json=payload)
+            else:
+                raise
+
+    async def get_pages_info(self, owner: str, repo: str) -> Mapping[str, Any]:
+        url = f"{self.api_url}/repos/{owner}/{repo}/pages"
+        return (await self._request("GET", url)).json()
+
+    async def update_repository(self, owner: str, repo: str, **fields: Any) -> Mapping[str, Any]:
+        url = f"{self.api_url}/repos/{owner}/{repo}"
+        return (await self._request("PATCH", url, json=fields)).json()
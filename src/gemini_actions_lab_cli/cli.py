@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+import fnmatch
 import itertools
 import os
 import re
@@ -10,22 +11,59 @@ import shutil
 import sys
 import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, closing, contextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable
+from typing import Any, Dict, Iterable, Iterator, Mapping
+
+import requests
 
 try:  # Optional dependency for banner rendering
     import pyfiglet  # type: ignore
 except ImportError:  # pragma: no cover - falls back to plain text banner
     pyfiglet = None
 
+from .archive_cache import ArchiveCache
 from .env_loader import apply_env_file, load_env_file
-from .github_api import GitHubClient, GitHubError, encrypt_secret, parse_repo
-from .secrets import SecretSyncResult, sync_secrets_from_env_file, sync_repository_secrets
-from .workflows import WorkflowSyncError, extract_github_directory
+from .github_api import (
+    DEFAULT_POOL_SIZE,
+    BranchHead,
+    GitHubClient,
+    GitHubError,
+    encrypt_secret,
+    git_blob_sha,
+    parse_repo,
+)
+from .http_cache import HttpCache
+from .manifest import SyncManifest, selection_key
+from .secret_ledger import SecretLedger
+from .secrets import (
+    DEFAULT_SECRET_CONCURRENCY,
+    ORG_SECRET_VISIBILITIES,
+    SecretSyncResult,
+    sync_fleet_secrets,
+    sync_organization_secrets,
+    sync_secrets_from_env_file,
+    sync_repository_secrets,
+)
+from .workflows import (
+    ArchiveSource,
+    ExtractionResult,
+    TruncatedTreeError,
+    WorkflowSyncError,
+    extract_github_directory,
+    fetch_github_tree_archive,
+    iter_github_files,
+)
 from .workflow_presets import get_preset_workflows, list_presets
 
 DEFAULT_TEMPLATE_REPO = "Sunwood-ai-labsII/gemini-actions-lab"
 DEFAULT_SECRETS_FILE = ".secrets.env"
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_FLEET_CONCURRENCY = 4
+DEFAULT_INLINE_MAX_BYTES = 64 * 1024
+ARCHIVE_SPOOL_MAX_BYTES = 8 * 1024 * 1024
 
 _INTRO_SHOWN = False
 DEFAULT_BANNER_TEXT = "Gemini Actions Lab CLI"
@@ -56,7 +94,8 @@ def _render_intro_animation() -> None:
 class ProgressReporter:
     RESET = "\033[0m"
 
-    def __init__(self) -> None:
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
         self._spinner = itertools.cycle([
             "\033[95m◆\033[0m",
             "\033[94m◇\033[0m",
@@ -70,6 +109,8 @@ class ProgressReporter:
         return len(re.sub(r"\x1b\[[0-9;]*m", "", text))
 
     def _panel(self, header: str, body: list[str], accent: str) -> None:
+        if not self.enabled:
+            return
         visible_lengths = [self._visible_len(header) + 2] + [
             self._visible_len(line) + 2 for line in body
         ]
@@ -104,6 +145,9 @@ class ProgressReporter:
     def info(self, message: str) -> None:
         self._buffer.append((f"… {message}", None))
 
+    def failure(self, message: str) -> None:
+        self._buffer.append((f"✖ {message}", None))
+
     def list_panel(self, title: str, items: list[str]) -> None:
         body = [f"• {item}" for item in items] if items else ["(none)"]
         header = f"📂 {title}"
@@ -138,19 +182,146 @@ def _require_token(explicit_token: str | None) -> str:
     return token
 
 
+def _http_cache(args: argparse.Namespace) -> HttpCache | None:
+    cache_dir = getattr(args, "http_cache_dir", None)
+    if cache_dir:
+        return HttpCache(Path(cache_dir).expanduser())
+    return HttpCache() if getattr(args, "http_cache", False) else None
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be a positive integer")
+    return number
+
+
 def sync_secrets(args: argparse.Namespace) -> int:
     token = _require_token(args.token)
+    ledger = None
+    if args.skip_unchanged or args.ledger_file:
+        ledger = SecretLedger.load(Path(args.ledger_file) if args.ledger_file else None)
+    if args.org:
+        return _sync_org_secrets(args, token, ledger)
+    if not (args.repo or args.repos_file or args.repo_pattern):
+        raise SystemExit("One of --repo, --repos-file, --repo-pattern or --org is required.")
+    if args.repo:
+        try:
+            result = sync_secrets_from_env_file(
+                args.repo,
+                [Path(args.env_file)],
+                token=token,
+                api_url=args.api_url,
+                max_concurrency=args.max_concurrency,
+                ledger=ledger,
+            )
+        except FileNotFoundError as exc:
+            raise SystemExit(str(exc)) from exc
+
+        return _print_secret_sync_result(result, args.repo)
+
     try:
-        result = sync_secrets_from_env_file(
-            args.repo,
-            [Path(args.env_file)],
+        values = load_env_file(Path(args.env_file), missing_ok=False)
+    except FileNotFoundError as exc:
+        raise SystemExit(str(exc)) from exc
+
+    pool_size = max(DEFAULT_POOL_SIZE, args.max_concurrency)
+    with closing(GitHubClient(token=token, api_url=args.api_url, pool_size=pool_size)) as client:
+        repos = _secret_target_repos(args, client)
+        if not repos:
+            print("ℹ No repositories matched")
+            return 0
+        results = sync_fleet_secrets(
+            repos,
+            values,
             token=token,
-            api_url=args.api_url,
+            max_concurrency=args.max_concurrency,
+            client=client,
+            ledger=ledger,
         )
+    return _print_fleet_secret_results(results)
+
+
+def _sync_org_secrets(args: argparse.Namespace, token: str, ledger: SecretLedger | None) -> int:
+    targeted = bool(args.repo or args.repos_file or args.repo_pattern)
+    if args.visibility == "selected" and not targeted:
+        raise SystemExit("--org with --visibility selected needs --repo, --repos-file or --repo-pattern.")
+    if args.visibility != "selected" and targeted:
+        raise SystemExit(
+            f"--visibility {args.visibility} exposes the secrets to every repository;"
+            " drop the repository options."
+        )
+    try:
+        values = load_env_file(Path(args.env_file), missing_ok=False)
     except FileNotFoundError as exc:
         raise SystemExit(str(exc)) from exc
 
-    return _print_secret_sync_result(result, args.repo)
+    pool_size = max(DEFAULT_POOL_SIZE, args.max_concurrency)
+    with closing(GitHubClient(token=token, api_url=args.api_url, pool_size=pool_size)) as client:
+        repos = _secret_target_repos(args, client) if targeted else []
+        if targeted:
+            print(f"🎯 Exposing organization secrets to {len(repos)} repositories")
+        result = sync_organization_secrets(
+            args.org,
+            values,
+            token=token,
+            repositories=repos,
+            visibility=args.visibility,
+            max_concurrency=args.max_concurrency,
+            client=client,
+            ledger=ledger,
+        )
+    return _print_secret_sync_result(result, f"organization {args.org}")
+
+
+def _secret_target_repos(args: argparse.Namespace, client: GitHubClient) -> list[str]:
+    if args.repo:
+        return [args.repo]
+    if args.repos_file:
+        return _read_repos_file(Path(args.repos_file))
+    return _match_repositories(client, args.repo_pattern)
+
+
+def _read_repos_file(path: Path) -> list[str]:
+    """Read ``owner/name`` entries from ``path``, ignoring blank lines and ``#`` comments."""
+
+    repos = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        entry = line.split("#", 1)[0].strip()
+        if entry:
+            parse_repo(entry)
+            repos.append(entry)
+    return repos
+
+
+def _match_repositories(client: GitHubClient, pattern: str) -> list[str]:
+    """Expand an ``owner/glob`` pattern into the owner's non-archived repositories."""
+
+    owner, name_pattern = parse_repo(pattern)
+    return sorted(
+        repo["full_name"]
+        for repo in client.list_repositories(owner)
+        if not repo.get("archived") and fnmatch.fnmatchcase(repo["name"], name_pattern)
+    )
+
+
+def _print_fleet_secret_results(results: Mapping[str, SecretSyncResult]) -> int:
+    exit_code = 0
+    for repo, result in results.items():
+        print(f"\n📦 {repo}")
+        exit_code |= _print_secret_sync_result(result, repo)
+
+    created = sum(len(result.created) for result in results.values())
+    updated = sum(len(result.updated) for result in results.values())
+    skipped = sum(len(result.skipped) for result in results.values())
+    failed_repos = [repo for repo, result in results.items() if result.failed]
+    print(
+        f"\n📊 Fleet summary: {len(results)} repositories, {created} created, {updated} updated,"
+        f" {skipped} skipped, {len(failed_repos)} with failures"
+    )
+    for repo in failed_repos:
+        print(f"❌ {repo}: {len(results[repo].failed)} secret(s) failed")
+    return exit_code
 
 
 def _print_secret_sync_result(result: SecretSyncResult, repo: str) -> int:
@@ -162,18 +333,174 @@ def _print_secret_sync_result(result: SecretSyncResult, repo: str) -> int:
     if result.updated:
         for name in result.updated:
             print(f"✅ Updated secret {name}")
+    if result.skipped:
+        print(f"⏭ Skipped {len(result.skipped)} unchanged secret(s)")
     if result.failed:
         for err in result.failed:
             detail = f"{err.status}: {err.message}" if err.status else err.message
             print(f"❌ Failed secret {err.name} → {detail}")
-    print(f"🎉 Applied {result.total - len(result.failed)} secrets to {repo}")
+    print(f"🎉 Applied {len(result.created) + len(result.updated)} secrets to {repo}")
     return 0 if not result.failed else 1
 
 
+def _upload_blobs(
+    client: GitHubClient,
+    owner: str,
+    repo: str,
+    payloads: list[dict[str, Any]],
+    reporter: ProgressReporter,
+    *,
+    max_concurrency: int = 1,
+) -> list[str | None]:
+    """Create a blob for every payload using at most ``max_concurrency`` workers.
+
+    The returned SHAs line up with ``payloads`` regardless of completion order. Failed
+    uploads are reported through ``reporter`` and yield ``None`` in their slot.
+    """
+
+    workers = max(1, min(max_concurrency, len(payloads)))
+    blob_shas: list[str | None] = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(client.create_blob, owner, repo, payload["content"])
+            for payload in payloads
+        ]
+        for payload, future in zip(payloads, futures):
+            try:
+                blob_shas.append(future.result())
+            except GitHubError as exc:
+                reporter.failure(f"Failed to upload {payload['path']}: {exc}")
+                blob_shas.append(None)
+    return blob_shas
+
+
+def _inline_text(content: bytes, max_bytes: int) -> str | None:
+    """Return ``content`` decoded as text when it may be sent inline in a tree entry."""
+
+    if len(content) > max_bytes or b"\0" in content:
+        return None
+    try:
+        return content.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+
+
+def _prepare_tree_entries(
+    client: GitHubClient,
+    owner: str,
+    repo: str,
+    payloads: list[dict[str, Any]],
+    reporter: ProgressReporter,
+    *,
+    max_concurrency: int = 1,
+    inline_max_bytes: int = 0,
+) -> list[dict[str, Any]] | None:
+    """Build tree entries for ``payloads`` in order.
+
+    Text files up to ``inline_max_bytes`` are embedded as ``content`` so they travel with
+    the ``create_tree`` request; binary or larger files are uploaded as blobs first.
+    Returns ``None`` when any blob upload failed.
+    """
+
+    inline_texts = [_inline_text(payload["content"], inline_max_bytes) for payload in payloads]
+    inline_count = sum(text is not None for text in inline_texts)
+    if inline_count:
+        reporter.info(f"Sending {inline_count} small text file(s) inline with the tree")
+    blob_payloads = [payload for payload, text in zip(payloads, inline_texts) if text is None]
+    blob_shas = iter(
+        _upload_blobs(client, owner, repo, blob_payloads, reporter, max_concurrency=max_concurrency)
+    )
+
+    entries: list[dict[str, Any]] = []
+    failed = False
+    for payload, text in zip(payloads, inline_texts):
+        entry: dict[str, Any] = {"path": payload["path"], "mode": payload["mode"], "type": "blob"}
+        if text is not None:
+            entry["content"] = text
+        else:
+            entry["sha"] = next(blob_shas)
+            failed = failed or entry["sha"] is None
+        entries.append(entry)
+    return None if failed else entries
+
+
+@contextmanager
+def _template_archive(
+    client: GitHubClient,
+    owner: str,
+    repo: str,
+    commit_sha: str,
+    reporter: ProgressReporter,
+    cache: ArchiveCache | None,
+) -> Iterator[ArchiveSource]:
+    """Yield the zipball of ``commit_sha`` without holding it in memory.
+
+    With a cache the archive is streamed into (or reused from) the cache entry for the
+    commit. Without one it is streamed into a spooled temporary file that
+    rolls over to disk once it grows beyond ``ARCHIVE_SPOOL_MAX_BYTES``.
+    """
+
+    if cache is None:
+        with tempfile.SpooledTemporaryFile(max_size=ARCHIVE_SPOOL_MAX_BYTES) as spool:
+            client.stream_repository_archive(owner, repo, spool, ref=commit_sha)
+            spool.seek(0)
+            reporter.success("Archive download completed")
+            yield spool
+        return
+
+    cached = cache.get(owner, repo, commit_sha)
+    if cached is not None:
+        reporter.success(f"Using cached archive for {commit_sha[:7]}")
+        yield cached
+        return
+
+    path = cache.store(
+        owner,
+        repo,
+        commit_sha,
+        lambda handle: client.stream_repository_archive(owner, repo, handle, ref=commit_sha),
+    )
+    reporter.success(f"Archive download completed ({commit_sha[:7]} cached)")
+    yield path
+
+
+@dataclass(slots=True)
+class RemoteSyncOutcome:
+    """Result of pushing the template to one repository."""
+
+    repo: str
+    status: str  # "changed", "current" or "failed"
+    detail: str = ""
+
+
+def _template_payloads(
+    archive: ArchiveSource,
+    *,
+    extra_files: list[str] | None,
+    workflow_files: list[str] | None,
+    prompt_files: list[str] | None,
+    agent_files: list[str] | None,
+    use_remote: bool,
+) -> list[dict[str, Any]]:
+    """Read the template and return one ``{path, mode, content, sha}`` dict per file."""
+
+    return [
+        {"path": path, "mode": mode, "content": content, "sha": git_blob_sha(content)}
+        for path, mode, content in iter_github_files(
+            archive,
+            extra_files,
+            workflow_files=workflow_files,
+            prompt_files=prompt_files,
+            agent_files=agent_files,
+            use_remote=use_remote,
+        )
+    ]
+
+
 def _sync_workflows_remote(
     client: GitHubClient,
     template_repo: str,
-    archive_bytes: bytes,
+    archive: ArchiveSource,
     target_repo: str,
     branch: str | None,
     *,
@@ -188,74 +515,195 @@ def _sync_workflows_remote(
     prompt_files: list[str] | None = None,
     agent_files: list[str] | None = None,
     use_remote: bool = False,
+    max_concurrency: int = 1,
+    inline_max_bytes: int = 0,
 ) -> int:
-    owner_template, repo_template = parse_repo(template_repo)
-    owner_target, repo_target = parse_repo(target_repo)
-
     reporter = ProgressReporter()
-    reporter.stage(
-        "Extract template archive", f"{owner_template}/{repo_template} → {owner_target}/{repo_target}"
+    reporter.stage("Extract template archive", f"{template_repo} → {target_repo}")
+    payloads = _template_payloads(
+        archive,
+        extra_files=extra_files,
+        workflow_files=workflow_files,
+        prompt_files=prompt_files,
+        agent_files=agent_files,
+        use_remote=use_remote,
     )
+    if not payloads:
+        print("❌ Template archive does not contain a .github directory", file=sys.stderr)
+        return 1
+    reporter.success("Template extraction completed")
 
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        tmp_path = Path(tmp_dir)
-        extraction = extract_github_directory(
-            archive_bytes,
-            tmp_path,
-            clean=True,
-            extra_files=extra_files,
-            workflow_files=workflow_files,
-            prompt_files=prompt_files,
-            agent_files=agent_files,
-            use_remote=use_remote,
-        )
-        written = extraction.written
-        if not written:
-            print("❌ Template archive does not contain a .github directory", file=sys.stderr)
-            return 1
-        payloads = []
-        new_paths: set[str] = set()
-        new_dirs: set[str] = set()
-        for file_path in written:
-            relative = file_path.relative_to(tmp_path)
-            full_path = relative.as_posix()
-            mode = "100755" if os.access(file_path, os.X_OK) else "100644"
-            payloads.append(
-                {
-                    "path": full_path,
-                    "mode": mode,
-                    "content": file_path.read_bytes(),
-                }
+    outcome = _push_template(
+        client,
+        template_repo,
+        payloads,
+        target_repo,
+        branch,
+        reporter,
+        clean=clean,
+        commit_message=commit_message,
+        force=force,
+        enable_pages=enable_pages,
+        extra_files=extra_files,
+        overwrite_extras=overwrite_extras,
+        overwrite_github=overwrite_github,
+        max_concurrency=max_concurrency,
+        inline_max_bytes=inline_max_bytes,
+    )
+    if outcome.status == "failed":
+        print(f"❌ {outcome.detail}", file=sys.stderr)
+        return 1
+    if outcome.status == "current":
+        print("✅ No updates required; remote repository already matches the template")
+    return 0
+
+
+def _sync_workflows_fleet(
+    client: GitHubClient,
+    template_repo: str,
+    archive: ArchiveSource,
+    target_repos: list[str],
+    branch: str | None,
+    *,
+    fleet_concurrency: int,
+    extra_files: list[str] | None,
+    workflow_files: list[str] | None,
+    prompt_files: list[str] | None,
+    agent_files: list[str] | None,
+    use_remote: bool,
+    **push_options: Any,
+) -> int:
+    """Push one extracted template to many repositories, ``fleet_concurrency`` at a time.
+
+    The template is extracted and hashed once and the branch tips of all targets are
+    resolved with batched GraphQL queries; every repository then only costs its tree
+    listing and whatever uploads its own differences require.
+    """
+
+    payloads = _template_payloads(
+        archive,
+        extra_files=extra_files,
+        workflow_files=workflow_files,
+        prompt_files=prompt_files,
+        agent_files=agent_files,
+        use_remote=use_remote,
+    )
+    if not payloads:
+        print("❌ Template archive does not contain a .github directory", file=sys.stderr)
+        return 1
+
+    try:
+        heads = client.resolve_branch_heads(target_repos, branch)
+    except GitHubError:
+        # GraphQL が使えない場合はリポジトリごとの REST 呼び出しにフォールバック
+        heads = {}
+
+    def push(target_repo: str) -> RemoteSyncOutcome:
+        try:
+            return _push_template(
+                client,
+                template_repo,
+                payloads,
+                target_repo,
+                branch,
+                ProgressReporter(enabled=False),
+                extra_files=extra_files,
+                head=heads.get(target_repo),
+                **push_options,
             )
-            new_paths.add(full_path)
-            parent = Path(full_path)
-            for ancestor in parent.parents:
-                if ancestor == Path("."):
-                    continue
-                new_dirs.add(ancestor.as_posix())
+        except (GitHubError, ValueError, requests.RequestException) as exc:
+            # 接続エラーも 1 リポジトリの失敗として扱い、フリート全体は止めない
+            return RemoteSyncOutcome(target_repo, "failed", str(exc))
 
-    reporter.success("Template extraction completed")
+    with ThreadPoolExecutor(max_workers=max(1, min(fleet_concurrency, len(target_repos)))) as executor:
+        outcomes = list(executor.map(push, target_repos))
+
+    reporter = ProgressReporter()
+    for title, status in (("Changed", "changed"), ("Already current", "current"), ("Failed", "failed")):
+        matching = [outcome for outcome in outcomes if outcome.status == status]
+        if matching:
+            reporter.list_panel(
+                f"{title} ({len(matching)})",
+                [f"{outcome.repo}: {outcome.detail}" if outcome.detail else outcome.repo for outcome in matching],
+            )
+    failed = sum(outcome.status == "failed" for outcome in outcomes)
+    reporter.success(
+        f"Synchronized {len(outcomes) - failed}/{len(outcomes)} repositories from {template_repo}"
+    )
+    budget = client.scheduler.metrics()
+    if budget["remaining"] is not None:
+        reporter.info(
+            f"API budget: {budget['remaining']}/{budget['limit']} requests left,"
+            f" {budget['retries']} retries, {budget['throttled_seconds']}s throttled"
+        )
+    reporter.flush("Fleet summary")
+    return 1 if failed else 0
+
+
+def _push_template(
+    client: GitHubClient,
+    template_repo: str,
+    payloads: list[dict[str, Any]],
+    target_repo: str,
+    branch: str | None,
+    reporter: ProgressReporter,
+    *,
+    clean: bool,
+    commit_message: str | None,
+    force: bool,
+    enable_pages: bool,
+    extra_files: list[str] | None,
+    overwrite_extras: bool,
+    overwrite_github: bool,
+    max_concurrency: int = 1,
+    inline_max_bytes: int = 0,
+    head: BranchHead | None = None,
+) -> RemoteSyncOutcome:
+    """Commit the template ``payloads`` to ``target_repo``; ``payloads`` is not modified.
+
+    ``head`` is the already resolved branch tip; without it the branch is inspected
+    through the REST API.
+    """
+
+    owner_template, repo_template = parse_repo(template_repo)
+    owner_target, repo_target = parse_repo(target_repo)
+    new_paths = {payload["path"] for payload in payloads}
+    new_dirs = {
+        ancestor.as_posix()
+        for path in new_paths
+        for ancestor in Path(path).parents
+        if ancestor != Path(".")
+    }
 
     reporter.stage("Inspect target branch", target_repo)
 
-    target_branch = branch or client.get_default_branch(owner_target, repo_target)
+    if head is None:
+        target_branch = branch or client.get_default_branch(owner_target, repo_target)
+    else:
+        target_branch = head.branch
     commit_message = commit_message or f"✨ Sync .github directory from {owner_template}/{repo_template}"
 
     reporter.info(f"Fetched {owner_target}/{repo_target}@{target_branch}")
-    ref = client.get_ref(owner_target, repo_target, f"heads/{target_branch}")
-    base_commit_sha = ref["object"]["sha"]
-    base_commit = client.get_git_commit(owner_target, repo_target, base_commit_sha)
-    base_tree_sha = base_commit["tree"]["sha"]
+    if head is None:
+        ref = client.get_ref(owner_target, repo_target, f"heads/{target_branch}")
+        base_commit_sha = ref["object"]["sha"]
+        base_commit = client.get_git_commit(owner_target, repo_target, base_commit_sha)
+        base_tree_sha = base_commit["tree"]["sha"]
+    else:
+        base_commit_sha, base_tree_sha = head.commit_sha, head.tree_sha
 
     tree_entries = []
 
-    existing_tree: dict[str, Any] | None = None
+    existing_tree = client.get_tree(owner_target, repo_target, base_tree_sha, recursive=True)
+    existing_blobs = {
+        item["path"]: item
+        for item in existing_tree.get("tree", [])
+        if item.get("type") == "blob" and item.get("path")
+    }
 
     if clean:
         reporter.stage("Clean existing .github contents", "--clean option active")
-        existing_tree = client.get_tree(owner_target, repo_target, base_tree_sha, recursive=True)
-        tree = existing_tree
-        for item in tree.get("tree", []):
+        for item in existing_tree.get("tree", []):
             path = item.get("path")
             if not path or not path.startswith(".github"):
                 continue
@@ -269,18 +717,7 @@ def _sync_workflows_remote(
             })
 
     skipped_existing: list[str] = []
-    existing_paths: set[str] | None = None
-
-    needs_existing_tree = (extra_files and not overwrite_extras) or not overwrite_github
-    if needs_existing_tree:
-        if existing_tree is None:
-            existing_tree = client.get_tree(owner_target, repo_target, base_tree_sha, recursive=True)
-        tree = existing_tree
-        existing_paths = {
-            item.get("path")
-            for item in tree.get("tree", [])
-            if item.get("type") == "blob" and item.get("path")
-        }
+    existing_paths = set(existing_blobs)
 
     if extra_files and not overwrite_extras and existing_paths:
         extra_set = {path.lstrip("/") for path in extra_files}
@@ -304,20 +741,42 @@ def _sync_workflows_remote(
             new_paths.difference_update(skipped)
             skipped_existing.extend(skipped)
 
+    # Files whose blob SHA already matches the branch never need to be uploaded
+    changed_payloads = []
+    unchanged_count = 0
     for payload in payloads:
-        blob_sha = client.create_blob(owner_target, repo_target, payload["content"])
-        tree_entries.append(
-            {
-                "path": payload["path"],
-                "mode": payload["mode"],
-                "type": "blob",
-                "sha": blob_sha,
-            }
-        )
+        existing = existing_blobs.get(payload["path"])
+        if existing is None or existing.get("sha") != payload["sha"]:
+            changed_payloads.append(payload)
+            continue
+        unchanged_count += 1
+        if existing.get("mode") != payload["mode"]:
+            # Same content with a different file mode reuses the existing blob
+            tree_entries.append(
+                {"path": payload["path"], "mode": payload["mode"], "type": "blob", "sha": existing["sha"]}
+            )
+    if unchanged_count:
+        reporter.info(f"Skipping {unchanged_count} file(s) whose content already matches the branch")
+    payloads = changed_payloads
 
-    if not tree_entries:
-        print("✅ No updates required; remote repository already matches the template")
-        return 0
+    if not payloads and not tree_entries:
+        reporter.success("Remote repository already matches the template")
+        reporter.flush("Sync steps")
+        return RemoteSyncOutcome(target_repo, "current")
+
+    new_entries = _prepare_tree_entries(
+        client,
+        owner_target,
+        repo_target,
+        payloads,
+        reporter,
+        max_concurrency=max_concurrency,
+        inline_max_bytes=inline_max_bytes,
+    )
+    if new_entries is None:
+        reporter.flush("Sync steps")
+        return RemoteSyncOutcome(target_repo, "failed", "Failed to upload one or more files; no commit was created")
+    tree_entries.extend(new_entries)
 
     dedup: Dict[tuple[str, str], dict[str, Any]] = {}
     for entry in tree_entries:
@@ -345,18 +804,26 @@ def _sync_workflows_remote(
         f"Applied {len(payloads)} updates to {owner_target}/{repo_target}@{target_branch} ({commit['sha'][:7]})"
     )
 
+    warnings: list[str] = []
+
+    def warn(message: str) -> None:
+        # フリート実行ではレポーターが無効なので、サマリーに載るよう結果へ戻す
+        warnings.append(message)
+        if reporter.enabled:
+            print(f"⚠️ {message}", file=sys.stderr)
+
     if enable_pages:
         reporter.stage("Switch GitHub Pages to GitHub Actions")
         try:
             client.configure_pages_actions(owner_target, repo_target)
         except GitHubError as exc:
-            print(f"⚠️ Failed to configure GitHub Pages: {exc}", file=sys.stderr)
+            warn(f"Failed to configure GitHub Pages: {exc}")
         else:
             reporter.success("Switched to GitHub Actions deployment")
             try:
                 pages_info = client.get_pages_info(owner_target, repo_target)
             except GitHubError as exc:
-                print(f"⚠️ Failed to retrieve GitHub Pages info: {exc}", file=sys.stderr)
+                warn(f"Failed to retrieve GitHub Pages info: {exc}")
             else:
                 html_url = pages_info.get("html_url")
                 if html_url:
@@ -364,18 +831,18 @@ def _sync_workflows_remote(
                     try:
                         client.update_repository(owner_target, repo_target, homepage=html_url)
                     except GitHubError as exc:
-                        print(f"⚠️ Failed to update website URL: {exc}", file=sys.stderr)
+                        warn(f"Failed to update website URL: {exc}")
                     else:
                         reporter.success("Updated repository website field")
 
     reporter.flush("Finishing touches")
-    return 0
+    detail = "; ".join([f"{target_branch}@{commit['sha'][:7]}", *warnings])
+    return RemoteSyncOutcome(target_repo, "changed", detail)
 
 
 def sync_agent(args: argparse.Namespace) -> int:
     """Sync AI agent guideline files (Claude.md, GEMINI.md, AGENT.md) to a GitHub repository."""
     token = _require_token(args.token)
-    client = GitHubClient(token=token, api_url=args.api_url)
     owner, repo = parse_repo(args.repo)
 
     reporter = ProgressReporter()
@@ -402,54 +869,104 @@ def sync_agent(args: argparse.Namespace) -> int:
     reporter.success(f"Found {len(files_to_sync)} agent guideline file(s) to sync")
     reporter.flush("File preparation")
 
-    # Get target branch
-    reporter.stage("Inspect target branch", args.repo)
-    target_branch = args.branch or client.get_default_branch(owner, repo)
-    commit_message = args.message or "🤖 Sync AI agent guideline files (Claude.md, GEMINI.md, AGENT.md)"
-
-    reporter.info(f"Target: {owner}/{repo}@{target_branch}")
-    ref = client.get_ref(owner, repo, f"heads/{target_branch}")
-    base_commit_sha = ref["object"]["sha"]
-    base_commit = client.get_git_commit(owner, repo, base_commit_sha)
-    base_tree_sha = base_commit["tree"]["sha"]
-
-    # Create blobs and tree entries for each agent file
-    reporter.stage("Upload agent guideline files", "Creating blobs")
-    tree_entries = []
+    with closing(GitHubClient(token=token, api_url=args.api_url, http_cache=_http_cache(args))) as client:
+        # Get target branch
+        reporter.stage("Inspect target branch", args.repo)
+        target_branch = args.branch or client.get_default_branch(owner, repo)
+        commit_message = args.message or "🤖 Sync AI agent guideline files (Claude.md, GEMINI.md, AGENT.md)"
+
+        reporter.info(f"Target: {owner}/{repo}@{target_branch}")
+        ref = client.get_ref(owner, repo, f"heads/{target_branch}")
+        base_commit_sha = ref["object"]["sha"]
+        base_commit = client.get_git_commit(owner, repo, base_commit_sha)
+        base_tree_sha = base_commit["tree"]["sha"]
+
+        # Skip files whose content already matches the branch
+        root_tree = client.get_tree(owner, repo, base_tree_sha)
+        existing_shas = {
+            item.get("path"): item.get("sha")
+            for item in root_tree.get("tree", [])
+            if item.get("type") == "blob"
+        }
+        changed_files = []
+        for file_name, file_path in files_to_sync:
+            content = file_path.read_bytes()
+            if existing_shas.get(file_name) == git_blob_sha(content):
+                reporter.info(f"Unchanged {file_name}")
+                continue
+            changed_files.append((file_name, content))
+
+        if not changed_files:
+            reporter.flush("Sync steps")
+            print("✅ No updates required; agent guideline files already match the branch")
+            return 0
+
+        # Create blobs and tree entries for each agent file
+        reporter.stage("Upload agent guideline files", "Creating blobs")
+        payloads = [
+            {"path": file_name, "mode": "100644", "content": content}
+            for file_name, content in changed_files
+        ]
+        tree_entries = _prepare_tree_entries(
+            client,
+            owner,
+            repo,
+            payloads,
+            reporter,
+            inline_max_bytes=getattr(args, "inline_max_bytes", 0),
+        )
+        if tree_entries is None:
+            reporter.flush("Sync steps")
+            print("❌ Failed to upload one or more files; no commit was created", file=sys.stderr)
+            return 1
 
-    for file_name, file_path in files_to_sync:
-        content = file_path.read_bytes()
-        blob_sha = client.create_blob(owner, repo, content)
-        tree_entries.append({
-            "path": file_name,
-            "mode": "100644",
-            "type": "blob",
-            "sha": blob_sha,
-        })
-        reporter.info(f"Created blob for {file_name}")
+        reporter.success("File contents prepared")
+
+        # Create new tree and commit
+        reporter.stage("Create commit", "Uploading new tree")
+        tree_sha = client.create_tree(owner, repo, tree_entries, base_tree=base_tree_sha)["sha"]
+        commit = client.create_commit(
+            owner,
+            repo,
+            commit_message,
+            tree_sha,
+            parents=[base_commit_sha],
+        )
+        client.update_ref(owner, repo, target_branch, commit["sha"], force=args.force)
 
-    reporter.success("All blobs created")
+        reporter.success("Commit created")
+        reporter.flush("Sync steps")
+        reporter.list_panel("Updated files", [file_name for file_name, _ in changed_files])
+        reporter.success(
+            f"Synced {len(changed_files)} agent guideline file(s) to {owner}/{repo}@{target_branch} ({commit['sha'][:7]})"
+        )
+        reporter.flush("Results")
+        return 0
 
-    # Create new tree and commit
-    reporter.stage("Create commit", "Uploading new tree")
-    tree_sha = client.create_tree(owner, repo, tree_entries, base_tree=base_tree_sha)["sha"]
-    commit = client.create_commit(
-        owner,
-        repo,
-        commit_message,
-        tree_sha,
-        parents=[base_commit_sha],
-    )
-    client.update_ref(owner, repo, target_branch, commit["sha"], force=args.force)
 
-    reporter.success("Commit created")
-    reporter.flush("Sync steps")
-    reporter.list_panel("Updated files", [file_name for file_name, _ in files_to_sync])
-    reporter.success(
-        f"Synced {len(files_to_sync)} agent guideline file(s) to {owner}/{repo}@{target_branch} ({commit['sha'][:7]})"
-    )
-    reporter.flush("Results")
-    return 0
+def _manifest_files(
+    previous: dict[str, str],
+    extraction: ExtractionResult,
+    destination: Path,
+    *,
+    full_selection: bool,
+) -> dict[str, str]:
+    """Merge the hashes of this extraction into those recorded by earlier syncs.
+
+    A sync of specific files only replaces the entries for the paths it handled, so
+    files synced by an earlier, wider selection keep their hashes and are still
+    recognised as pristine later. A full sync covers everything and starts over.
+    """
+
+    if full_selection:
+        return dict(extraction.file_hashes)
+    covered = {
+        path.relative_to(destination).as_posix()
+        for path in (*extraction.written, *extraction.unchanged, *extraction.skipped_existing)
+    }
+    files = {path: sha for path, sha in previous.items() if path not in covered}
+    files.update(extraction.file_hashes)
+    return files
 
 
 def sync_workflows(args: argparse.Namespace) -> int:
@@ -462,7 +979,6 @@ def sync_workflows(args: argparse.Namespace) -> int:
         return 0
     
     token = args.token or os.getenv("GITHUB_TOKEN")
-    client = GitHubClient(token=token, api_url=args.api_url)
     owner, repo = parse_repo(args.template_repo)
 
     reporter = ProgressReporter()
@@ -505,83 +1021,185 @@ def sync_workflows(args: argparse.Namespace) -> int:
         # 単一ワークフロー指定（下位互換性）
         workflow_files = [args.workflow]
     
-    reporter.stage("Fetch template archive", f"{owner}/{repo}")
-    archive = client.download_repository_archive(owner, repo, ref=args.ref)
-    reporter.success("Archive download completed")
-    reporter.flush("Preparation")
+    fleet_repos = args.repos or (_read_repos_file(Path(args.repos_file)) if args.repos_file else None)
+    # フリートモードでは接続プールをブロッキングにして API ホストへの同時接続数を抑える 🎯
+    pool_size = args.max_connections if fleet_repos else max(DEFAULT_POOL_SIZE, args.max_concurrency)
+    with ExitStack() as stack:
+        client = stack.enter_context(
+            closing(
+                GitHubClient(
+                    token=token,
+                    api_url=args.api_url,
+                    pool_size=pool_size,
+                    pool_block=bool(fleet_repos),
+                    http_cache=_http_cache(args),
+                )
+            )
+        )
+        extra_files = ["index.html"] if args.include_index else None
+        specific_files = bool(workflow_files or prompt_files or agent_files)
+        template_source = args.template_source
+        if template_source == "auto":
+            template_source = "tree" if specific_files else "archive"
 
-    extra_files = ["index.html"] if args.include_index else None
+        commit_sha = client.resolve_commit_sha(owner, repo, args.ref)
 
-    if args.repo:
-        reporter.stage("Start remote sync", args.repo)
-        reporter.flush("Remote sync kickoff")
-        return _sync_workflows_remote(
-            client,
-            args.template_repo,
+        destination = Path(args.destination).expanduser().resolve()
+        selection = selection_key(
+            extra_files,
+            workflow_files=workflow_files,
+            prompt_files=prompt_files,
+            agent_files=agent_files,
+            use_remote=use_remote,
+        )
+        manifest = None if args.repo or fleet_repos else SyncManifest.load(destination)
+        forced = args.clean or args.overwrite_github or args.overwrite_index
+        if manifest is not None and not forced and manifest.is_current(
+            f"{owner}/{repo}", commit_sha, selection, destination
+        ):
+            reporter.success(f"Local files already match template commit {commit_sha[:7]}; nothing to do")
+            reporter.flush("Results")
+            return 0
+
+        archive: ArchiveSource | None = None
+        if template_source == "tree":
+            reporter.stage("Fetch template files", f"{owner}/{repo} (.github tree only)")
+            try:
+                archive = fetch_github_tree_archive(
+                    client,
+                    owner,
+                    repo,
+                    commit_sha,
+                    extra_files,
+                    workflow_files=workflow_files,
+                    prompt_files=prompt_files,
+                    agent_files=agent_files,
+                    use_remote=use_remote,
+                    max_concurrency=args.max_concurrency,
+                )
+            except TruncatedTreeError as exc:
+                # ツリー一覧が切り詰められたらファイルを取りこぼさないよう zipball に切り替える
+                reporter.info(f"{exc}; falling back to the repository archive")
+            else:
+                reporter.success(f"Fetched template files from {commit_sha[:7]}")
+        if archive is None:
+            reporter.stage("Fetch template archive", f"{owner}/{repo}")
+            cache = None
+            if not args.no_cache:
+                cache = ArchiveCache(Path(args.cache_dir).expanduser()) if args.cache_dir else ArchiveCache()
+            archive = stack.enter_context(_template_archive(client, owner, repo, commit_sha, reporter, cache))
+        reporter.flush("Preparation")
+
+        if fleet_repos:
+            reporter.stage("Start fleet sync", f"{len(fleet_repos)} repositories")
+            reporter.flush("Remote sync kickoff")
+            return _sync_workflows_fleet(
+                client,
+                args.template_repo,
+                archive,
+                fleet_repos,
+                args.branch,
+                fleet_concurrency=args.fleet_concurrency,
+                extra_files=extra_files,
+                workflow_files=workflow_files,
+                prompt_files=prompt_files,
+                agent_files=agent_files,
+                use_remote=use_remote,
+                clean=args.clean,
+                commit_message=args.message,
+                force=args.force,
+                enable_pages=args.enable_pages_actions,
+                overwrite_extras=args.overwrite_index,
+                overwrite_github=args.overwrite_github,
+                max_concurrency=args.max_concurrency,
+                inline_max_bytes=args.inline_max_bytes,
+            )
+
+        if args.repo:
+            reporter.stage("Start remote sync", args.repo)
+            reporter.flush("Remote sync kickoff")
+            return _sync_workflows_remote(
+                client,
+                args.template_repo,
+                archive,
+                args.repo,
+                args.branch,
+                clean=args.clean,
+                commit_message=args.message,
+                force=args.force,
+                enable_pages=args.enable_pages_actions,
+                extra_files=extra_files,
+                overwrite_extras=args.overwrite_index,
+                overwrite_github=args.overwrite_github,
+                workflow_files=workflow_files,
+                prompt_files=prompt_files,
+                agent_files=agent_files,
+                use_remote=use_remote,
+                max_concurrency=args.max_concurrency,
+                inline_max_bytes=args.inline_max_bytes,
+            )
+
+        reporter.stage("Start local sync", str(destination))
+        index_path = destination / "index.html"
+        index_exists_before = index_path.exists()
+        extraction = extract_github_directory(
             archive,
-            args.repo,
-            args.branch,
+            destination,
             clean=args.clean,
-            commit_message=args.message,
-            force=args.force,
-            enable_pages=args.enable_pages_actions,
             extra_files=extra_files,
             overwrite_extras=args.overwrite_index,
-            overwrite_github=args.overwrite_github,
+            overwrite_existing=args.overwrite_github,
             workflow_files=workflow_files,
             prompt_files=prompt_files,
             agent_files=agent_files,
             use_remote=use_remote,
+            previous_hashes=manifest.files if manifest is not None and not args.clean else {},
         )
-
-    destination = Path(args.destination).expanduser().resolve()
-    reporter.stage("Start local sync", str(destination))
-    index_path = destination / "index.html"
-    index_exists_before = index_path.exists()
-    extraction = extract_github_directory(
-        archive,
-        destination,
-        clean=args.clean,
-        extra_files=extra_files,
-        overwrite_extras=args.overwrite_index,
-        overwrite_existing=args.overwrite_github,
-        workflow_files=workflow_files,
-        prompt_files=prompt_files,
-        agent_files=agent_files,
-        use_remote=use_remote,
-    )
-
-    if (
-        args.include_index
-        and not args.overwrite_index
-        and index_exists_before
-        and index_path not in extraction.written
-    ):
-        reporter.info("Preserved existing index.html without overwriting")
-
-    reporter.flush("Sync steps")
-    preserved_local = sorted(
-        path.relative_to(destination).as_posix() for path in extraction.skipped_existing
-    )
-    if preserved_local:
-        reporter.list_panel("Preserved files", preserved_local)
-    
-    # メッセージを条件分岐 🎯
-    if workflow_files:
-        reporter.list_panel(
-            f"Updated workflow{'s' if len(workflow_files) > 1 else ''}",
-            [path.relative_to(destination).as_posix() for path in extraction.written],
-        )
-        count = len(workflow_files)
-        reporter.success(f"{count} workflow{'s' if count > 1 else ''} synchronized from template")
-    else:
-        reporter.list_panel(
-            "Updated files",
-            [path.relative_to(destination).as_posix() for path in extraction.written],
+        SyncManifest(
+            template=f"{owner}/{repo}",
+            commit=commit_sha,
+            selection=selection,
+            files=_manifest_files(
+                manifest.files if manifest is not None and not args.clean else {},
+                extraction,
+                destination,
+                full_selection=not specific_files,
+            ),
+        ).save(destination)
+
+        if (
+            args.include_index
+            and not args.overwrite_index
+            and index_exists_before
+            and index_path not in extraction.written
+        ):
+            reporter.info("Preserved existing index.html without overwriting")
+
+        reporter.flush("Sync steps")
+        preserved_local = sorted(
+            path.relative_to(destination).as_posix() for path in extraction.skipped_existing
         )
-        reporter.success("Local .github directory synchronized with template")
-    reporter.flush("Results")
-    return 0
+        if preserved_local:
+            reporter.list_panel("Preserved files", preserved_local)
+        if extraction.unchanged:
+            reporter.info(f"{len(extraction.unchanged)} file(s) already up to date")
+
+        # メッセージを条件分岐 🎯
+        if workflow_files:
+            reporter.list_panel(
+                f"Updated workflow{'s' if len(workflow_files) > 1 else ''}",
+                [path.relative_to(destination).as_posix() for path in extraction.written],
+            )
+            count = len(workflow_files)
+            reporter.success(f"{count} workflow{'s' if count > 1 else ''} synchronized from template")
+        else:
+            reporter.list_panel(
+                "Updated files",
+                [path.relative_to(destination).as_posix() for path in extraction.written],
+            )
+            reporter.success("Local .github directory synchronized with template")
+        reporter.flush("Results")
+        return 0
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -594,13 +1212,47 @@ def build_parser() -> argparse.ArgumentParser:
         default="https://api.github.com",
         help="Base URL for the GitHub API (override for GitHub Enterprise).",
     )
+    parser.add_argument(
+        "--http-cache",
+        action="store_true",
+        help=(
+            "Cache GitHub API read responses on disk and revalidate them with ETags "
+            "(304 responses do not count against the rate limit)"
+        ),
+    )
+    parser.add_argument(
+        "--http-cache-dir",
+        help="Directory for the HTTP cache (implies --http-cache; defaults to $XDG_CACHE_HOME/gal/http)",
+    )
 
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     secrets_parser = subparsers.add_parser(
         "sync-secrets", help="Create or update repository secrets from a .env file"
     )
-    secrets_parser.add_argument("--repo", required=True, help="Target repository in owner/name format")
+    secrets_targets = secrets_parser.add_mutually_exclusive_group()
+    secrets_targets.add_argument("--repo", help="Target repository in owner/name format")
+    secrets_targets.add_argument(
+        "--repos-file",
+        help="File listing target repositories (one owner/name per line, # starts a comment)",
+    )
+    secrets_targets.add_argument(
+        "--repo-pattern",
+        help="Sync every non-archived repository of an owner matching a glob, e.g. 'my-org/service-*'",
+    )
+    secrets_parser.add_argument(
+        "--org",
+        help=(
+            "Write organization secrets instead of repository secrets; --repo/--repos-file/"
+            "--repo-pattern then select the repositories that may use them"
+        ),
+    )
+    secrets_parser.add_argument(
+        "--visibility",
+        choices=ORG_SECRET_VISIBILITIES,
+        default="selected",
+        help="Visibility of organization secrets written with --org (default: selected)",
+    )
     secrets_parser.add_argument(
         "--env-file",
         default=DEFAULT_SECRETS_FILE,
@@ -612,6 +1264,24 @@ def build_parser() -> argparse.ArgumentParser:
     secrets_parser.add_argument(
         "--token", help="GitHub personal access token (defaults to the GITHUB_TOKEN env var)"
     )
+    secrets_parser.add_argument(
+        "--max-concurrency",
+        type=_positive_int,
+        default=DEFAULT_SECRET_CONCURRENCY,
+        help=f"Maximum number of secrets uploaded in parallel (default: {DEFAULT_SECRET_CONCURRENCY})",
+    )
+    secrets_parser.add_argument(
+        "--skip-unchanged",
+        action="store_true",
+        help="Skip secrets whose value was already pushed, according to a local digest ledger",
+    )
+    secrets_parser.add_argument(
+        "--ledger-file",
+        help=(
+            "Path of the digest ledger used by --skip-unchanged (implies it;"
+            " defaults to $XDG_STATE_HOME/gal/secret-ledger.json)"
+        ),
+    )
     secrets_parser.set_defaults(func=sync_secrets)
 
     workflows_parser = subparsers.add_parser(
@@ -631,10 +1301,20 @@ def build_parser() -> argparse.ArgumentParser:
         default=Path.cwd(),
         help="Destination directory whose .github folder should be updated",
     )
-    workflows_parser.add_argument(
+    workflows_targets = workflows_parser.add_mutually_exclusive_group()
+    workflows_targets.add_argument(
         "--repo",
         help="When set, sync the template .github directory directly to this repository (owner/name)",
     )
+    workflows_targets.add_argument(
+        "--repos",
+        nargs="+",
+        help="Sync the template to several repositories at once (owner/name ...)",
+    )
+    workflows_targets.add_argument(
+        "--repos-file",
+        help="File listing target repositories for a fleet sync (one owner/name per line)",
+    )
     workflows_parser.add_argument(
         "--branch",
         help="Target branch to update when using --repo (defaults to the repository's default branch)",
@@ -700,6 +1380,58 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="When used with --workflow(s), prefer .github/workflows_remote over .github/workflows",
     )
+    workflows_parser.add_argument(
+        "--template-source",
+        choices=["auto", "archive", "tree"],
+        default="auto",
+        help=(
+            "How to fetch the template: 'archive' downloads the repository zipball, 'tree' fetches only the "
+            "needed .github files through the Git Trees API, 'auto' (default) uses 'tree' for "
+            "--workflow(s)/--preset syncs and 'archive' otherwise"
+        ),
+    )
+    workflows_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always download the template archive instead of reusing the local archive cache",
+    )
+    workflows_parser.add_argument(
+        "--cache-dir",
+        help="Directory for cached template archives (defaults to $XDG_CACHE_HOME/gal/archives)",
+    )
+    workflows_parser.add_argument(
+        "--max-concurrency",
+        type=_positive_int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        help=f"Maximum number of parallel blob uploads when using --repo (default: {DEFAULT_MAX_CONCURRENCY})",
+    )
+    workflows_parser.add_argument(
+        "--fleet-concurrency",
+        type=_positive_int,
+        default=DEFAULT_FLEET_CONCURRENCY,
+        help=(
+            "Number of repositories synced in parallel with --repos/--repos-file "
+            f"(default: {DEFAULT_FLEET_CONCURRENCY})"
+        ),
+    )
+    workflows_parser.add_argument(
+        "--max-connections",
+        type=_positive_int,
+        default=DEFAULT_POOL_SIZE,
+        help=(
+            "Maximum simultaneous connections to the GitHub API host during a fleet sync "
+            f"(default: {DEFAULT_POOL_SIZE})"
+        ),
+    )
+    workflows_parser.add_argument(
+        "--inline-max-bytes",
+        type=int,
+        default=DEFAULT_INLINE_MAX_BYTES,
+        help=(
+            "Send text files up to this size inline with the tree request instead of "
+            f"uploading separate blobs (default: {DEFAULT_INLINE_MAX_BYTES}, 0 disables)"
+        ),
+    )
     workflows_parser.set_defaults(func=sync_workflows)
 
     agent_parser = subparsers.add_parser(
@@ -728,6 +1460,15 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Force update the target branch reference",
     )
+    agent_parser.add_argument(
+        "--inline-max-bytes",
+        type=int,
+        default=DEFAULT_INLINE_MAX_BYTES,
+        help=(
+            "Send text files up to this size inline with the tree request instead of "
+            f"uploading separate blobs (default: {DEFAULT_INLINE_MAX_BYTES}, 0 disables)"
+        ),
+    )
     agent_parser.set_defaults(func=sync_agent)
 
     return parser
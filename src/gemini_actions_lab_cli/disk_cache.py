@@ -0,0 +1,93 @@
+"""Size-bounded, least-recently-used file store shared by the on-disk caches."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import BinaryIO, Callable, Optional
+
+
+def xdg_cache_dir(name: str) -> Path:
+    """Return ``$XDG_CACHE_HOME/gal/<name>`` (``~/.cache`` when unset)."""
+
+    base = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base).expanduser() / "gal" / name
+
+
+def _size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+class BoundedDirectory:
+    """Files under ``root`` matching ``pattern``, kept below ``max_bytes`` in total.
+
+    Entries are written atomically (temporary file + ``os.replace``) and evicted least
+    recently used first, judged by modification time, which :meth:`touch` refreshes
+    on every hit. The directory is scanned once and the total is then tracked as
+    entries are written, so it is only walked again when the total passes the limit.
+    """
+
+    def __init__(self, root: Path, max_bytes: int, pattern: str) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        self.pattern = pattern
+        self._lock = threading.Lock()
+        self._total: Optional[int] = None
+
+    def touch(self, path: Path) -> None:
+        """Mark ``path`` as recently used."""
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def write(self, path: Path, fill: Callable[[BinaryIO], object]) -> Path:
+        """Create ``path`` by letting ``fill`` write to a file handle, then enforce the limit.
+
+        An interrupted ``fill`` never leaves a truncated entry behind.
+        """
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                fill(handle)
+            added = os.stat(tmp_name).st_size - _size(path)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        with self._lock:
+            if self._total is not None:
+                self._total += added
+            over_limit = self._total is None or self._total > self.max_bytes
+        if over_limit:
+            self.evict(keep=path)
+        return path
+
+    def evict(self, keep: Optional[Path] = None) -> None:
+        """Delete least recently used entries until the directory fits ``max_bytes``."""
+
+        with self._lock:
+            entries = []
+            for path in self.root.glob(self.pattern):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+                if total <= self.max_bytes:
+                    break
+                if path == keep:
+                    continue
+                path.unlink(missing_ok=True)
+                total -= size
+            self._total = total
@@ -3,15 +3,31 @@
 from __future__ import annotations
 
 import base64
+import hashlib
 import io
-from dataclasses import dataclass
-from typing import Any, Dict, List, Mapping, Optional
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, BinaryIO, Callable, Dict, Iterable, List, Mapping, Optional
 
 import requests
 from nacl import encoding, public
 
+from .http_cache import CachedResponse, HttpCache
+
 API_URL = "https://api.github.com"
 USER_AGENT = "gemini-actions-lab-cli/0.10.3"
+REQUEST_TIMEOUT = 30
+DEFAULT_POOL_SIZE = 10
+ARCHIVE_CHUNK_SIZE = 256 * 1024
+PAGE_SIZE = 100
+PUBLIC_KEY_TTL = 15 * 60
+MAX_RETRIES = 5
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 60.0
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+GRAPHQL_BATCH_SIZE = 50
 
 
 class GitHubError(RuntimeError):
@@ -22,12 +38,295 @@ class GitHubError(RuntimeError):
         self.status = status
 
 
+def _is_sha(value: str) -> bool:
+    return len(value) == 40 and all(char in "0123456789abcdef" for char in value.lower())
+
+
+def _int_header(headers: Mapping[str, str], name: str) -> Optional[int]:
+    try:
+        return int(headers.get(name))  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimitScheduler:
+    """Track the REST rate-limit budget and pace requests across threads.
+
+    Every response updates the budget from ``X-RateLimit-*`` headers. Before each
+    request :meth:`pacing_delay` spreads the remaining budget evenly over the time
+    left until the reset once it runs low, handing every caller its own send slot
+    so concurrent threads queue up instead of firing together, and pauses everyone
+    until the reset when it is exhausted. Rate-limited (429, secondary-limit 403) and 5xx responses
+    are retried by the client using :meth:`retry_delay`: ``Retry-After`` or the
+    reset time when GitHub provides one, otherwise exponential backoff with full
+    jitter. A rate-limit pause is shared, so other threads hold off as well.
+
+    The delay methods only compute and record; they never sleep, so a blocking and
+    an asynchronous client can share the same logic.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_retries: int = MAX_RETRIES,
+        backoff_base: float = BACKOFF_BASE,
+        backoff_max: float = BACKOFF_MAX,
+        low_watermark: float = 0.1,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+        jitter: Callable[[], float] = random.random,
+    ) -> None:
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.low_watermark = low_watermark
+        self._clock = clock
+        self._sleep = sleep
+        self._jitter = jitter
+        self._lock = threading.Lock()
+        self._limit: Optional[int] = None
+        self._remaining: Optional[int] = None
+        self._reset_at: Optional[float] = None
+        self._blocked_until = 0.0
+        self._next_slot = 0.0
+        self._requests = 0
+        self._retries = 0
+        self._throttled = 0.0
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """Record the budget advertised by a response."""
+
+        limit = _int_header(headers, "X-RateLimit-Limit")
+        remaining = _int_header(headers, "X-RateLimit-Remaining")
+        reset_at = _int_header(headers, "X-RateLimit-Reset")
+        with self._lock:
+            self._requests += 1
+            # GraphQL などは別枠の予算なので、REST (core) の残量だけを追跡する
+            if remaining is None or headers.get("X-RateLimit-Resource", "core") != "core":
+                return
+            # 並列リクエストの応答順が前後しても、同じリセット枠では小さい残量を採用する 🎯
+            if self._reset_at == reset_at and self._remaining is not None:
+                remaining = min(remaining, self._remaining)
+            self._limit = limit if limit is not None else self._limit
+            self._remaining = remaining
+            self._reset_at = float(reset_at) if reset_at is not None else self._reset_at
+
+    def pacing_delay(self) -> float:
+        """Return how long the next request should wait to stay within the budget."""
+
+        with self._lock:
+            now = self._clock()
+            delay = max(0.0, self._blocked_until - now)
+            if self._remaining is None or self._reset_at is None or self._reset_at <= now:
+                return delay
+            window = self._reset_at - now
+            if self._remaining <= 0:
+                return max(delay, window)
+            if self._limit and self._remaining < self._limit * self.low_watermark:
+                # 各呼び出し元に共有の送信スロットを予約し、スレッド全体で間隔を空ける 🎯
+                self._next_slot = max(now, self._next_slot) + window / self._remaining
+                delay = max(delay, self._next_slot - now)
+            return delay
+
+    def retry_delay(
+        self, attempt: int, status: int, headers: Mapping[str, str], body: str = ""
+    ) -> Optional[float]:
+        """Return the wait before retrying a failed request, or ``None`` to give up."""
+
+        if attempt >= self.max_retries:
+            return None
+        retry_after = _int_header(headers, "Retry-After")
+        exhausted = _int_header(headers, "X-RateLimit-Remaining") == 0
+        rate_limited = status == 429 or (
+            status == 403 and (retry_after is not None or exhausted or "rate limit" in body.lower())
+        )
+        if not rate_limited and status not in RETRYABLE_STATUSES:
+            return None
+
+        now = self._clock()
+        reset_at = _int_header(headers, "X-RateLimit-Reset")
+        if retry_after is not None:
+            delay = float(retry_after)
+        elif exhausted and reset_at is not None:
+            delay = max(0.0, reset_at - now) + 1.0
+        else:
+            delay = self._jitter() * min(self.backoff_max, self.backoff_base * 2**attempt)
+        with self._lock:
+            self._retries += 1
+            if rate_limited:
+                self._blocked_until = max(self._blocked_until, now + delay)
+        return delay
+
+    def wait(self, delay: Optional[float] = None) -> None:
+        """Sleep for ``delay`` (or the current pacing delay) and account for it."""
+
+        delay = self.pacing_delay() if delay is None else delay
+        if delay <= 0:
+            return
+        self.record_throttle(delay)
+        self._sleep(delay)
+
+    def record_throttle(self, delay: float) -> None:
+        """Account for time a caller spent waiting (used by clients that sleep themselves)."""
+
+        with self._lock:
+            self._throttled += delay
+
+    def metrics(self) -> Dict[str, Any]:
+        """Return the current budget and retry counters."""
+
+        with self._lock:
+            return {
+                "limit": self._limit,
+                "remaining": self._remaining,
+                "reset_at": self._reset_at,
+                "requests": self._requests,
+                "retries": self._retries,
+                "throttled_seconds": round(self._throttled, 3),
+            }
+
+
+@dataclass(slots=True)
+class SecretPublicKey:
+    """An Actions secrets public key, parsed once and reused for every secret."""
+
+    key_id: str
+    key: str
+    _sealed_box: Any = field(default=None, init=False, repr=False)
+
+    @property
+    def sealed_box(self) -> public.SealedBox:
+        if self._sealed_box is None:
+            self._sealed_box = public.SealedBox(
+                public.PublicKey(self.key.encode("utf-8"), encoding.Base64Encoder())
+            )
+        return self._sealed_box
+
+
+@dataclass(slots=True)
+class BranchHead:
+    """Tip of a branch: its name, head commit and that commit's root tree."""
+
+    branch: str
+    commit_sha: str
+    tree_sha: str
+
+
+class PublicKeyCache:
+    """Thread-safe TTL cache of :class:`SecretPublicKey` objects keyed by scope.
+
+    GitHub rotates Actions public keys rarely, so one fetch per repository (or
+    organization) and TTL window is enough. When an upload is rejected because of
+    a stale ``key_id``, pass it as ``stale_key_id`` to force a refetch. Each report
+    is honoured once: an entry already refetched for that ``key_id`` counts as
+    fresh even when GitHub returned the same key, so concurrent 422 responses (or
+    ones unrelated to the key) do not each fetch it again.
+    """
+
+    def __init__(self, ttl: float = PUBLIC_KEY_TTL, clock: Callable[[], float] = time.monotonic) -> None:
+        self.ttl = ttl
+        self._clock = clock
+        # scope -> (有効期限, 鍵, この取得のきっかけになった古い key_id)
+        self._entries: Dict[str, tuple[float, SecretPublicKey, Optional[str]]] = {}
+        self._fetch_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _fresh(self, scope: str, stale_key_id: Optional[str]) -> Optional[SecretPublicKey]:
+        entry = self._entries.get(scope)
+        if entry is None:
+            return None
+        expires, cached, refetched_for = entry
+        if expires <= self._clock():
+            return None
+        if stale_key_id is not None and cached.key_id == stale_key_id and refetched_for != stale_key_id:
+            return None
+        return cached
+
+    def get(
+        self,
+        scope: str,
+        fetch: Callable[[], Mapping[str, str]],
+        *,
+        stale_key_id: Optional[str] = None,
+    ) -> SecretPublicKey:
+        with self._lock:
+            cached = self._fresh(scope, stale_key_id)
+            if cached is not None:
+                return cached
+            fetch_lock = self._fetch_locks.setdefault(scope, threading.Lock())
+        # スコープ単位で取得を 1 回にまとめ、別リポジトリの取得は並列のまま 🎯
+        with fetch_lock:
+            cached = self.peek(scope, stale_key_id=stale_key_id)
+            if cached is not None:
+                return cached
+            return self.put(scope, fetch(), stale_key_id=stale_key_id)
+
+    def peek(self, scope: str, *, stale_key_id: Optional[str] = None) -> Optional[SecretPublicKey]:
+        """Return the cached key for ``scope`` without fetching, or ``None``."""
+
+        with self._lock:
+            return self._fresh(scope, stale_key_id)
+
+    def put(
+        self, scope: str, data: Mapping[str, str], *, stale_key_id: Optional[str] = None
+    ) -> SecretPublicKey:
+        """Cache the ``{"key_id", "key"}`` payload fetched for ``scope``.
+
+        ``stale_key_id`` is the rejected ``key_id`` that prompted the fetch, if any.
+        """
+
+        cached = SecretPublicKey(key_id=data["key_id"], key=data["key"])
+        with self._lock:
+            self._entries[scope] = (self._clock() + self.ttl, cached, stale_key_id)
+        return cached
+
+    def invalidate(self, scope: str) -> None:
+        with self._lock:
+            self._entries.pop(scope, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Process-wide cache shared by every client
+PUBLIC_KEY_CACHE = PublicKeyCache()
+
+
 @dataclass(slots=True)
 class GitHubClient:
-    """Small wrapper around the GitHub REST API."""
+    """Small wrapper around the GitHub REST API.
+
+    The client owns a pooled :class:`requests.Session`, so consecutive calls reuse
+    keep-alive connections instead of paying a fresh TCP/TLS handshake each time.
+    Use it as a context manager (or call :meth:`close`) to release the pool. With
+    ``pool_block`` the pool never opens more than ``pool_size`` connections to a host;
+    extra threads wait for a free connection instead.
+    """
 
     token: Optional[str] = None
     api_url: str = API_URL
+    pool_size: int = DEFAULT_POOL_SIZE
+    pool_block: bool = False
+    public_keys: PublicKeyCache = field(default_factory=lambda: PUBLIC_KEY_CACHE, repr=False)
+    scheduler: RateLimitScheduler = field(default_factory=RateLimitScheduler, repr=False)
+    http_cache: Optional[HttpCache] = field(default=None, repr=False)
+    _session: Optional[requests.Session] = field(default=None, init=False, repr=False)
+    _session_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __enter__(self) -> "GitHubClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its connection pool."""
+
+        with self._session_lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
 
     def _headers(self) -> Dict[str, str]:
         headers = {"Accept": "application/vnd.github+json", "User-Agent": USER_AGENT}
@@ -35,14 +334,70 @@ class GitHubClient:
             headers["Authorization"] = f"Bearer {self.token}"
         return headers
 
+    @property
+    def session(self) -> requests.Session:
+        """Return the shared session, creating it on first use."""
+
+        with self._session_lock:
+            if self._session is None:
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(
+                    pool_connections=2,
+                    pool_maxsize=self.pool_size,
+                    pool_block=self.pool_block,
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                # Default headers are attached once and sent with every request
+                session.headers.update(self._headers())
+                self._session = session
+            return self._session
+
     def _request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
-        response = requests.request(method, url, headers=self._headers(), timeout=30, **kwargs)
-        if response.status_code >= 400:
-            raise GitHubError(
-                f"GitHub API error {response.status_code}: {response.text.strip()}",
-                status=response.status_code,
-            )
-        return response
+        attempt = 0
+        while True:
+            self.scheduler.wait()
+            response = self.session.request(method, url, timeout=REQUEST_TIMEOUT, **kwargs)
+            self.scheduler.update(response.headers)
+            if response.status_code < 400:
+                return response
+            delay = self.scheduler.retry_delay(attempt, response.status_code, response.headers, response.text)
+            if delay is None:
+                raise GitHubError(
+                    f"GitHub API error {response.status_code}: {response.text.strip()}",
+                    status=response.status_code,
+                )
+            response.close()
+            self.scheduler.wait(delay)
+            attempt += 1
+
+    def _get_json(self, url: str, params: Optional[Mapping[str, Any]] = None, *, immutable: bool = False) -> Any:
+        """GET ``url`` and decode JSON, revalidating through :attr:`http_cache` when set.
+
+        Cached responses are revalidated with ``If-None-Match``/``If-Modified-Since``;
+        a ``304 Not Modified`` reuses the stored body and does not count against the
+        primary rate limit. ``immutable`` responses (objects addressed by SHA) are
+        served from the cache without any request.
+        """
+
+        if self.http_cache is None:
+            return self._request("GET", url, params=params).json()
+        key = self.http_cache.key(url, params, self.token)
+        cached = self.http_cache.get(key)
+        if cached is not None and immutable:
+            return cached.body
+        extra: Dict[str, Any] = {"params": params}
+        if cached is not None and cached.conditional_headers():
+            extra["headers"] = cached.conditional_headers()
+        response = self._request("GET", url, **extra)
+        if response.status_code == 304 and cached is not None:
+            return cached.body
+        payload = response.json()
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if immutable or etag or last_modified:
+            self.http_cache.store(key, CachedResponse(body=payload, etag=etag, last_modified=last_modified))
+        return payload
 
     def get_actions_public_key(self, owner: str, repo: str) -> Mapping[str, str]:
         url = f"{self.api_url}/repos/{owner}/{repo}/actions/secrets/public-key"
@@ -52,6 +407,17 @@ class GitHubClient:
             raise GitHubError("Unexpected response payload when fetching repository key")
         return {"key": data["key"], "key_id": data["key_id"]}
 
+    def get_secret_public_key(
+        self, owner: str, repo: str, *, stale_key_id: Optional[str] = None
+    ) -> SecretPublicKey:
+        """Return the repository public key from :attr:`public_keys`, fetching it on a miss."""
+
+        return self.public_keys.get(
+            f"{self.api_url}/repos/{owner}/{repo}".lower(),
+            lambda: self.get_actions_public_key(owner, repo),
+            stale_key_id=stale_key_id,
+        )
+
     def put_actions_secret(
         self,
         owner: str,
@@ -65,18 +431,131 @@ class GitHubClient:
         response = self._request("PUT", url, json=payload)
         return response.status_code
 
-    def download_repository_archive(self, owner: str, repo: str, ref: Optional[str] = None) -> bytes:
+    def get_org_actions_public_key(self, org: str) -> Mapping[str, str]:
+        url = f"{self.api_url}/orgs/{org}/actions/secrets/public-key"
+        data = self._request("GET", url).json()
+        if not {"key", "key_id"} <= data.keys():
+            raise GitHubError("Unexpected response payload when fetching organization key")
+        return {"key": data["key"], "key_id": data["key_id"]}
+
+    def get_org_secret_public_key(self, org: str, *, stale_key_id: Optional[str] = None) -> SecretPublicKey:
+        """Return the organization public key from :attr:`public_keys`, fetching it on a miss."""
+
+        return self.public_keys.get(
+            f"{self.api_url}/orgs/{org}".lower(),
+            lambda: self.get_org_actions_public_key(org),
+            stale_key_id=stale_key_id,
+        )
+
+    def put_org_actions_secret(
+        self,
+        org: str,
+        secret_name: str,
+        encrypted_value: str,
+        key_id: str,
+        *,
+        visibility: str = "selected",
+        selected_repository_ids: Optional[List[int]] = None,
+    ) -> int:
+        """Create or update an organization secret.
+
+        With ``visibility="selected"`` the secret is exposed to exactly the
+        repositories in ``selected_repository_ids``.
+        """
+
+        url = f"{self.api_url}/orgs/{org}/actions/secrets/{secret_name}"
+        payload: Dict[str, Any] = {
+            "encrypted_value": encrypted_value,
+            "key_id": key_id,
+            "visibility": visibility,
+        }
+        if visibility == "selected":
+            payload["selected_repository_ids"] = list(selected_repository_ids or [])
+        return self._request("PUT", url, json=payload).status_code
+
+    def set_org_secret_repositories(self, org: str, secret_name: str, repository_ids: List[int]) -> None:
+        """Replace the repositories that can access a ``selected`` organization secret."""
+
+        url = f"{self.api_url}/orgs/{org}/actions/secrets/{secret_name}/repositories"
+        self._request("PUT", url, json={"selected_repository_ids": list(repository_ids)})
+
+    def stream_repository_archive(
+        self,
+        owner: str,
+        repo: str,
+        destination: BinaryIO,
+        ref: Optional[str] = None,
+    ) -> int:
+        """Write the repository zipball into ``destination`` chunk by chunk.
+
+        The archive never has to fit in memory; pass a real or spooled temporary file.
+        Returns the number of bytes written.
+        """
+
         ref_part = f"/{ref}" if ref else ""
         url = f"{self.api_url}/repos/{owner}/{repo}/zipball{ref_part}"
-        response = self._request("GET", url, stream=True)
+        written = 0
+        with self._request("GET", url, stream=True) as response:
+            for chunk in response.iter_content(chunk_size=ARCHIVE_CHUNK_SIZE):
+                destination.write(chunk)
+                written += len(chunk)
+        return written
+
+    def download_repository_archive(self, owner: str, repo: str, ref: Optional[str] = None) -> bytes:
         buffer = io.BytesIO()
-        for chunk in response.iter_content(chunk_size=65536):
-            buffer.write(chunk)
+        self.stream_repository_archive(owner, repo, buffer, ref=ref)
         return buffer.getvalue()
 
+    def resolve_commit_sha(self, owner: str, repo: str, ref: Optional[str] = None) -> str:
+        """Resolve ``ref`` (branch, tag or SHA; default branch when omitted) to a commit SHA.
+
+        Uses the ``sha`` media type so the response is just the 40 character id.
+        """
+
+        url = f"{self.api_url}/repos/{owner}/{repo}/commits/{ref or 'HEAD'}"
+        response = self._request("GET", url, headers={"Accept": "application/vnd.github.sha"})
+        sha = response.text.strip()
+        if len(sha) != 40:
+            raise GitHubError(f"Unable to resolve {owner}/{repo}@{ref or 'HEAD'} to a commit")
+        return sha
+
     def get_repository(self, owner: str, repo: str) -> Mapping[str, Any]:
         url = f"{self.api_url}/repos/{owner}/{repo}"
-        return self._request("GET", url).json()
+        return self._get_json(url)
+
+    def list_repositories(self, owner: str) -> List[Mapping[str, Any]]:
+        """Return every repository of ``owner``, following pagination.
+
+        Organisation repositories (including private ones the token can see) are
+        listed first. When ``owner`` is the authenticated user, every repository the
+        account owns (private ones included) is returned; for any other user account
+        only its public repositories are visible.
+        """
+
+        try:
+            return self._paginate(f"{self.api_url}/orgs/{owner}/repos", {"type": "all"})
+        except GitHubError as exc:
+            if exc.status != 404:
+                raise
+        if self.token:
+            try:
+                login = self._get_json(f"{self.api_url}/user").get("login") or ""
+            except GitHubError:
+                login = ""
+            if login.lower() == owner.lower():
+                # /users/{owner}/repos は公開リポジトリしか返さないため、自分のアカウントは /user/repos で取得
+                return self._paginate(f"{self.api_url}/user/repos", {"affiliation": "owner"})
+        return self._paginate(f"{self.api_url}/users/{owner}/repos", {"type": "owner"})
+
+    def _paginate(self, url: str, params: Mapping[str, Any]) -> List[Mapping[str, Any]]:
+        items: List[Mapping[str, Any]] = []
+        page = 1
+        while True:
+            batch = self._request("GET", url, params={**params, "per_page": PAGE_SIZE, "page": page}).json()
+            items.extend(batch)
+            if len(batch) < PAGE_SIZE:
+                return items
+            page += 1
 
     def get_default_branch(self, owner: str, repo: str) -> str:
         repo_info = self.get_repository(owner, repo)
@@ -87,16 +566,73 @@ class GitHubClient:
 
     def get_ref(self, owner: str, repo: str, ref: str) -> Mapping[str, Any]:
         url = f"{self.api_url}/repos/{owner}/{repo}/git/ref/{ref}"
-        return self._request("GET", url).json()
+        return self._get_json(url)
 
     def get_git_commit(self, owner: str, repo: str, sha: str) -> Mapping[str, Any]:
         url = f"{self.api_url}/repos/{owner}/{repo}/git/commits/{sha}"
-        return self._request("GET", url).json()
+        return self._get_json(url, immutable=_is_sha(sha))
+
+    @property
+    def graphql_url(self) -> str:
+        base = self.api_url.rstrip("/")
+        # GitHub Enterprise Server: https://host/api/v3 → https://host/api/graphql
+        if base.endswith("/api/v3"):
+            return f"{base[: -len('/v3')]}/graphql"
+        return f"{base}/graphql"
+
+    def graphql(self, query: str, variables: Optional[Mapping[str, Any]] = None) -> Mapping[str, Any]:
+        """Run a GraphQL query and return its ``data``.
+
+        Partial results are returned as-is (unresolvable aliases are ``null``); only a
+        response without any ``data`` raises :class:`GitHubError`.
+        """
+
+        response = self._request("POST", self.graphql_url, json={"query": query, "variables": dict(variables or {})})
+        payload = response.json()
+        data = payload.get("data")
+        if data is None:
+            messages = "; ".join(error.get("message", "") for error in payload.get("errors") or [])
+            raise GitHubError(f"GitHub GraphQL error: {messages or 'empty response'}")
+        return data
+
+    def resolve_branch_heads(self, repos: Iterable[str], branch: Optional[str] = None) -> Dict[str, BranchHead]:
+        """Return the :class:`BranchHead` of ``branch`` (default branch when ``None``) per repository.
+
+        Up to :data:`GRAPHQL_BATCH_SIZE` repositories are resolved per GraphQL query,
+        replacing the ``get_default_branch`` → ``get_ref`` → ``get_git_commit`` round
+        trips. Repositories that cannot be resolved (missing, inaccessible, empty or
+        without ``branch``) are left out of the result.
+        """
+
+        targets = []
+        for repo in dict.fromkeys(repos):
+            try:
+                targets.append((repo, *parse_repo(repo)))
+            except ValueError:
+                continue
+        heads: Dict[str, BranchHead] = {}
+        for start in range(0, len(targets), GRAPHQL_BATCH_SIZE):
+            chunk = targets[start : start + GRAPHQL_BATCH_SIZE]
+            query, variables = _branch_heads_query([(owner, name) for _, owner, name in chunk], branch)
+            data = self.graphql(query, variables)
+            for index, (repo, _, _) in enumerate(chunk):
+                ref = (data.get(f"r{index}") or {}).get("ref") or {}
+                target = ref.get("target") or {}
+                tree_sha = (target.get("tree") or {}).get("oid")
+                if ref.get("name") and target.get("oid") and tree_sha:
+                    heads[repo] = BranchHead(ref["name"], target["oid"], tree_sha)
+        return heads
 
     def get_tree(self, owner: str, repo: str, sha: str, recursive: bool = False) -> Mapping[str, Any]:
         url = f"{self.api_url}/repos/{owner}/{repo}/git/trees/{sha}"
         params = {"recursive": "1"} if recursive else None
-        return self._request("GET", url, params=params).json()
+        return self._get_json(url, params, immutable=_is_sha(sha))
+
+    def get_blob(self, owner: str, repo: str, sha: str) -> bytes:
+        """Return the raw content of blob ``sha``."""
+
+        url = f"{self.api_url}/repos/{owner}/{repo}/git/blobs/{sha}"
+        return self._request("GET", url, headers={"Accept": "application/vnd.github.raw"}).content
 
     def create_blob(self, owner: str, repo: str, content: bytes) -> str:
         url = f"{self.api_url}/repos/{owner}/{repo}/git/blobs"
@@ -158,22 +694,60 @@ class GitHubClient:
 
     def get_pages_info(self, owner: str, repo: str) -> Mapping[str, Any]:
         url = f"{self.api_url}/repos/{owner}/{repo}/pages"
-        return self._request("GET", url).json()
+        return self._get_json(url)
 
     def update_repository(self, owner: str, repo: str, **fields: Any) -> Mapping[str, Any]:
         url = f"{self.api_url}/repos/{owner}/{repo}"
         return self._request("PATCH", url, json=fields).json()
 
 
-def encrypt_secret(public_key: str, value: str) -> str:
-    """Encrypt ``value`` using the repository ``public_key``."""
+def encrypt_secret(public_key: str | SecretPublicKey, value: str) -> str:
+    """Encrypt ``value`` using the repository ``public_key``.
+
+    Passing a :class:`SecretPublicKey` reuses its already parsed sealed box.
+    """
 
-    key = public.PublicKey(public_key.encode("utf-8"), encoding.Base64Encoder())
-    sealed_box = public.SealedBox(key)
+    if isinstance(public_key, SecretPublicKey):
+        sealed_box = public_key.sealed_box
+    else:
+        sealed_box = public.SealedBox(public.PublicKey(public_key.encode("utf-8"), encoding.Base64Encoder()))
     encrypted = sealed_box.encrypt(value.encode("utf-8"))
     return base64.b64encode(encrypted).decode("utf-8")
 
 
+def git_blob_sha(content: bytes) -> str:
+    """Return the Git object id of a blob holding ``content``.
+
+    This matches the ``sha`` GitHub reports for tree entries, so local files can be
+    compared with a branch without downloading or uploading anything.
+    """
+
+    digest = hashlib.sha1(f"blob {len(content)}\0".encode("ascii"))
+    digest.update(content)
+    return digest.hexdigest()
+
+
+def _branch_heads_query(
+    repos: List[tuple[str, str]], branch: Optional[str]
+) -> tuple[str, Dict[str, str]]:
+    """Build one aliased query (``r0``, ``r1``, ...) resolving the branch tip of each repository."""
+
+    ref_field = "ref(qualifiedName: $ref)" if branch else "defaultBranchRef"
+    declarations = ["$ref: String!"] if branch else []
+    variables = {"ref": f"refs/heads/{branch}"} if branch else {}
+    fields = []
+    for index, (owner, name) in enumerate(repos):
+        declarations.append(f"$o{index}: String!, $n{index}: String!")
+        variables[f"o{index}"] = owner
+        variables[f"n{index}"] = name
+        fields.append(f"r{index}: repository(owner: $o{index}, name: $n{index}) {{ ref: {ref_field} {{ ...head }} }}")
+    query = (
+        f"query({', '.join(declarations)}) {{ {' '.join(fields)} }} "
+        "fragment head on Ref { name target { ... on Commit { oid tree { oid } } } }"
+    )
+    return query, variables
+
+
 def parse_repo(repo: str) -> tuple[str, str]:
     """Split ``owner/repo`` notation into a tuple."""
 
@@ -0,0 +1,85 @@
+"""On-disk cache of conditional (ETag / Last-Modified) GitHub API responses."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Mapping, Optional
+
+from .disk_cache import BoundedDirectory, xdg_cache_dir
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def default_cache_dir() -> Path:
+    """Return ``$XDG_CACHE_HOME/gal/http`` (``~/.cache`` when unset)."""
+
+    return xdg_cache_dir("http")
+
+
+@dataclass(slots=True)
+class CachedResponse:
+    """Validators and decoded JSON body of a previously fetched response."""
+
+    body: Any
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def conditional_headers(self) -> dict[str, str]:
+        if self.etag:
+            return {"If-None-Match": self.etag}
+        if self.last_modified:
+            return {"If-Modified-Since": self.last_modified}
+        return {}
+
+
+@dataclass(slots=True)
+class HttpCache:
+    """Store JSON responses under ``<root>/<key[:2]>/<key>.json``.
+
+    Keys include a fingerprint of the token, so responses fetched with one token are
+    never served to another. The cache is bounded by ``max_bytes``; least recently
+    used entries are evicted first.
+    """
+
+    root: Path = field(default_factory=default_cache_dir)
+    max_bytes: int = DEFAULT_MAX_BYTES
+    _files: BoundedDirectory = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._files = BoundedDirectory(self.root, self.max_bytes, "*/*.json")
+
+    @staticmethod
+    def key(url: str, params: Optional[Mapping[str, Any]], token: Optional[str]) -> str:
+        token_fingerprint = hashlib.sha256((token or "").encode("utf-8")).hexdigest()[:16]
+        query = "&".join(f"{name}={value}" for name, value in sorted((params or {}).items()))
+        return hashlib.sha256(f"{token_fingerprint}\0{url}\0{query}".encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the cached response for ``key`` or ``None`` on a miss."""
+
+        path = self._path(key)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        self._files.touch(path)
+        return CachedResponse(body=data.get("body"), etag=data.get("etag"), last_modified=data.get("last_modified"))
+
+    def store(self, key: str, response: CachedResponse) -> None:
+        """Atomically write ``response`` and evict old entries beyond ``max_bytes``."""
+
+        payload = json.dumps(
+            {"etag": response.etag, "last_modified": response.last_modified, "body": response.body}
+        ).encode("utf-8")
+        self._files.write(self._path(key), lambda handle: handle.write(payload))
+
+    def evict(self, keep: Optional[Path] = None) -> None:
+        """Delete least recently used entries until the cache fits ``max_bytes``."""
+
+        self._files.evict(keep=keep)
@@ -0,0 +1,109 @@
+"""Record of the last local template sync, used to make re-runs incremental."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Mapping
+
+MANIFEST_PATH = ".github/.gal-manifest.json"
+MANIFEST_VERSION = 1
+
+
+def selection_key(
+    extra_files: Iterable[str] | None,
+    *,
+    workflow_files: list[str] | None,
+    prompt_files: list[str] | None,
+    agent_files: list[str] | None,
+    use_remote: bool,
+) -> dict[str, Any]:
+    """Describe which template files a sync selects, independent of argument order."""
+
+    return {
+        "workflows": sorted(workflow_files) if workflow_files else None,
+        "prompts": sorted(prompt_files) if prompt_files else None,
+        "agents": sorted(agent_files) if agent_files else None,
+        "extras": sorted(extra_files) if extra_files else None,
+        "use_remote": bool(use_remote),
+    }
+
+
+@dataclass(slots=True)
+class SyncManifest:
+    """Template commit and per-file Git blob hashes written by the last sync.
+
+    ``files`` maps repository-relative paths to the blob SHA of the template content
+    that was last written there. A local file whose hash still matches is pristine and
+    may be updated in place; anything else has been edited locally and is preserved.
+    """
+
+    template: str
+    commit: str
+    selection: dict[str, Any]
+    files: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, destination: Path) -> SyncManifest | None:
+        """Read the manifest under ``destination``; ``None`` if missing or unreadable."""
+
+        try:
+            data = json.loads((destination / MANIFEST_PATH).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            return None
+        files = data.get("files")
+        if not isinstance(files, dict):
+            return None
+        return cls(
+            template=str(data.get("template", "")),
+            commit=str(data.get("commit", "")),
+            selection=data.get("selection") or {},
+            files={str(path): str(sha) for path, sha in files.items()},
+        )
+
+    def save(self, destination: Path) -> Path:
+        """Atomically write the manifest to ``destination/.github/.gal-manifest.json``."""
+
+        path = destination / MANIFEST_PATH
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "version": MANIFEST_VERSION,
+            "template": self.template,
+            "commit": self.commit,
+            "selection": self.selection,
+            "files": dict(sorted(self.files.items())),
+        }
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".part")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle, indent=2, ensure_ascii=False)
+                handle.write("\n")
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        return path
+
+    def is_current(
+        self,
+        template: str,
+        commit: str,
+        selection: Mapping[str, Any],
+        destination: Path,
+    ) -> bool:
+        """Return ``True`` when the last sync used the same template commit and selection.
+
+        Every recorded file must also still exist, so deleting a synced file locally
+        brings it back on the next run.
+        """
+
+        if self.template.lower() != template.lower() or self.commit != commit:
+            return False
+        if self.selection != dict(selection):
+            return False
+        return all((destination / path).exists() for path in self.files)
@@ -0,0 +1,99 @@
+"""Local record of pushed secret digests, used to skip unchanged secrets."""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+import os
+import secrets as _secrets
+import tempfile
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+LEDGER_VERSION = 1
+
+
+def default_ledger_path() -> Path:
+    """Return ``$XDG_STATE_HOME/gal/secret-ledger.json`` (``~/.local/state`` when unset)."""
+
+    base = os.getenv("XDG_STATE_HOME") or Path.home() / ".local" / "state"
+    return Path(base).expanduser() / "gal" / "secret-ledger.json"
+
+
+@dataclass(slots=True)
+class SecretLedger:
+    """Salted HMAC digests of the secret values last pushed to each repository.
+
+    GitHub never returns secret values, so the ledger is the only way to tell whether
+    a value changed since the previous sync. Only keyed digests are stored: the random
+    per-ledger salt keeps them from being matched against guessed values elsewhere.
+    Each repository also remembers the public ``key_id`` the values were encrypted
+    with; when GitHub rotates the key every secret of that repository is pushed again.
+    """
+
+    path: Path
+    salt: bytes = field(default_factory=lambda: _secrets.token_bytes(32))
+    repos: dict[str, dict[str, Any]] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    @classmethod
+    def load(cls, path: Path | None = None) -> SecretLedger:
+        """Read the ledger at ``path``; a missing or unreadable file yields an empty one."""
+
+        path = Path(path).expanduser() if path is not None else default_ledger_path()
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("version") != LEDGER_VERSION:
+                raise ValueError("unsupported ledger version")
+            return cls(path=path, salt=bytes.fromhex(data["salt"]), repos=dict(data.get("repos") or {}))
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return cls(path=path)
+
+    def digest(self, value: str) -> str:
+        return hmac.new(self.salt, value.encode("utf-8"), hashlib.sha256).hexdigest()
+
+    def is_unchanged(self, repo: str, key_id: str, name: str, value: str) -> bool:
+        """Return ``True`` when ``value`` was already pushed to ``repo`` with ``key_id``."""
+
+        with self._lock:
+            entry = self.repos.get(repo.lower())
+            if not entry or entry.get("key_id") != key_id:
+                return False
+            recorded = entry.get("secrets", {}).get(name)
+        return recorded is not None and hmac.compare_digest(recorded, self.digest(value))
+
+    def record(self, repo: str, key_id: str, name: str, value: str) -> None:
+        """Remember that ``value`` was pushed to ``repo`` as ``name``."""
+
+        digest = self.digest(value)
+        with self._lock:
+            entry = self.repos.setdefault(repo.lower(), {"key_id": key_id, "secrets": {}})
+            if entry.get("key_id") != key_id:
+                # 公開鍵がローテーションされたら古い記録は無効 🎯
+                entry["key_id"] = key_id
+                entry["secrets"] = {}
+            entry.setdefault("secrets", {})[name] = digest
+
+    def save(self) -> None:
+        """Atomically write the ledger, readable by the current user only."""
+
+        with self._lock:
+            payload = json.dumps(
+                {"version": LEDGER_VERSION, "salt": self.salt.hex(), "repos": self.repos},
+                indent=2,
+                sort_keys=True,
+            )
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, suffix=".part")
+        try:
+            os.chmod(tmp_name, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                handle.write(payload)
+                handle.write("\n")
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
@@ -2,12 +2,25 @@
 
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, Mapping
+from typing import Callable, Iterable, Mapping
 
 from .env_loader import load_env_file
-from .github_api import API_URL, GitHubClient, GitHubError, encrypt_secret, parse_repo
+from .github_api import (
+    API_URL,
+    DEFAULT_POOL_SIZE,
+    GitHubClient,
+    GitHubError,
+    SecretPublicKey,
+    encrypt_secret,
+    parse_repo,
+)
+from .secret_ledger import SecretLedger
+
+DEFAULT_SECRET_CONCURRENCY = 8
+ORG_SECRET_VISIBILITIES = ("all", "private", "selected")
 
 
 @dataclass(slots=True)
@@ -22,62 +35,328 @@ class SecretSyncResult:
     created: list[str] = field(default_factory=list)
     updated: list[str] = field(default_factory=list)
     failed: list[SecretSyncError] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
 
     @property
     def total(self) -> int:
-        return len(self.created) + len(self.updated) + len(self.failed)
+        return len(self.created) + len(self.updated) + len(self.failed) + len(self.skipped)
 
     def ok(self) -> bool:
         return not self.failed
 
 
+def _put_encrypted(
+    secret_name: str,
+    secret_value: str,
+    public_key: SecretPublicKey,
+    refresh_key: Callable[[str], SecretPublicKey],
+    put: Callable[[str, str], int],
+) -> tuple[int | SecretSyncError, str]:
+    """Encrypt and upload one secret; return the outcome and the ``key_id`` used.
+
+    A 422 response usually means the cached public key was rotated, so the key is
+    refetched once (see :class:`~gemini_actions_lab_cli.github_api.PublicKeyCache`)
+    and the upload retried only when the refetched ``key_id`` differs; otherwise
+    the 422 concerns the secret itself and is reported as is.
+    """
+
+    try:
+        return put(encrypt_secret(public_key, secret_value), public_key.key_id), public_key.key_id
+    except GitHubError as exc:
+        if exc.status != 422:
+            return SecretSyncError(secret_name, exc.status or 0, str(exc)), public_key.key_id
+        rejected = SecretSyncError(secret_name, exc.status, str(exc))
+    try:
+        refreshed = refresh_key(public_key.key_id)
+        if refreshed.key_id == public_key.key_id:
+            return rejected, public_key.key_id
+        public_key = refreshed
+        return put(encrypt_secret(public_key, secret_value), public_key.key_id), public_key.key_id
+    except GitHubError as exc:
+        return SecretSyncError(secret_name, exc.status or 0, str(exc)), public_key.key_id
+
+
+def _put_secret(
+    client: GitHubClient,
+    owner: str,
+    name: str,
+    public_key: SecretPublicKey,
+    secret_name: str,
+    secret_value: str,
+) -> tuple[int | SecretSyncError, str]:
+    return _put_encrypted(
+        secret_name,
+        secret_value,
+        public_key,
+        lambda stale: client.get_secret_public_key(owner, name, stale_key_id=stale),
+        lambda encrypted, key_id: client.put_actions_secret(owner, name, secret_name, encrypted, key_id),
+    )
+
+
 def sync_repository_secrets(
     repo: str,
     values: Mapping[str, str],
     *,
     token: str,
     api_url: str | None = None,
+    max_concurrency: int = DEFAULT_SECRET_CONCURRENCY,
+    client: GitHubClient | None = None,
+    ledger: SecretLedger | None = None,
 ) -> SecretSyncResult:
     """Synchronize ``values`` into GitHub Actions Secrets for ``repo``.
 
+    Secrets are encrypted and uploaded by up to ``max_concurrency`` worker threads
+    sharing one pooled client. The result lists names in the order of ``values``.
+
     Args:
         repo: Repository in ``owner/name`` format.
         values: Mapping of secret names to plain-text values.
         token: GitHub token with ``actions:write`` scope.
         api_url: Overridden GitHub API URL (defaults to the public API).
+        max_concurrency: Maximum number of secrets uploaded at the same time.
+        client: Existing client to reuse (e.g. when syncing several repositories).
+            When omitted a client is created and closed by this call.
+        ledger: Optional :class:`SecretLedger`. Secrets whose value and public key
+            match the ledger are reported as skipped instead of being uploaded, and
+            successful uploads are recorded and saved back to it.
+
+    Returns:
+        Details about created, updated, and failed secrets. When the repository
+        public key cannot be fetched, every secret is reported as failed.
+    """
+
+    return sync_fleet_secrets(
+        [repo],
+        values,
+        token=token,
+        api_url=api_url,
+        max_concurrency=max_concurrency,
+        client=client,
+        ledger=ledger,
+    )[repo]
+
+
+def sync_fleet_secrets(
+    repos: Iterable[str],
+    values: Mapping[str, str],
+    *,
+    token: str,
+    api_url: str | None = None,
+    max_concurrency: int = DEFAULT_SECRET_CONCURRENCY,
+    client: GitHubClient | None = None,
+    ledger: SecretLedger | None = None,
+) -> dict[str, SecretSyncResult]:
+    """Synchronize the same ``values`` into every repository of ``repos``.
+
+    All public keys are fetched concurrently first, then every (repository, secret)
+    upload is fanned out over one shared pool of ``max_concurrency`` workers. See
+    :func:`sync_repository_secrets` for the meaning of the other arguments.
+
+    Returns:
+        A :class:`SecretSyncResult` per repository, in the order of ``repos``.
+    """
+
+    repos = list(dict.fromkeys(repos))
+    if not values or not repos:
+        return {repo: SecretSyncResult() for repo in repos}
+
+    if client is None:
+        pool_size = max(DEFAULT_POOL_SIZE, max_concurrency)
+        with GitHubClient(token=token, api_url=api_url or API_URL, pool_size=pool_size) as owned:
+            return sync_fleet_secrets(
+                repos, values, token=token, max_concurrency=max_concurrency, client=owned, ledger=ledger
+            )
+
+    items = list(values.items())
+    results: dict[str, SecretSyncResult] = {}
+    with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+        key_futures = {
+            repo: executor.submit(client.get_secret_public_key, *parse_repo(repo)) for repo in repos
+        }
+        uploads: dict[str, tuple[set[str], dict[str, Future]]] = {}
+        for repo in repos:
+            try:
+                public_key = key_futures[repo].result()
+            except GitHubError as exc:
+                results[repo] = SecretSyncResult(
+                    failed=[SecretSyncError(secret_name, exc.status or 0, str(exc)) for secret_name, _ in items]
+                )
+                continue
+            owner, name = parse_repo(repo)
+            unchanged = {
+                secret_name
+                for secret_name, secret_value in items
+                if ledger is not None and ledger.is_unchanged(repo, public_key.key_id, secret_name, secret_value)
+            }
+            futures = {
+                secret_name: executor.submit(
+                    _put_secret, client, owner, name, public_key, secret_name, secret_value
+                )
+                for secret_name, secret_value in items
+                if secret_name not in unchanged
+            }
+            uploads[repo] = (unchanged, futures)
+
+        for repo, (unchanged, futures) in uploads.items():
+            results[repo] = _collect_results(repo, items, unchanged, futures, ledger)
+
+    if ledger is not None and any(result.created or result.updated for result in results.values()):
+        ledger.save()
+    return {repo: results[repo] for repo in repos}
+
+
+def _collect_results(
+    repo: str,
+    items: list[tuple[str, str]],
+    unchanged: set[str],
+    futures: Mapping[str, Future],
+    ledger: SecretLedger | None,
+) -> SecretSyncResult:
+    result = SecretSyncResult()
+    for secret_name, secret_value in items:
+        if secret_name in unchanged:
+            result.skipped.append(secret_name)
+            continue
+        outcome, key_id = futures[secret_name].result()
+        if isinstance(outcome, SecretSyncError):
+            result.failed.append(outcome)
+            continue
+        if outcome == 201:
+            result.created.append(secret_name)
+        else:
+            result.updated.append(secret_name)
+        if ledger is not None:
+            ledger.record(repo, key_id, secret_name, secret_value)
+    return result
+
+
+def sync_organization_secrets(
+    org: str,
+    values: Mapping[str, str],
+    *,
+    token: str,
+    api_url: str | None = None,
+    repositories: Iterable[str] | None = None,
+    visibility: str = "selected",
+    max_concurrency: int = DEFAULT_SECRET_CONCURRENCY,
+    client: GitHubClient | None = None,
+    ledger: SecretLedger | None = None,
+) -> SecretSyncResult:
+    """Synchronize ``values`` into GitHub Actions organization secrets of ``org``.
+
+    Every secret is encrypted and written once for the whole organization instead of
+    once per repository. With ``visibility="selected"`` the secrets are exposed to
+    exactly ``repositories`` (``owner/name`` strings, resolved to repository IDs);
+    ``"all"`` and ``"private"`` expose them to every (private) repository.
+
+    Args:
+        org: Organization login.
+        values: Mapping of secret names to plain-text values.
+        token: GitHub token with ``admin:org`` scope.
+        api_url: Overridden GitHub API URL (defaults to the public API).
+        repositories: Repositories that may use the secrets when ``visibility`` is
+            ``"selected"``.
+        visibility: One of ``"selected"``, ``"all"`` or ``"private"``.
+        max_concurrency: Maximum number of requests in flight at the same time.
+        client: Existing client to reuse. When omitted a client is created and closed
+            by this call.
+        ledger: Optional :class:`SecretLedger`. A secret is skipped only when both its
+            value and its repository selection match the last push; when only the
+            selection of a ``"selected"`` secret changed, the repository list is
+            replaced without encrypting and uploading the value again.
 
     Returns:
-        Details about created, updated, and failed secrets.
+        Details about created, updated, skipped, and failed secrets.
+
+    Raises:
+        ValueError: If ``visibility`` is not supported.
     """
 
+    if visibility not in ORG_SECRET_VISIBILITIES:
+        raise ValueError(f"visibility must be one of {', '.join(ORG_SECRET_VISIBILITIES)}")
     if not values:
         return SecretSyncResult()
 
-    owner, name = parse_repo(repo)
-    client = GitHubClient(token=token, api_url=api_url or API_URL)
-    public_key = client.get_actions_public_key(owner, name)
+    if client is None:
+        pool_size = max(DEFAULT_POOL_SIZE, max_concurrency)
+        with GitHubClient(token=token, api_url=api_url or API_URL, pool_size=pool_size) as owned:
+            return sync_organization_secrets(
+                org,
+                values,
+                token=token,
+                repositories=repositories,
+                visibility=visibility,
+                max_concurrency=max_concurrency,
+                client=owned,
+                ledger=ledger,
+            )
 
-    result = SecretSyncResult()
-    for secret_name, secret_value in values.items():
-        encrypted = encrypt_secret(public_key["key"], secret_value)
+    items = list(values.items())
+    repos = list(dict.fromkeys(repositories or [])) if visibility == "selected" else []
+    with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+        key_future = executor.submit(client.get_org_secret_public_key, org)
+        id_futures = [executor.submit(client.get_repository, *parse_repo(repo)) for repo in repos]
         try:
-            status = client.put_actions_secret(
-                owner,
-                name,
-                secret_name,
-                encrypted,
-                public_key["key_id"],
-            )
+            public_key = key_future.result()
+            repository_ids = sorted(future.result()["id"] for future in id_futures)
         except GitHubError as exc:
-            result.failed.append(
-                SecretSyncError(secret_name, exc.status or 0, str(exc))
+            return SecretSyncResult(
+                failed=[SecretSyncError(secret_name, exc.status or 0, str(exc)) for secret_name, _ in items]
             )
-            continue
 
-        if status == 201:
-            result.created.append(secret_name)
-        else:
-            result.updated.append(secret_name)
+        # 値と公開範囲は台帳に別々に記録し、リポジトリ選択だけの変更では再暗号化しない 🎯
+        scope = f"{visibility}:{','.join(map(str, repository_ids))}"
+        ledger_key = f"org:{org}"
+
+        def recorded(secret_name: str, value: str) -> bool:
+            return ledger is not None and ledger.is_unchanged(ledger_key, public_key.key_id, secret_name, value)
+
+        unchanged: set[str] = set()
+        reselect: set[str] = set()
+        for secret_name, secret_value in items:
+            if not recorded(secret_name, secret_value):
+                continue
+            if recorded(f"{secret_name}\0scope", scope):
+                unchanged.add(secret_name)
+            elif visibility == "selected" and recorded(f"{secret_name}\0visibility", visibility):
+                reselect.add(secret_name)
+
+        def put(secret_name: str, secret_value: str) -> tuple[int | SecretSyncError, str]:
+            if secret_name in reselect:
+                try:
+                    client.set_org_secret_repositories(org, secret_name, repository_ids)
+                except GitHubError as exc:
+                    return SecretSyncError(secret_name, exc.status or 0, str(exc)), public_key.key_id
+                return 204, public_key.key_id
+            return _put_encrypted(
+                secret_name,
+                secret_value,
+                public_key,
+                lambda stale: client.get_org_secret_public_key(org, stale_key_id=stale),
+                lambda encrypted, key_id: client.put_org_actions_secret(
+                    org,
+                    secret_name,
+                    encrypted,
+                    key_id,
+                    visibility=visibility,
+                    selected_repository_ids=repository_ids,
+                ),
+            )
+
+        futures = {
+            secret_name: executor.submit(put, secret_name, secret_value)
+            for secret_name, secret_value in items
+            if secret_name not in unchanged
+        }
+        result = _collect_results(ledger_key, items, unchanged, futures, ledger)
+        if ledger is not None:
+            for secret_name in result.created + result.updated:
+                key_id = futures[secret_name].result()[1]
+                ledger.record(ledger_key, key_id, f"{secret_name}\0scope", scope)
+                ledger.record(ledger_key, key_id, f"{secret_name}\0visibility", visibility)
+
+    if ledger is not None and (result.created or result.updated):
+        ledger.save()
     return result
 
 
@@ -87,6 +366,8 @@ def sync_secrets_from_env_file(
     *,
     token: str,
     api_url: str | None = None,
+    max_concurrency: int = DEFAULT_SECRET_CONCURRENCY,
+    ledger: SecretLedger | None = None,
 ) -> SecretSyncResult:
     """Load one or more ``.env`` files and synchronize them as secrets."""
 
@@ -94,4 +375,6 @@ def sync_secrets_from_env_file(
     for path in env_paths:
         data = load_env_file(Path(path), missing_ok=False)
         combined.update(data)
-    return sync_repository_secrets(repo, combined, token=token, api_url=api_url)
+    return sync_repository_secrets(
+        repo, combined, token=token, api_url=api_url, max_concurrency=max_concurrency, ledger=ledger
+    )
@@ -3,27 +3,284 @@
 from __future__ import annotations
 
 import io
+import os
 import shutil
+import stat
 import zipfile
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable
+from typing import TYPE_CHECKING, Any, BinaryIO, Iterable, Iterator, Mapping, Union
+
+from .github_api import git_blob_sha
+
+if TYPE_CHECKING:  # pragma: no cover - imported for type hints only
+    from .github_api import GitHubClient
+
+# A zipball given as raw bytes, a filesystem path, or a seekable binary file object
+ArchiveSource = Union[bytes, str, os.PathLike, BinaryIO]
+
+# Git tree modes of blobs and the Unix modes GitHub zipballs store for them
+_ZIP_MODES = {"100644": 0o100644, "100755": 0o100755, "120000": 0o120777}
 
 
 @dataclass(slots=True)
 class ExtractionResult:
-    """Outcome of extracting the template archive."""
+    """Outcome of extracting the template archive.
+
+    ``unchanged`` and ``file_hashes`` are only filled in when extraction is given the
+    hashes of a previous sync; ``file_hashes`` is then the content of the new manifest.
+    """
 
     written: list[Path]
     skipped_existing: list[Path]
+    unchanged: list[Path] = field(default_factory=list)
+    file_hashes: dict[str, str] = field(default_factory=dict)
 
 
 class WorkflowSyncError(RuntimeError):
     """Raised when the template repository does not contain a ``.github`` folder."""
 
 
+class TruncatedTreeError(WorkflowSyncError):
+    """Raised when GitHub truncates the recursive ``.github`` tree listing."""
+
+
+def _tree_blobs(tree: Mapping[str, Any], prefix: str = "") -> dict[str, Mapping[str, Any]]:
+    return {
+        f"{prefix}{item['path']}": item
+        for item in tree.get("tree", [])
+        if item.get("type") == "blob" and item.get("path")
+    }
+
+
+def _find_blob(
+    client: "GitHubClient", owner: str, repo: str, root_tree: Mapping[str, Any], path: str
+) -> Mapping[str, Any] | None:
+    """Walk ``path`` one directory at a time starting from ``root_tree``."""
+
+    tree = root_tree
+    *directories, name = path.split("/")
+    for directory in directories:
+        entry = next(
+            (item for item in tree.get("tree", []) if item.get("path") == directory and item.get("type") == "tree"),
+            None,
+        )
+        if entry is None:
+            return None
+        tree = client.get_tree(owner, repo, entry["sha"])
+    return _tree_blobs(tree).get(name)
+
+
+def fetch_github_tree_archive(
+    client: "GitHubClient",
+    owner: str,
+    repo: str,
+    commit_sha: str,
+    extra_files: Iterable[str] | None = None,
+    *,
+    workflow_files: list[str] | None = None,
+    prompt_files: list[str] | None = None,
+    agent_files: list[str] | None = None,
+    use_remote: bool = False,
+    max_concurrency: int = 1,
+) -> bytes:
+    """Download only the template files a sync needs through the Git Trees/Blobs API.
+
+    Instead of the full repository zipball, this walks the ``.github`` subtree of
+    ``commit_sha`` and fetches just the blobs that :func:`extract_github_directory`
+    would select for the same arguments (only the named files when workflows, prompts
+    or agents are given). The blobs are packed into a small uncompressed zip laid out
+    like a GitHub zipball, so it feeds the regular extraction pipeline unchanged.
+
+    Raises:
+        WorkflowSyncError: When the commit has no ``.github`` directory.
+        TruncatedTreeError: When the ``.github`` tree is too large for one recursive
+            listing; download the repository archive instead.
+    """
+
+    commit = client.get_git_commit(owner, repo, commit_sha)
+    root_tree = client.get_tree(owner, repo, commit["tree"]["sha"])
+    github_entry = next(
+        (item for item in root_tree.get("tree", []) if item.get("path") == ".github" and item.get("type") == "tree"),
+        None,
+    )
+    if github_entry is None:
+        raise WorkflowSyncError("Template repository does not contain a .github directory")
+    github_tree = client.get_tree(owner, repo, github_entry["sha"], recursive=True)
+    if github_tree.get("truncated"):
+        raise TruncatedTreeError(f"The .github tree of {owner}/{repo} is too large to list through the Git Trees API")
+    github_blobs = _tree_blobs(github_tree, prefix=".github/")
+
+    index: dict[str, Mapping[str, Any]] = dict(github_blobs)
+    if not (workflow_files or prompt_files or agent_files):
+        for extra in {path.lstrip("/") for path in (extra_files or [])}:
+            entry = _find_blob(client, owner, repo, root_tree, extra)
+            if entry is not None:
+                index[extra] = entry
+    selection = _select_members(
+        index,
+        extra_files,
+        workflow_files=workflow_files,
+        prompt_files=prompt_files,
+        agent_files=agent_files,
+        use_remote=use_remote,
+    )
+    selected = {source_path: index[source_path] for _, source_path, _ in selection}
+
+    paths = sorted(selected)
+    with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(paths)))) as executor:
+        contents = list(executor.map(lambda path: client.get_blob(owner, repo, selected[path]["sha"]), paths))
+
+    buffer = io.BytesIO()
+    prefix = f"{owner}-{repo}-{commit_sha[:7]}"
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_STORED) as archive:
+        for path, content in zip(paths, contents):
+            info = zipfile.ZipInfo(f"{prefix}/{path}")
+            info.external_attr = _ZIP_MODES.get(selected[path].get("mode"), 0o100644) << 16
+            archive.writestr(info, content)
+    return buffer.getvalue()
+
+
+def _open_archive(archive: ArchiveSource) -> zipfile.ZipFile:
+    if isinstance(archive, (bytes, bytearray, memoryview)):
+        return zipfile.ZipFile(io.BytesIO(archive))
+    return zipfile.ZipFile(archive)
+
+
+def _index_archive(archive: zipfile.ZipFile) -> dict[str, zipfile.ZipInfo]:
+    """Map repository-relative paths (top-level folder stripped) to archive members."""
+
+    index: dict[str, zipfile.ZipInfo] = {}
+    for info in archive.infolist():
+        if info.is_dir():
+            continue
+        _, separator, relative_path = info.filename.partition("/")
+        if separator and relative_path:
+            index[relative_path] = info
+    return index
+
+
+def _select_members(
+    index: Mapping[str, Any],
+    extra_files: Iterable[str] | None,
+    *,
+    workflow_files: list[str] | None,
+    prompt_files: list[str] | None,
+    agent_files: list[str] | None,
+    use_remote: bool,
+) -> list[tuple[str, str, bool]]:
+    """Pick the template files a sync writes, in ``index`` order.
+
+    ``index`` maps repository-relative template paths to their source (an archive
+    member or a tree entry). Returns ``(target_path, source_path, is_extra)`` tuples
+    where ``target_path`` is the repository-relative destination of ``source_path``.
+
+    Raises:
+        WorkflowSyncError: When the archive has no ``.github`` directory or a requested
+            file is missing.
+    """
+
+    if not any(path.startswith(".github/") for path in index):
+        raise WorkflowSyncError("Template archive does not contain a .github directory")
+
+    order = {path: position for position, path in enumerate(index)}
+    selected: list[tuple[str, str, bool]] = []
+
+    # 特定ファイル指定モード（workflows, prompts, agents のいずれかが指定されている）🎯
+    if workflow_files or prompt_files or agent_files:
+        workflow_dirs = ["workflows_remote", "workflows"] if use_remote else ["workflows", "workflows_remote"]
+        for wf_file in workflow_files or []:
+            for directory in workflow_dirs:
+                source_path = f".github/{directory}/{wf_file}"
+                if source_path in index:
+                    # workflows_remote からの場合も workflows にコピー
+                    selected.append((f".github/workflows/{wf_file}", source_path, False))
+                    break
+            else:
+                raise WorkflowSyncError(
+                    f"Workflow file '{wf_file}' not found in .github/workflows"
+                    f"{' or .github/workflows_remote' if use_remote else ''}"
+                )
+        for prompt_file in prompt_files or []:
+            source_path = f".github/prompts/{prompt_file}"
+            if source_path not in index:
+                raise WorkflowSyncError(f"Prompt file '{prompt_file}' not found in .github/prompts")
+            selected.append((source_path, source_path, False))
+        for agent_file in agent_files or []:
+            source_path = f".github/agents/{agent_file}"
+            if source_path not in index:
+                raise WorkflowSyncError(f"Agent file '{agent_file}' not found in .github/agents")
+            selected.append((source_path, source_path, False))
+        return sorted(selected, key=lambda item: order[item[1]])
+
+    # .github 全体のコピー
+    for source_path in index:
+        if not source_path.startswith(".github/"):
+            continue
+        target_path = source_path
+        if use_remote:
+            if source_path.startswith(".github/workflows_remote/"):
+                # workflows_remote 内の .yml だけを workflows に変換し、それ以外はスキップ
+                if not source_path.endswith(".yml"):
+                    continue
+                target_path = f".github/workflows/{source_path.rsplit('/', 1)[-1]}"
+            elif source_path.startswith(".github/scripts/"):
+                continue
+        selected.append((target_path, source_path, False))
+
+    extras = {path.lstrip("/") for path in (extra_files or [])}
+    missing_extras = sorted(path for path in extras if path not in index)
+    if missing_extras:
+        raise WorkflowSyncError(
+            f"Template archive does not contain the expected files: {', '.join(missing_extras)}"
+        )
+    selected.extend((path, path, True) for path in extras)
+    return sorted(selected, key=lambda item: order[item[1]])
+
+
+def _git_mode(info: zipfile.ZipInfo) -> str:
+    # The upper 16 bits of ``external_attr`` hold the Unix mode of the archived file
+    mode = info.external_attr >> 16
+    if stat.S_ISLNK(mode):
+        # シンボリックリンクの中身はリンク先パスなので、そのまま 120000 の blob にする
+        return "120000"
+    return "100755" if mode & 0o111 else "100644"
+
+
+def iter_github_files(
+    archive: ArchiveSource,
+    extra_files: Iterable[str] | None = None,
+    *,
+    workflow_files: list[str] | None = None,
+    prompt_files: list[str] | None = None,
+    agent_files: list[str] | None = None,
+    use_remote: bool = False,
+) -> Iterator[tuple[str, str, bytes]]:
+    """Yield ``(relative_path, git_mode, content)`` for every template file a sync selects.
+
+    The selection matches :func:`extract_github_directory` for the same arguments, but
+    files are read straight from the archive without touching the filesystem. The mode
+    (``"100644"`` or ``"100755"``) comes from the Unix permissions stored in the zip.
+    """
+
+    with _open_archive(archive) as zip_archive:
+        index = _index_archive(zip_archive)
+        selection = _select_members(
+            index,
+            extra_files,
+            workflow_files=workflow_files,
+            prompt_files=prompt_files,
+            agent_files=agent_files,
+            use_remote=use_remote,
+        )
+        for relative_path, source_path, _ in selection:
+            info = index[source_path]
+            yield relative_path, _git_mode(info), zip_archive.read(info)
+
+
 def extract_github_directory(
-    archive_bytes: bytes,
+    archive: ArchiveSource,
     destination: Path,
     clean: bool = False,
     extra_files: Iterable[str] | None = None,
@@ -35,11 +292,14 @@ def extract_github_directory(
     prompt_files: list[str] | None = None,
     agent_files: list[str] | None = None,
     use_remote: bool = False,
+    previous_hashes: Mapping[str, str] | None = None,
 ) -> ExtractionResult:
     """Extract the ``.github`` directory from a zip archive into ``destination``.
 
     Args:
-        archive_bytes: Raw bytes of a GitHub ``zipball`` response.
+        archive: A GitHub ``zipball`` as raw bytes, a path, or a seekable file object.
+            Paths and file objects are read in place without buffering the whole
+            archive in memory.
         destination: Base directory to extract into.
         clean: When True the existing ``.github`` directory is removed before
             writing new files.
@@ -56,6 +316,11 @@ def extract_github_directory(
         agent_files: Optional list of agent file names to extract from .github/agents directory.
         use_remote: When True with workflow_file(s), prefer workflows_remote over workflows
             directory.
+        previous_hashes: Blob SHAs recorded by the previous sync (see
+            :class:`~gemini_actions_lab_cli.manifest.SyncManifest`). When given, files
+            whose content already matches the template are left untouched, and existing
+            files that still match the recorded hash are updated even without the
+            overwrite flags because they were not modified locally.
 
     Returns:
         An :class:`ExtractionResult` describing which files were written and which were
@@ -64,206 +329,69 @@ def extract_github_directory(
 
     destination = destination.expanduser().resolve()
     github_root = destination / ".github"
-    extras = {path.lstrip("/") for path in (extra_files or [])}
-    extras_found: set[str] = set()
-    skipped_existing: list[Path] = []
-
-    with zipfile.ZipFile(io.BytesIO(archive_bytes)) as archive:
-        top_level_prefix = None
-        for member in archive.namelist():
-            if member.endswith("/"):
-                continue
-            if top_level_prefix is None:
-                top_level_prefix = member.split("/", 1)[0]
-            if member.startswith(f"{top_level_prefix}/.github/"):
-                break
-        else:
-            raise WorkflowSyncError("Template archive does not contain a .github directory")
-        
-        # 複数ワークフローファイル指定時の処理 🎯
-        target_workflows = workflow_files or ([workflow_file] if workflow_file else None)
-        target_prompts = prompt_files
-        target_agents = agent_files
-
-        # 特定ファイル指定モード（workflows, prompts, agents のいずれかが指定されている）
-        specific_files_mode = bool(target_workflows or target_prompts or target_agents)
-
-        found_workflows: dict[str, str] = {}  # filename -> archive_path
-        found_prompts: dict[str, str] = {}    # filename -> archive_path
-        found_agents: dict[str, str] = {}     # filename -> archive_path
-
-        if target_workflows:
-            # 各ワークフローファイルのパスを検索
-            for wf_file in target_workflows:
-                workflow_paths = []
-                if use_remote:
-                    # workflows_remote を優先
-                    workflow_paths = [
-                        f"{top_level_prefix}/.github/workflows_remote/{wf_file}",
-                        f"{top_level_prefix}/.github/workflows/{wf_file}",
-                    ]
-                else:
-                    # workflows を優先
-                    workflow_paths = [
-                        f"{top_level_prefix}/.github/workflows/{wf_file}",
-                        f"{top_level_prefix}/.github/workflows_remote/{wf_file}",
-                    ]
-
-                found = None
-                for wf_path in workflow_paths:
-                    if wf_path in archive.namelist():
-                        found = wf_path
-                        break
-
-                if found:
-                    found_workflows[wf_file] = found
-                else:
-                    raise WorkflowSyncError(
-                        f"Workflow file '{wf_file}' not found in .github/workflows"
-                        f"{' or .github/workflows_remote' if use_remote else ''}"
-                    )
-
-        if target_prompts:
-            # 各プロンプトファイルのパスを検索
-            for prompt_file in target_prompts:
-                prompt_path = f"{top_level_prefix}/.github/prompts/{prompt_file}"
-                if prompt_path in archive.namelist():
-                    found_prompts[prompt_file] = prompt_path
-                else:
-                    raise WorkflowSyncError(
-                        f"Prompt file '{prompt_file}' not found in .github/prompts"
-                    )
-
-        if target_agents:
-            # 各エージェントファイルのパスを検索
-            for agent_file in target_agents:
-                agent_path = f"{top_level_prefix}/.github/agents/{agent_file}"
-                if agent_path in archive.namelist():
-                    found_agents[agent_file] = agent_path
-                else:
-                    raise WorkflowSyncError(
-                        f"Agent file '{agent_file}' not found in .github/agents"
-                    )
+    target_workflows = workflow_files or ([workflow_file] if workflow_file else None)
+
+    with _open_archive(archive) as zip_archive:
+        index = _index_archive(zip_archive)
+        selection = _select_members(
+            index,
+            extra_files,
+            workflow_files=target_workflows,
+            prompt_files=prompt_files,
+            agent_files=agent_files,
+            use_remote=use_remote,
+        )
 
         if clean and github_root.exists():
             shutil.rmtree(github_root)
 
-        written: list[Path] = []
-        for member in archive.namelist():
-            if member.endswith("/"):
-                continue
-
-            # 特定ファイル指定モード時は、指定されたファイルだけを処理 🎯
-            if specific_files_mode:
-                processed = False
-
-                # ワークフローファイルのチェック
-                for wf_file, wf_path in found_workflows.items():
-                    if member == wf_path:
-                        # workflows_remote からの場合は workflows にコピー
-                        if "workflows_remote" in member:
-                            relative_path = f".github/workflows/{wf_file}"
-                        else:
-                            relative_path = member[len(f"{top_level_prefix}/"):]
-                        target_path = destination / relative_path
-                        target_path.parent.mkdir(parents=True, exist_ok=True)
-                        if not overwrite_existing and target_path.exists():
-                            skipped_existing.append(target_path)
-                        else:
-                            with archive.open(member) as source, open(target_path, "wb") as dest:
-                                shutil.copyfileobj(source, dest)
-                            written.append(target_path)
-                        processed = True
-                        break
-
-                # プロンプトファイルのチェック
-                if not processed:
-                    for prompt_file, prompt_path in found_prompts.items():
-                        if member == prompt_path:
-                            relative_path = f".github/prompts/{prompt_file}"
-                            target_path = destination / relative_path
-                            target_path.parent.mkdir(parents=True, exist_ok=True)
-                            if not overwrite_existing and target_path.exists():
-                                skipped_existing.append(target_path)
-                            else:
-                                with archive.open(member) as source, open(target_path, "wb") as dest:
-                                    shutil.copyfileobj(source, dest)
-                                written.append(target_path)
-                            processed = True
-                            break
-
-                # エージェントファイルのチェック
-                if not processed:
-                    for agent_file, agent_path in found_agents.items():
-                        if member == agent_path:
-                            relative_path = f".github/agents/{agent_file}"
-                            target_path = destination / relative_path
-                            target_path.parent.mkdir(parents=True, exist_ok=True)
-                            if not overwrite_existing and target_path.exists():
-                                skipped_existing.append(target_path)
-                            else:
-                                with archive.open(member) as source, open(target_path, "wb") as dest:
-                                    shutil.copyfileobj(source, dest)
-                                written.append(target_path)
-                            processed = True
-                            break
-
-                # 処理されなかった場合はスキップ
-                if not processed:
-                    continue
-
+        result = ExtractionResult(written=[], skipped_existing=[])
+        for relative_path, source_path, is_extra in selection:
+            target_path = destination / relative_path
+            overwrite = overwrite_extras if is_extra else overwrite_existing
+            if previous_hashes is not None:
+                _extract_incremental(
+                    zip_archive.read(index[source_path]),
+                    relative_path,
+                    target_path,
+                    previous_hashes.get(relative_path),
+                    overwrite,
+                    result,
+                )
                 continue
-            
-            # 既存のロジック：.github 全体のコピー
-            if member.startswith(f"{top_level_prefix}/.github/"):
-                relative_path = member[len(f"{top_level_prefix}/"):]
-
-                # --use-remote の場合の特別な処理
-                if use_remote:
-                    # workflows_remote 内のワークフローを workflows にコピー
-                    if relative_path.startswith(".github/workflows_remote/") and relative_path.endswith(".yml"):
-                        # workflows_remote/ を workflows/ に変換
-                        workflow_file = relative_path.split("/")[-1]
-                        relative_path = f".github/workflows/{workflow_file}"
-                        target_path = destination / relative_path
-                    # workflows_remote ディレクトリそのものはスキップ
-                    elif relative_path.startswith(".github/workflows_remote/"):
-                        continue
-                    # scripts ディレクトリはスキップ
-                    elif relative_path.startswith(".github/scripts/"):
-                        continue
-                    else:
-                        target_path = destination / relative_path
-                else:
-                    target_path = destination / relative_path
-
-                is_github_file = True
-            else:
-                relative_repo_path = member[len(f"{top_level_prefix}/"):]
-                if relative_repo_path not in extras:
-                    continue
-                target_path = destination / relative_repo_path
-                extras_found.add(relative_repo_path)
-                if not overwrite_extras and target_path.exists():
-                    # Keep the existing file intact when extras are optional
-                    skipped_existing.append(target_path)
-                    continue
-                is_github_file = False
-            if is_github_file and not overwrite_existing and target_path.exists():
-                skipped_existing.append(target_path)
+            if not overwrite and target_path.exists():
+                result.skipped_existing.append(target_path)
                 continue
             target_path.parent.mkdir(parents=True, exist_ok=True)
-            with archive.open(member) as source, open(target_path, "wb") as dest:
+            with zip_archive.open(index[source_path]) as source, open(target_path, "wb") as dest:
                 shutil.copyfileobj(source, dest)
-            written.append(target_path)
-
-        # extra_files のチェックは特定ファイル指定時はスキップ 🎯
-        if not specific_files_mode:
-            missing_extras = extras - extras_found
-            if missing_extras:
-                missing_repr = ", ".join(sorted(missing_extras))
-                raise WorkflowSyncError(
-                    f"Template archive does not contain the expected files: {missing_repr}"
-                )
-
-    return ExtractionResult(written=written, skipped_existing=skipped_existing)
+            result.written.append(target_path)
+
+    return result
+
+
+def _extract_incremental(
+    content: bytes,
+    relative_path: str,
+    target_path: Path,
+    previous_sha: str | None,
+    overwrite: bool,
+    result: ExtractionResult,
+) -> None:
+    template_sha = git_blob_sha(content)
+    if target_path.exists():
+        local_sha = git_blob_sha(target_path.read_bytes())
+        if local_sha == template_sha:
+            result.unchanged.append(target_path)
+            result.file_hashes[relative_path] = template_sha
+            return
+        # 前回の同期内容から変更されていなければテンプレート側の更新を反映する 🎯
+        if not overwrite and local_sha != previous_sha:
+            result.skipped_existing.append(target_path)
+            if previous_sha is not None:
+                result.file_hashes[relative_path] = previous_sha
+            return
+    target_path.parent.mkdir(parents=True, exist_ok=True)
+    target_path.write_bytes(content)
+    result.written.append(target_path)
+    result.file_hashes[relative_path] = template_sha
@@ -19,7 +19,15 @@ if "requests" not in sys.modules:
     def _request(*_args: object, **_kwargs: object) -> None:  # pragma: no cover - safeguard
         raise RuntimeError("requests stub called during tests")
 
+    class _RequestException(IOError):
+        pass
+
+    class _ConnectionError(_RequestException):
+        pass
+
     requests_stub.request = _request  # type: ignore[attr-defined]
+    requests_stub.RequestException = _RequestException  # type: ignore[attr-defined]
+    requests_stub.ConnectionError = _ConnectionError  # type: ignore[attr-defined]
     sys.modules["requests"] = requests_stub
 
 
@@ -0,0 +1,56 @@
+"""Tests for the template archive cache."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from gemini_actions_lab_cli.archive_cache import ArchiveCache, default_cache_dir
+
+
+class TestArchiveCache:
+    """Behaviour tests for ``ArchiveCache``."""
+
+    def test_miss_then_hit(self, tmp_path: Path) -> None:
+        cache = ArchiveCache(tmp_path)
+
+        assert cache.get("Owner", "Repo", "a" * 40) is None
+        path = cache.store("Owner", "Repo", "a" * 40, lambda handle: handle.write(b"zip-bytes"))
+
+        assert path == tmp_path / "owner" / "repo" / f"{'a' * 40}.zip"
+        assert cache.get("owner", "repo", "a" * 40) == path
+        assert path.read_bytes() == b"zip-bytes"
+
+    def test_failed_write_leaves_no_entry(self, tmp_path: Path) -> None:
+        cache = ArchiveCache(tmp_path)
+
+        def broken(handle) -> None:
+            handle.write(b"partial")
+            raise RuntimeError("connection reset")
+
+        with pytest.raises(RuntimeError):
+            cache.store("owner", "repo", "b" * 40, broken)
+
+        assert cache.get("owner", "repo", "b" * 40) is None
+        assert list((tmp_path / "owner" / "repo").iterdir()) == []
+
+    def test_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        cache = ArchiveCache(tmp_path, max_bytes=25)
+        old = cache.store("owner", "repo", "1" * 40, lambda handle: handle.write(b"x" * 10))
+        recent = cache.store("owner", "repo", "2" * 40, lambda handle: handle.write(b"x" * 10))
+        os.utime(old, (1, 1))
+        os.utime(recent, (2, 2))
+        cache.get("owner", "repo", "1" * 40)
+
+        newest = cache.store("owner", "repo", "3" * 40, lambda handle: handle.write(b"x" * 10))
+
+        assert old.exists()
+        assert not recent.exists()
+        assert newest.exists()
+
+    def test_default_dir_honours_xdg_cache_home(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+        assert default_cache_dir() == tmp_path / "gal" / "archives"
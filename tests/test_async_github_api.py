@@ -0,0 +1,144 @@
+"""Tests for the asyncio GitHub REST API client."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest import mock
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from gemini_actions_lab_cli import async_github_api, github_api
+from gemini_actions_lab_cli.async_github_api import AsyncGitHubClient
+from gemini_actions_lab_cli.github_api import GitHubError
+
+
+def _client(handler, **options: object) -> AsyncGitHubClient:
+    scheduler = github_api.RateLimitScheduler(jitter=lambda: 0.0)
+    options.setdefault("public_keys", github_api.PublicKeyCache())
+    return AsyncGitHubClient(token="secret", transport=httpx.MockTransport(handler), scheduler=scheduler, **options)
+
+
+class TestAsyncGitHubClient:
+    """Request handling of ``AsyncGitHubClient``."""
+
+    def test_git_data_round_trip(self) -> None:
+        seen: list[tuple[str, str, object]] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            body = json.loads(request.content) if request.content else None
+            seen.append((request.method, request.url.path, body))
+            assert request.headers["Authorization"] == "Bearer secret"
+            if request.url.path.endswith("/git/ref/heads/main"):
+                return httpx.Response(200, json={"object": {"sha": "a" * 40}})
+            if request.url.path.endswith("/git/blobs"):
+                return httpx.Response(201, json={"sha": "b" * 40})
+            if request.url.path.endswith("/git/trees"):
+                return httpx.Response(201, json={"sha": "c" * 40})
+            if request.url.path.endswith("/git/commits"):
+                return httpx.Response(201, json={"sha": "d" * 40})
+            return httpx.Response(200, json={})
+
+        async def run() -> None:
+            async with _client(handler) as client:
+                ref = await client.get_ref("owner", "repo", "heads/main")
+                blobs = await asyncio.gather(*(client.create_blob("owner", "repo", data) for data in (b"x", b"y")))
+                tree = await client.create_tree("owner", "repo", [], base_tree=ref["object"]["sha"])
+                commit = await client.create_commit("owner", "repo", "msg", tree["sha"], [ref["object"]["sha"]])
+                await client.update_ref("owner", "repo", "main", commit["sha"])
+                assert blobs == ["b" * 40, "b" * 40]
+
+        asyncio.run(run())
+
+        assert seen[-1] == ("PATCH", "/repos/owner/repo/git/refs/heads/main", {"sha": "d" * 40, "force": False})
+        assert seen[3][2] == {"tree": [], "base_tree": "a" * 40}
+
+    def test_retries_server_errors(self) -> None:
+        statuses = iter([502, 200])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(next(statuses), json={"default_branch": "main"})
+
+        async def run() -> str:
+            async with _client(handler) as client:
+                branch = await client.get_default_branch("owner", "repo")
+                assert client.scheduler.metrics()["retries"] == 1
+                return branch
+
+        assert asyncio.run(run()) == "main"
+
+    def test_error_status_raises(self) -> None:
+        async def run() -> None:
+            async with _client(lambda request: httpx.Response(404, text="Not Found")) as client:
+                await client.get_repository("owner", "repo")
+
+        with pytest.raises(GitHubError) as excinfo:
+            asyncio.run(run())
+
+        assert excinfo.value.status == 404
+
+    def test_put_actions_secrets_fans_out_with_one_key_fetch(self) -> None:
+        calls: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(f"{request.method} {request.url.path}")
+            if request.method == "GET":
+                return httpx.Response(200, json={"key_id": "kid", "key": "pk"})
+            return httpx.Response(201)
+
+        async def run() -> dict[str, int]:
+            async with _client(handler) as client:
+                return await client.put_actions_secrets("owner", "repo", {"A": "1", "B": "2"})
+
+        with mock.patch.object(async_github_api, "encrypt_secret", return_value="enc"):
+            statuses = asyncio.run(run())
+
+        assert statuses == {"A": 201, "B": 201}
+        assert calls.count("GET /repos/owner/repo/actions/secrets/public-key") == 1
+        assert sorted(calls[1:]) == [
+            "PUT /repos/owner/repo/actions/secrets/A",
+            "PUT /repos/owner/repo/actions/secrets/B",
+        ]
+
+    def test_concurrent_key_lookups_share_one_fetch(self) -> None:
+        calls: list[str] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.path)
+            await asyncio.sleep(0)  # let the other lookups reach the cache first
+            return httpx.Response(200, json={"key_id": "kid", "key": "pk"})
+
+        async def run() -> list[github_api.SecretPublicKey]:
+            async with _client(handler) as client:
+                repo_keys = [client.get_secret_public_key("owner", "repo") for _ in range(5)]
+                org_keys = [client.get_org_secret_public_key("org") for _ in range(5)]
+                return await asyncio.gather(*repo_keys, *org_keys)
+
+        keys = asyncio.run(run())
+
+        assert {key.key_id for key in keys} == {"kid"}
+        assert calls == ["/repos/owner/repo/actions/secrets/public-key", "/orgs/org/actions/secrets/public-key"]
+
+    def test_rotated_key_is_refetched_once(self) -> None:
+        key_ids = iter(["old", "new"])
+        gets: list[str] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0)
+            if request.method == "GET":
+                gets.append(request.url.path)
+                return httpx.Response(200, json={"key_id": next(key_ids), "key": "pk"})
+            key_id = json.loads(request.content)["key_id"]
+            return httpx.Response(422 if key_id == "old" else 204)
+
+        async def run() -> dict[str, int]:
+            async with _client(handler) as client:
+                return await client.put_actions_secrets("owner", "repo", {"A": "1", "B": "2"})
+
+        with mock.patch.object(async_github_api, "encrypt_secret", return_value="enc"):
+            statuses = asyncio.run(run())
+
+        assert statuses == {"A": 204, "B": 204}
+        assert len(gets) == 2
@@ -0,0 +1,313 @@
+"""Tests for the GitHub REST API client."""
+
+from __future__ import annotations
+
+import io
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+
+from gemini_actions_lab_cli import github_api
+from gemini_actions_lab_cli.github_api import GitHubClient, GitHubError, git_blob_sha
+
+
+def _response(status: int = 200, payload: object | None = None) -> mock.Mock:
+    response = mock.Mock()
+    response.status_code = status
+    response.headers = {}
+    response.json.return_value = payload if payload is not None else {}
+    response.text = ""
+    return response
+
+
+@pytest.fixture
+def requests_module() -> mock.Mock:
+    """Replace the ``requests`` module used by the client with a mock."""
+    module = mock.Mock()
+    with mock.patch.object(github_api, "requests", module):
+        yield module
+
+
+class TestGitHubClientSession:
+    """Connection pooling behaviour of ``GitHubClient``."""
+
+    def test_reuses_single_session(self, requests_module: mock.Mock) -> None:
+        session = requests_module.Session.return_value
+        session.request.return_value = _response(payload={"default_branch": "main"})
+        client = GitHubClient(token="secret", pool_size=4)
+
+        client.get_repository("owner", "repo")
+        client.get_repository("owner", "repo")
+
+        requests_module.Session.assert_called_once_with()
+        assert session.request.call_count == 2
+        requests_module.adapters.HTTPAdapter.assert_called_once_with(
+            pool_connections=2, pool_maxsize=4, pool_block=False
+        )
+
+    def test_headers_attached_once_to_session(self, requests_module: mock.Mock) -> None:
+        session = requests_module.Session.return_value
+        session.request.return_value = _response(payload={})
+        client = GitHubClient(token="secret")
+
+        client.get_repository("owner", "repo")
+
+        session.headers.update.assert_called_once()
+        headers = session.headers.update.call_args[0][0]
+        assert headers["Authorization"] == "Bearer secret"
+        assert "headers" not in session.request.call_args.kwargs
+
+    def test_context_manager_closes_session(self, requests_module: mock.Mock) -> None:
+        session = requests_module.Session.return_value
+        session.request.return_value = _response(payload={})
+
+        with GitHubClient() as client:
+            client.get_repository("owner", "repo")
+
+        session.close.assert_called_once_with()
+
+    def test_error_status_raises(self, requests_module: mock.Mock) -> None:
+        session = requests_module.Session.return_value
+        session.request.return_value = _response(status=404)
+        client = GitHubClient()
+
+        with pytest.raises(GitHubError) as excinfo:
+            client.get_repository("owner", "repo")
+
+        assert excinfo.value.status == 404
+
+
+class TestRepositoryArchive:
+    """Streaming download of repository archives."""
+
+    def test_streams_chunks_into_file_object(self, requests_module: mock.Mock) -> None:
+        response = mock.MagicMock()
+        response.status_code = 200
+        response.headers = {}
+        response.__enter__.return_value = response
+        response.iter_content.return_value = [b"PK", b"\x03\x04", b"rest"]
+        requests_module.Session.return_value.request.return_value = response
+        destination = io.BytesIO()
+
+        written = GitHubClient().stream_repository_archive("owner", "repo", destination, ref="main")
+
+        assert written == 8
+        assert destination.getvalue() == b"PK\x03\x04rest"
+        args, kwargs = requests_module.Session.return_value.request.call_args
+        assert args == ("GET", "https://api.github.com/repos/owner/repo/zipball/main")
+        assert kwargs["stream"] is True
+        response.__exit__.assert_called_once()
+
+
+class TestListRepositories:
+    """Paginated repository listing."""
+
+    def test_follows_pages_and_falls_back_to_user(self, requests_module: mock.Mock) -> None:
+        full_page = [{"name": f"repo{i}"} for i in range(github_api.PAGE_SIZE)]
+        requests_module.Session.return_value.request.side_effect = [
+            _response(status=404),
+            _response(payload=full_page),
+            _response(payload=[{"name": "last"}]),
+        ]
+
+        repos = GitHubClient().list_repositories("someone")
+
+        assert len(repos) == github_api.PAGE_SIZE + 1
+        calls = requests_module.Session.return_value.request.call_args_list
+        assert calls[0].args[1].endswith("/orgs/someone/repos")
+        assert calls[2].args[1].endswith("/users/someone/repos")
+        assert calls[2].kwargs["params"]["page"] == 2
+
+    def test_lists_private_repositories_of_the_authenticated_user(self, requests_module: mock.Mock) -> None:
+        requests_module.Session.return_value.request.side_effect = [
+            _response(status=404),
+            _response(payload={"login": "Someone"}),
+            _response(payload=[{"name": "private", "private": True}]),
+        ]
+
+        repos = GitHubClient(token="t").list_repositories("someone")
+
+        assert repos == [{"name": "private", "private": True}]
+        calls = requests_module.Session.return_value.request.call_args_list
+        assert calls[1].args[1].endswith("/user")
+        assert calls[2].args[1].endswith("/user/repos")
+        assert calls[2].kwargs["params"]["affiliation"] == "owner"
+
+
+class TestResolveBranchHeads:
+    """Batched GraphQL lookup of branch tips."""
+
+    def test_batches_repositories_and_skips_unresolved(self, requests_module: mock.Mock) -> None:
+        def head(index: int) -> dict:
+            return {"ref": {"name": "main", "target": {"oid": f"c{index}", "tree": {"oid": f"t{index}"}}}}
+
+        first = {f"r{i}": head(i) for i in range(github_api.GRAPHQL_BATCH_SIZE)}
+        first["r1"] = None
+        second = {"r0": {"ref": None}}
+        session = requests_module.Session.return_value
+        session.request.side_effect = [_response(payload={"data": first}), _response(payload={"data": second})]
+        repos = [f"owner/repo{i}" for i in range(github_api.GRAPHQL_BATCH_SIZE + 1)]
+
+        heads = GitHubClient(token="t").resolve_branch_heads(repos)
+
+        assert session.request.call_count == 2
+        assert len(heads) == github_api.GRAPHQL_BATCH_SIZE - 1
+        assert heads["owner/repo0"] == github_api.BranchHead("main", "c0", "t0")
+        assert "owner/repo1" not in heads
+        args, kwargs = session.request.call_args_list[0]
+        assert args == ("POST", "https://api.github.com/graphql")
+        assert "defaultBranchRef" in kwargs["json"]["query"]
+        assert kwargs["json"]["variables"]["n2"] == "repo2"
+
+    def test_named_branch_and_enterprise_endpoint(self, requests_module: mock.Mock) -> None:
+        session = requests_module.Session.return_value
+        session.request.return_value = _response(payload={"data": {}})
+
+        GitHubClient(api_url="https://ghe.example/api/v3").resolve_branch_heads(["o/r"], "dev")
+
+        args, kwargs = session.request.call_args
+        assert args[1] == "https://ghe.example/api/graphql"
+        assert kwargs["json"]["variables"]["ref"] == "refs/heads/dev"
+
+    def test_errors_without_data_raise(self, requests_module: mock.Mock) -> None:
+        requests_module.Session.return_value.request.return_value = _response(
+            payload={"errors": [{"message": "Bad credentials"}]}
+        )
+
+        with pytest.raises(GitHubError, match="Bad credentials"):
+            GitHubClient().graphql("query { viewer { login } }")
+
+
+class TestPublicKeyCache:
+    """TTL caching of Actions secret public keys."""
+
+    def test_fetches_once_within_ttl(self) -> None:
+        now = [0.0]
+        cache = github_api.PublicKeyCache(ttl=60, clock=lambda: now[0])
+        fetch = mock.Mock(return_value={"key_id": "kid", "key": "pk"})
+
+        first = cache.get("repo", fetch)
+        second = cache.get("repo", fetch)
+        now[0] = 61
+        third = cache.get("repo", fetch)
+
+        assert first is second
+        assert third is not first
+        assert fetch.call_count == 2
+
+    def test_stale_key_id_forces_refetch_once(self) -> None:
+        cache = github_api.PublicKeyCache()
+        fetch = mock.Mock(side_effect=[{"key_id": "old", "key": "pk"}, {"key_id": "new", "key": "pk2"}])
+
+        cache.get("repo", fetch)
+        refreshed = cache.get("repo", fetch, stale_key_id="old")
+        again = cache.get("repo", fetch, stale_key_id="old")
+
+        assert refreshed.key_id == again.key_id == "new"
+        assert fetch.call_count == 2
+
+    def test_unchanged_key_is_refetched_once_per_report(self) -> None:
+        cache = github_api.PublicKeyCache()
+        fetch = mock.Mock(return_value={"key_id": "kid", "key": "pk"})
+
+        cache.get("repo", fetch)
+        refreshed = cache.get("repo", fetch, stale_key_id="kid")
+        again = cache.get("repo", fetch, stale_key_id="kid")
+
+        assert refreshed is again
+        assert fetch.call_count == 2
+
+    def test_client_shares_process_wide_cache(self, requests_module: mock.Mock) -> None:
+        session = requests_module.Session.return_value
+        session.request.return_value = _response(payload={"key_id": "kid", "key": "pk"})
+        cache = github_api.PublicKeyCache()
+
+        GitHubClient(public_keys=cache).get_secret_public_key("Owner", "Repo")
+        key = GitHubClient(public_keys=cache).get_secret_public_key("owner", "repo")
+
+        assert key.key_id == "kid"
+        assert session.request.call_count == 1
+
+
+class TestRateLimitScheduler:
+    """Retry and pacing behaviour driven by rate-limit headers."""
+
+    @staticmethod
+    def _scheduler(now: list[float], sleeps: list[float], **options: object) -> github_api.RateLimitScheduler:
+        def sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+            now[0] += seconds
+
+        return github_api.RateLimitScheduler(clock=lambda: now[0], sleep=sleep, jitter=lambda: 0.5, **options)
+
+    def test_retries_server_errors_with_jittered_backoff(self, requests_module: mock.Mock) -> None:
+        now, sleeps = [1000.0], []
+        session = requests_module.Session.return_value
+        session.request.side_effect = [_response(status=502), _response(status=503), _response(payload={"id": 1})]
+        client = GitHubClient(scheduler=self._scheduler(now, sleeps))
+
+        assert client.get_repository("owner", "repo") == {"id": 1}
+
+        assert sleeps == [0.5, 1.0]
+        assert client.scheduler.metrics()["retries"] == 2
+
+    def test_secondary_limit_honours_retry_after_for_all_threads(self, requests_module: mock.Mock) -> None:
+        now, sleeps = [1000.0], []
+        limited = _response(status=403)
+        limited.headers = {"Retry-After": "30"}
+        limited.text = "You have exceeded a secondary rate limit"
+        session = requests_module.Session.return_value
+        session.request.side_effect = [limited, _response(payload={})]
+        scheduler = self._scheduler(now, sleeps)
+
+        GitHubClient(scheduler=scheduler).get_repository("owner", "repo")
+
+        assert sleeps == [30.0]
+        assert scheduler.retry_delay(0, 403, {"Retry-After": "5"}) == 5.0
+        assert scheduler.pacing_delay() == 5.0
+
+    def test_paces_requests_when_budget_runs_low(self) -> None:
+        now, sleeps = [1000.0], []
+        scheduler = self._scheduler(now, sleeps)
+
+        scheduler.update({"X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "100", "X-RateLimit-Reset": "1200"})
+        assert scheduler.pacing_delay() == 2.0
+        scheduler.update({"X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1200"})
+        assert scheduler.pacing_delay() == 200.0
+        assert scheduler.metrics()["remaining"] == 0
+
+    def test_concurrent_callers_get_distinct_slots(self) -> None:
+        now, sleeps = [1000.0], []
+        scheduler = self._scheduler(now, sleeps)
+        scheduler.update({"X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "100", "X-RateLimit-Reset": "2000"})
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            delays = sorted(executor.map(lambda _: scheduler.pacing_delay(), range(16)))
+
+        assert delays == [10.0 * (slot + 1) for slot in range(16)]
+
+    def test_gives_up_after_max_retries(self, requests_module: mock.Mock) -> None:
+        now, sleeps = [1000.0], []
+        requests_module.Session.return_value.request.return_value = _response(status=500)
+        client = GitHubClient(scheduler=self._scheduler(now, sleeps, max_retries=2))
+
+        with pytest.raises(GitHubError) as excinfo:
+            client.get_repository("owner", "repo")
+
+        assert excinfo.value.status == 500
+        assert len(sleeps) == 2
+
+    def test_permission_errors_are_not_retried(self) -> None:
+        scheduler = github_api.RateLimitScheduler()
+
+        assert scheduler.retry_delay(0, 403, {}, "Resource not accessible by integration") is None
+        assert scheduler.retry_delay(0, 422, {}) is None
+
+
+class TestGitBlobSha:
+    """Tests for the local Git blob hash helper."""
+
+    def test_matches_git_hash_object(self) -> None:
+        assert git_blob_sha(b"hello\n") == "ce013625030ba8dba906f756967f9e9ca394464a"
+        assert git_blob_sha(b"") == "e69de29bb2d1d6434b8b29ae775ad8c2e48c5391"
@@ -0,0 +1,92 @@
+"""Tests for the conditional-request HTTP cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from gemini_actions_lab_cli import github_api
+from gemini_actions_lab_cli.github_api import GitHubClient
+from gemini_actions_lab_cli.disk_cache import BoundedDirectory
+from gemini_actions_lab_cli.http_cache import CachedResponse, HttpCache
+
+
+def _response(status: int = 200, payload: object | None = None, headers: dict[str, str] | None = None) -> mock.Mock:
+    response = mock.Mock()
+    response.status_code = status
+    response.headers = headers or {}
+    response.json.return_value = payload
+    response.text = ""
+    return response
+
+
+@pytest.fixture
+def session() -> mock.Mock:
+    module = mock.Mock()
+    with mock.patch.object(github_api, "requests", module):
+        yield module.Session.return_value
+
+
+class TestHttpCache:
+    """Storage and eviction of cached responses."""
+
+    def test_round_trip_and_token_scoped_keys(self, tmp_path: Path) -> None:
+        cache = HttpCache(tmp_path)
+        key = cache.key("https://api.github.com/repos/o/r", None, "token-a")
+
+        cache.store(key, CachedResponse(body={"id": 1}, etag='"abc"'))
+
+        assert cache.get(key) == CachedResponse(body={"id": 1}, etag='"abc"')
+        assert cache.key("https://api.github.com/repos/o/r", None, "token-b") != key
+
+    def test_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        cache = HttpCache(tmp_path, max_bytes=120)
+        for index in range(4):
+            cache.store(f"{index:02d}entry", CachedResponse(body="x" * 40, etag=str(index)))
+
+        assert cache.get("00entry") is None
+        assert cache.get("03entry") is not None
+
+
+    def test_scans_directory_only_when_over_the_limit(self, tmp_path: Path) -> None:
+        cache = HttpCache(tmp_path, max_bytes=1000)
+
+        with mock.patch.object(BoundedDirectory, "evict", autospec=True, side_effect=BoundedDirectory.evict) as evict:
+            for index in range(5):
+                cache.store(f"{index:02d}entry", CachedResponse(body="x" * 40))
+            # The first write learns the total; later ones only update it
+            assert evict.call_count == 1
+            for index in range(5, 20):
+                cache.store(f"{index:02d}entry", CachedResponse(body="x" * 40))
+
+        assert evict.call_count > 1
+        assert sum(path.stat().st_size for path in tmp_path.glob("*/*.json")) <= 1000
+
+
+class TestConditionalRequests:
+    """``GitHubClient`` read endpoints with an HTTP cache."""
+
+    def test_revalidates_with_etag_and_reuses_body_on_304(self, session: mock.Mock, tmp_path: Path) -> None:
+        session.request.side_effect = [
+            _response(payload={"default_branch": "main"}, headers={"ETag": '"v1"'}),
+            _response(status=304),
+        ]
+        client = GitHubClient(token="t", http_cache=HttpCache(tmp_path))
+
+        first = client.get_repository("owner", "repo")
+        second = client.get_repository("owner", "repo")
+
+        assert first == second == {"default_branch": "main"}
+        assert session.request.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+    def test_sha_addressed_objects_skip_the_network(self, session: mock.Mock, tmp_path: Path) -> None:
+        sha = "a" * 40
+        session.request.return_value = _response(payload={"sha": sha, "tree": []})
+        client = GitHubClient(token="t", http_cache=HttpCache(tmp_path))
+
+        client.get_tree("owner", "repo", sha, recursive=True)
+        client.get_tree("owner", "repo", sha, recursive=True)
+
+        assert session.request.call_count == 1
@@ -0,0 +1,46 @@
+"""Tests for the local sync manifest."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from gemini_actions_lab_cli.manifest import MANIFEST_PATH, SyncManifest, selection_key
+
+
+def _selection(**overrides: object) -> dict[str, object]:
+    options = {"workflow_files": ["ci.yml"], "prompt_files": None, "agent_files": None, "use_remote": False}
+    options.update(overrides)
+    return selection_key(None, **options)
+
+
+class TestSyncManifest:
+    """Persistence and freshness checks of ``SyncManifest``."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        manifest = SyncManifest("owner/template", "a" * 40, _selection(), {".github/workflows/ci.yml": "b" * 40})
+
+        manifest.save(tmp_path)
+
+        assert (tmp_path / MANIFEST_PATH).is_file()
+        assert SyncManifest.load(tmp_path) == manifest
+
+    def test_missing_or_corrupt_manifest_loads_as_none(self, tmp_path: Path) -> None:
+        assert SyncManifest.load(tmp_path) is None
+        (tmp_path / MANIFEST_PATH).parent.mkdir(parents=True)
+        (tmp_path / MANIFEST_PATH).write_text("{not json")
+        assert SyncManifest.load(tmp_path) is None
+
+    def test_is_current_requires_same_commit_selection_and_files(self, tmp_path: Path) -> None:
+        workflow = tmp_path / ".github/workflows/ci.yml"
+        workflow.parent.mkdir(parents=True)
+        workflow.write_text("name: CI")
+        manifest = SyncManifest("Owner/Template", "a" * 40, _selection(), {".github/workflows/ci.yml": "b" * 40})
+
+        assert manifest.is_current("owner/template", "a" * 40, _selection(), tmp_path)
+        assert not manifest.is_current("owner/template", "c" * 40, _selection(), tmp_path)
+        assert not manifest.is_current("owner/template", "a" * 40, _selection(use_remote=True), tmp_path)
+        workflow.unlink()
+        assert not manifest.is_current("owner/template", "a" * 40, _selection(), tmp_path)
+
+    def test_selection_key_ignores_argument_order(self) -> None:
+        assert _selection(workflow_files=["b.yml", "a.yml"]) == _selection(workflow_files=["a.yml", "b.yml"])
@@ -0,0 +1,247 @@
+"""Tests for repository secret synchronisation."""
+
+from __future__ import annotations
+
+import threading
+from unittest import mock
+
+import pytest
+
+from gemini_actions_lab_cli import secrets
+from gemini_actions_lab_cli.github_api import GitHubClient, GitHubError, PublicKeyCache, SecretPublicKey
+from gemini_actions_lab_cli.secret_ledger import SecretLedger
+from gemini_actions_lab_cli.secrets import (
+    sync_fleet_secrets,
+    sync_organization_secrets,
+    sync_repository_secrets,
+)
+
+
+@pytest.fixture(autouse=True)
+def fake_encryption() -> mock.Mock:
+    with mock.patch.object(secrets, "encrypt_secret", side_effect=lambda key, value: f"enc({value})") as patched:
+        yield patched
+
+
+@pytest.fixture
+def client() -> mock.Mock:
+    client = mock.Mock(spec=GitHubClient)
+    client.get_secret_public_key.return_value = SecretPublicKey(key_id="kid", key="pk")
+    return client
+
+
+class TestSyncRepositorySecrets:
+    """Behaviour tests for ``sync_repository_secrets``."""
+
+    def test_results_follow_key_order(self, client: mock.Mock) -> None:
+        statuses = {"A": 201, "B": 204, "C": 201, "D": 204}
+
+        def put(owner, repo, name, encrypted, key_id):
+            if name == "B":
+                raise GitHubError("boom", status=500)
+            return statuses[name]
+
+        client.put_actions_secret.side_effect = put
+
+        result = sync_repository_secrets(
+            "owner/repo",
+            {"D": "4", "C": "3", "B": "2", "A": "1"},
+            token="t",
+            max_concurrency=4,
+            client=client,
+        )
+
+        assert result.created == ["C", "A"]
+        assert result.updated == ["D"]
+        assert [(err.name, err.status) for err in result.failed] == [("B", 500)]
+        assert result.total == 4
+        client.get_secret_public_key.assert_called_once_with("owner", "repo")
+        client.put_actions_secret.assert_any_call("owner", "repo", "A", "enc(1)", "kid")
+
+    def test_stale_key_id_refetches_key_and_retries(self, client: mock.Mock) -> None:
+        fresh = SecretPublicKey(key_id="fresh", key="pk2")
+        client.get_secret_public_key.side_effect = [SecretPublicKey(key_id="kid", key="pk"), fresh]
+        client.put_actions_secret.side_effect = [GitHubError("Bad key_id", status=422), 204]
+
+        result = sync_repository_secrets("owner/repo", {"A": "1"}, token="t", client=client)
+
+        assert result.updated == ["A"]
+        client.get_secret_public_key.assert_called_with("owner", "repo", stale_key_id="kid")
+        client.put_actions_secret.assert_called_with("owner", "repo", "A", "enc(1)", "fresh")
+
+    def test_concurrent_422s_refetch_key_once(self, client: mock.Mock) -> None:
+        cache = PublicKeyCache()
+        fetch = mock.Mock(return_value={"key_id": "kid", "key": "pk"})
+        client.get_secret_public_key.side_effect = lambda owner, repo, stale_key_id=None: cache.get(
+            "repo", fetch, stale_key_id=stale_key_id
+        )
+        barrier = threading.Barrier(2, timeout=5)
+
+        def put(*_args):
+            barrier.wait()
+            raise GitHubError("Invalid secret name", status=422)
+
+        client.put_actions_secret.side_effect = put
+
+        result = sync_repository_secrets(
+            "owner/repo", {"A": "1", "B": "2"}, token="t", max_concurrency=2, client=client
+        )
+
+        assert [(err.name, err.status) for err in result.failed] == [("A", 422), ("B", 422)]
+        assert fetch.call_count == 2
+        assert client.put_actions_secret.call_count == 2
+
+    def test_uploads_run_concurrently(self, client: mock.Mock) -> None:
+        barrier = threading.Barrier(3, timeout=5)
+
+        def put(*_args):
+            barrier.wait()
+            return 201
+
+        client.put_actions_secret.side_effect = put
+
+        result = sync_repository_secrets(
+            "owner/repo", {"A": "1", "B": "2", "C": "3"}, token="t", max_concurrency=3, client=client
+        )
+
+        assert result.created == ["A", "B", "C"]
+
+    def test_creates_and_closes_client_when_not_given(self, client: mock.Mock) -> None:
+        client.put_actions_secret.return_value = 201
+        with mock.patch.object(secrets, "GitHubClient") as client_cls:
+            client_cls.return_value.__enter__.return_value = client
+
+            result = sync_repository_secrets("owner/repo", {"A": "1"}, token="t", max_concurrency=16)
+
+        assert result.created == ["A"]
+        assert client_cls.call_args.kwargs["pool_size"] == 16
+        client_cls.return_value.__exit__.assert_called_once()
+
+
+class TestSyncFleetSecrets:
+    """Syncing one set of secrets to many repositories."""
+
+    def test_per_repo_results_in_input_order(self, client: mock.Mock) -> None:
+        def public_key(owner, repo):
+            if repo == "missing":
+                raise GitHubError("Not Found", status=404)
+            return SecretPublicKey(key_id=f"kid-{repo}", key=f"pk-{repo}")
+
+        client.get_secret_public_key.side_effect = public_key
+        client.put_actions_secret.return_value = 201
+
+        results = sync_fleet_secrets(
+            ["owner/b", "owner/missing", "owner/a"],
+            {"X": "1", "Y": "2"},
+            token="t",
+            max_concurrency=4,
+            client=client,
+        )
+
+        assert list(results) == ["owner/b", "owner/missing", "owner/a"]
+        assert results["owner/a"].created == ["X", "Y"]
+        assert results["owner/b"].created == ["X", "Y"]
+        assert [(err.name, err.status) for err in results["owner/missing"].failed] == [("X", 404), ("Y", 404)]
+        assert client.put_actions_secret.call_count == 4
+        client.put_actions_secret.assert_any_call("owner", "a", "Y", "enc(2)", "kid-a")
+
+    def test_single_repo_key_failure_reports_every_secret(self, client: mock.Mock) -> None:
+        client.get_secret_public_key.side_effect = GitHubError("Forbidden", status=403)
+
+        result = sync_repository_secrets("owner/repo", {"A": "1"}, token="t", client=client)
+
+        assert [err.name for err in result.failed] == ["A"]
+        client.put_actions_secret.assert_not_called()
+
+
+class TestSyncOrganizationSecrets:
+    """Organization secrets exposed to selected repositories."""
+
+    @pytest.fixture
+    def org_client(self) -> mock.Mock:
+        client = mock.Mock(spec=GitHubClient)
+        client.get_org_secret_public_key.return_value = SecretPublicKey(key_id="okid", key="opk")
+        client.get_repository.side_effect = lambda owner, repo: {"id": {"a": 11, "b": 7}[repo]}
+        client.put_org_actions_secret.return_value = 201
+        return client
+
+    def test_writes_each_secret_once_for_selected_repositories(self, org_client: mock.Mock) -> None:
+        result = sync_organization_secrets(
+            "org", {"A": "1", "B": "2"}, token="t", repositories=["org/a", "org/b"], client=org_client
+        )
+
+        assert result.created == ["A", "B"]
+        assert org_client.put_org_actions_secret.call_count == 2
+        org_client.put_org_actions_secret.assert_any_call(
+            "org", "A", "enc(1)", "okid", visibility="selected", selected_repository_ids=[7, 11]
+        )
+
+    def test_ledger_tracks_repository_selection(self, org_client: mock.Mock, tmp_path) -> None:
+        ledger = SecretLedger.load(tmp_path / "ledger.json")
+        options = {"token": "t", "client": org_client, "ledger": ledger}
+
+        sync_organization_secrets("org", {"A": "1"}, repositories=["org/a"], **options)
+        same = sync_organization_secrets("org", {"A": "1"}, repositories=["org/a"], **options)
+        widened = sync_organization_secrets("org", {"A": "1"}, repositories=["org/a", "org/b"], **options)
+
+        assert same.skipped == ["A"]
+        assert widened.updated == ["A"]
+        assert org_client.put_org_actions_secret.call_count == 1
+        org_client.set_org_secret_repositories.assert_called_once_with("org", "A", [7, 11])
+
+    def test_changed_value_is_uploaded_again(self, org_client: mock.Mock, tmp_path) -> None:
+        ledger = SecretLedger.load(tmp_path / "ledger.json")
+        options = {"token": "t", "client": org_client, "ledger": ledger}
+
+        sync_organization_secrets("org", {"A": "1"}, repositories=["org/a"], **options)
+        changed = sync_organization_secrets("org", {"A": "2"}, repositories=["org/a", "org/b"], **options)
+        widened_to_all = sync_organization_secrets("org", {"A": "2"}, visibility="all", **options)
+
+        assert changed.created == ["A"]
+        assert widened_to_all.created == ["A"]
+        assert org_client.put_org_actions_secret.call_count == 3
+        org_client.set_org_secret_repositories.assert_not_called()
+
+    def test_rejects_unknown_visibility(self, org_client: mock.Mock) -> None:
+        with pytest.raises(ValueError):
+            sync_organization_secrets("org", {"A": "1"}, token="t", visibility="public", client=org_client)
+
+
+class TestSecretLedger:
+    """Skipping unchanged secrets through ``SecretLedger``."""
+
+    def test_skips_values_already_pushed(self, client: mock.Mock, tmp_path) -> None:
+        client.put_actions_secret.return_value = 204
+        ledger = SecretLedger.load(tmp_path / "ledger.json")
+
+        first = sync_repository_secrets("owner/repo", {"A": "1", "B": "2"}, token="t", client=client, ledger=ledger)
+        reloaded = SecretLedger.load(tmp_path / "ledger.json")
+        second = sync_repository_secrets(
+            "owner/repo", {"A": "1", "B": "changed"}, token="t", client=client, ledger=reloaded
+        )
+
+        assert first.updated == ["A", "B"]
+        assert second.skipped == ["A"]
+        assert second.updated == ["B"]
+        assert client.put_actions_secret.call_count == 3
+        assert (tmp_path / "ledger.json").stat().st_mode & 0o777 == 0o600
+        assert "changed" not in (tmp_path / "ledger.json").read_text()
+
+    def test_key_rotation_forces_full_push(self, client: mock.Mock, tmp_path) -> None:
+        client.put_actions_secret.return_value = 204
+        ledger = SecretLedger.load(tmp_path / "ledger.json")
+        sync_repository_secrets("owner/repo", {"A": "1"}, token="t", client=client, ledger=ledger)
+
+        client.get_secret_public_key.return_value = SecretPublicKey(key_id="rotated", key="pk2")
+        result = sync_repository_secrets("owner/repo", {"A": "1"}, token="t", client=client, ledger=ledger)
+
+        assert result.updated == ["A"]
+        assert result.skipped == []
+
+    def test_failed_upload_is_not_recorded(self, client: mock.Mock, tmp_path) -> None:
+        client.put_actions_secret.side_effect = GitHubError("boom", status=500)
+        ledger = SecretLedger.load(tmp_path / "ledger.json")
+
+        sync_repository_secrets("owner/repo", {"A": "1"}, token="t", client=client, ledger=ledger)
+
+        assert not ledger.is_unchanged("owner/repo", "kid", "A", "1")
@@ -10,7 +10,7 @@ from unittest import mock
 import pytest
 
 from gemini_actions_lab_cli.cli import sync_agent
-from gemini_actions_lab_cli.github_api import GitHubClient, GitHubError
+from gemini_actions_lab_cli.github_api import GitHubClient, GitHubError, git_blob_sha
 
 
 class TestSyncAgent:
@@ -27,6 +27,7 @@ class TestSyncAgent:
         client.get_git_commit.return_value = {
             "tree": {"sha": "tree123"}
         }
+        client.get_tree.return_value = {"tree": []}
         client.create_blob.return_value = "blob123"
         client.create_tree.return_value = {"sha": "newtree123"}
         client.create_commit.return_value = {"sha": "commit123"}
@@ -232,3 +233,47 @@ class TestSyncAgent:
         call_args = mock_github_client.create_commit.call_args
         commit_message = call_args[0][2]
         assert "🤖 Sync AI agent guideline files" in commit_message
+
+    def test_sync_agent_skips_unchanged_files(
+        self, tmp_path: Path, base_args: argparse.Namespace, mock_github_client: mock.Mock
+    ) -> None:
+        """Test that files matching the branch are not uploaded again."""
+        (tmp_path / "Claude.md").write_text("# Claude")
+        (tmp_path / "GEMINI.md").write_text("# Gemini")
+        mock_github_client.get_tree.return_value = {
+            "tree": [
+                {"path": "Claude.md", "type": "blob", "mode": "100644", "sha": git_blob_sha(b"# Claude")},
+                {"path": "GEMINI.md", "type": "blob", "mode": "100644", "sha": "outdated"},
+            ]
+        }
+
+        with mock.patch("gemini_actions_lab_cli.cli.Path.cwd", return_value=tmp_path):
+            with mock.patch("gemini_actions_lab_cli.cli.GitHubClient", return_value=mock_github_client):
+                with mock.patch("gemini_actions_lab_cli.cli._require_token", return_value="fake-token"):
+                    result = sync_agent(base_args)
+
+        assert result == 0
+        mock_github_client.create_blob.assert_called_once()
+        assert mock_github_client.create_blob.call_args[0][2] == b"# Gemini"
+
+    def test_sync_agent_no_changes_skips_commit(
+        self, tmp_path: Path, base_args: argparse.Namespace, mock_github_client: mock.Mock
+    ) -> None:
+        """Test that no commit is created when every file already matches."""
+        (tmp_path / "Claude.md").write_text("# Claude")
+        mock_github_client.get_tree.return_value = {
+            "tree": [
+                {"path": "Claude.md", "type": "blob", "mode": "100644", "sha": git_blob_sha(b"# Claude")},
+            ]
+        }
+
+        with mock.patch("gemini_actions_lab_cli.cli.Path.cwd", return_value=tmp_path):
+            with mock.patch("gemini_actions_lab_cli.cli.GitHubClient", return_value=mock_github_client):
+                with mock.patch("gemini_actions_lab_cli.cli._require_token", return_value="fake-token"):
+                    result = sync_agent(base_args)
+
+        assert result == 0
+        mock_github_client.create_blob.assert_not_called()
+        mock_github_client.create_tree.assert_not_called()
+        mock_github_client.create_commit.assert_not_called()
+        mock_github_client.update_ref.assert_not_called()
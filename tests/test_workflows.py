@@ -8,10 +8,18 @@ from pathlib import Path
 from unittest import mock
 
 import pytest
+import requests
 
-from gemini_actions_lab_cli.cli import _sync_workflows_remote
-from gemini_actions_lab_cli.github_api import GitHubClient
-from gemini_actions_lab_cli.workflows import extract_github_directory, WorkflowSyncError
+from gemini_actions_lab_cli import cli
+from gemini_actions_lab_cli.cli import _sync_workflows_fleet, _sync_workflows_remote, build_parser
+from gemini_actions_lab_cli.github_api import BranchHead, GitHubClient, GitHubError, git_blob_sha
+from gemini_actions_lab_cli.workflows import (
+    extract_github_directory,
+    fetch_github_tree_archive,
+    iter_github_files,
+    TruncatedTreeError,
+    WorkflowSyncError,
+)
 
 
 def _make_template_archive(files: dict[str, str]) -> bytes:
@@ -111,6 +119,86 @@ class TestExtractGithubDirectory:
         assert workflow_path.read_text() == "name: CI"
         assert workflow_path in result.written
 
+    def test_accepts_archive_path_and_file_object(self, tmp_path: Path) -> None:
+        """Archives on disk or in file objects are read without loading them as bytes."""
+        archive_path = tmp_path / "template.zip"
+        archive_path.write_bytes(_make_template_archive({".github/workflows/test.yml": "name: CI"}))
+
+        from_path = extract_github_directory(archive_path, tmp_path / "from-path")
+        with archive_path.open("rb") as handle:
+            from_handle = extract_github_directory(handle, tmp_path / "from-handle")
+
+        assert (tmp_path / "from-path/.github/workflows/test.yml").read_text() == "name: CI"
+        assert (tmp_path / "from-handle/.github/workflows/test.yml").read_text() == "name: CI"
+        assert len(from_path.written) == len(from_handle.written) == 1
+
+    def test_incremental_updates_only_pristine_files(self, tmp_path: Path) -> None:
+        """With previous hashes, unmodified files follow the template and edits survive."""
+        archive = _make_template_archive(
+            {
+                ".github/workflows/pristine.yml": "name: CI v2",
+                ".github/workflows/edited.yml": "name: Lint v2",
+                ".github/workflows/same.yml": "name: Same",
+            }
+        )
+        workflows = tmp_path / ".github/workflows"
+        workflows.mkdir(parents=True)
+        (workflows / "pristine.yml").write_text("name: CI v1")
+        (workflows / "edited.yml").write_text("name: Lint (local)")
+        (workflows / "same.yml").write_text("name: Same")
+        previous = {
+            ".github/workflows/pristine.yml": git_blob_sha(b"name: CI v1"),
+            ".github/workflows/edited.yml": git_blob_sha(b"name: Lint v1"),
+            ".github/workflows/same.yml": git_blob_sha(b"name: Same"),
+        }
+
+        result = extract_github_directory(archive, tmp_path, previous_hashes=previous)
+
+        assert (workflows / "pristine.yml").read_text() == "name: CI v2"
+        assert (workflows / "edited.yml").read_text() == "name: Lint (local)"
+        assert result.written == [tmp_path / ".github/workflows/pristine.yml"]
+        assert result.skipped_existing == [tmp_path / ".github/workflows/edited.yml"]
+        assert result.unchanged == [tmp_path / ".github/workflows/same.yml"]
+        assert result.file_hashes == {
+            ".github/workflows/pristine.yml": git_blob_sha(b"name: CI v2"),
+            ".github/workflows/edited.yml": previous[".github/workflows/edited.yml"],
+            ".github/workflows/same.yml": git_blob_sha(b"name: Same"),
+        }
+
+
+class TestIterGithubFiles:
+    """In-memory iteration over the selected template files."""
+
+    def test_yields_selected_files_with_zip_modes(self) -> None:
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as archive:
+            script = zipfile.ZipInfo("template-main/.github/workflows_remote/run.yml")
+            script.external_attr = 0o100755 << 16
+            archive.writestr(script, "name: Remote")
+            archive.writestr("template-main/.github/scripts/tool.sh", "echo")
+            archive.writestr("template-main/index.html", "<html/>")
+            archive.writestr("template-main/README.md", "readme")
+
+        files = list(iter_github_files(buffer.getvalue(), ["index.html"], use_remote=True))
+
+        assert files == [
+            (".github/workflows/run.yml", "100755", b"name: Remote"),
+            ("index.html", "100644", b"<html/>"),
+        ]
+
+    def test_keeps_symlinks_as_links(self) -> None:
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as archive:
+            link = zipfile.ZipInfo("template-main/.github/workflows/alias.yml")
+            link.external_attr = 0o120777 << 16
+            archive.writestr(link, "ci.yml")
+            archive.writestr("template-main/.github/workflows/ci.yml", "name: CI")
+
+        files = dict((path, (mode, content)) for path, mode, content in iter_github_files(buffer.getvalue()))
+
+        assert files[".github/workflows/alias.yml"] == ("120000", b"ci.yml")
+        assert files[".github/workflows/ci.yml"] == ("100644", b"name: CI")
+
 
 class TestSyncWorkflowsRemote:
     """Tests for remote workflow sync behaviour around optional extras."""
@@ -259,6 +347,341 @@ class TestSyncWorkflowsRemote:
         assert result == 0
         base_client.create_blob.assert_called_once()
 
+    def test_parallel_uploads_keep_tree_order(self, base_client: mock.Mock) -> None:
+        archive = _make_template_archive(
+            {f".github/workflows/wf{index}.yml": f"name: wf{index}" for index in range(6)}
+        )
+        base_client.get_tree.return_value = {"tree": []}
+        base_client.create_blob.side_effect = lambda _owner, _repo, content: f"sha-{content.decode()}"
+
+        result = _sync_workflows_remote(
+            base_client,
+            "owner/template",
+            archive,
+            "owner/repo",
+            branch=None,
+            clean=False,
+            commit_message=None,
+            force=False,
+            enable_pages=False,
+            extra_files=None,
+            overwrite_extras=False,
+            overwrite_github=True,
+            max_concurrency=4,
+        )
+
+        assert result == 0
+        tree_entries = base_client.create_tree.call_args[0][2]
+        assert [entry["path"] for entry in tree_entries] == [
+            f".github/workflows/wf{index}.yml" for index in range(6)
+        ]
+        assert [entry["sha"] for entry in tree_entries] == [f"sha-name: wf{index}" for index in range(6)]
+
+    def test_failed_upload_aborts_without_commit(
+        self, archive: bytes, base_client: mock.Mock
+    ) -> None:
+        base_client.get_tree.return_value = {"tree": []}
+        base_client.create_blob.side_effect = GitHubError("boom", status=502)
+
+        result = _sync_workflows_remote(
+            base_client,
+            "owner/template",
+            archive,
+            "owner/repo",
+            branch=None,
+            clean=False,
+            commit_message=None,
+            force=False,
+            enable_pages=False,
+            extra_files=None,
+            overwrite_extras=False,
+            overwrite_github=True,
+            max_concurrency=2,
+        )
+
+        assert result == 1
+        base_client.create_tree.assert_not_called()
+        base_client.create_commit.assert_not_called()
+
+    def test_skips_unchanged_files(self, base_client: mock.Mock) -> None:
+        archive = _make_template_archive(
+            {
+                ".github/workflows/same.yml": "name: Same",
+                ".github/workflows/changed.yml": "name: Changed",
+            }
+        )
+        base_client.get_tree.return_value = {
+            "tree": [
+                {
+                    "path": ".github/workflows/same.yml",
+                    "type": "blob",
+                    "mode": "100644",
+                    "sha": git_blob_sha(b"name: Same"),
+                },
+                {
+                    "path": ".github/workflows/changed.yml",
+                    "type": "blob",
+                    "mode": "100644",
+                    "sha": git_blob_sha(b"name: Old"),
+                },
+            ]
+        }
+        base_client.create_blob.return_value = "blob-changed"
+
+        result = _sync_workflows_remote(
+            base_client,
+            "owner/template",
+            archive,
+            "owner/repo",
+            branch=None,
+            clean=False,
+            commit_message=None,
+            force=False,
+            enable_pages=False,
+            extra_files=None,
+            overwrite_extras=False,
+            overwrite_github=True,
+        )
+
+        assert result == 0
+        base_client.create_blob.assert_called_once()
+        assert base_client.create_blob.call_args[0][2] == b"name: Changed"
+        tree_entries = base_client.create_tree.call_args[0][2]
+        assert [entry["path"] for entry in tree_entries] == [".github/workflows/changed.yml"]
+
+    def test_no_commit_when_everything_matches(self, archive: bytes, base_client: mock.Mock) -> None:
+        base_client.get_tree.return_value = {
+            "tree": [
+                {
+                    "path": ".github/workflows/test.yml",
+                    "type": "blob",
+                    "mode": "100644",
+                    "sha": git_blob_sha(b"name: CI"),
+                },
+            ]
+        }
+
+        result = _sync_workflows_remote(
+            base_client,
+            "owner/template",
+            archive,
+            "owner/repo",
+            branch=None,
+            clean=False,
+            commit_message=None,
+            force=False,
+            enable_pages=False,
+            extra_files=None,
+            overwrite_extras=False,
+            overwrite_github=True,
+        )
+
+        assert result == 0
+        base_client.create_blob.assert_not_called()
+        base_client.create_commit.assert_not_called()
+        base_client.update_ref.assert_not_called()
+
+    def test_pages_failure_is_printed_to_stderr(
+        self, archive: bytes, base_client: mock.Mock, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        base_client.get_tree.return_value = {"tree": []}
+        base_client.create_blob.return_value = "blob123"
+        base_client.configure_pages_actions.side_effect = GitHubError("Forbidden", status=403)
+
+        result = _sync_workflows_remote(
+            base_client,
+            "owner/template",
+            archive,
+            "owner/repo",
+            branch=None,
+            clean=False,
+            commit_message=None,
+            force=False,
+            enable_pages=True,
+            extra_files=None,
+            overwrite_extras=False,
+            overwrite_github=True,
+        )
+
+        assert result == 0
+        assert "⚠️ Failed to configure GitHub Pages: Forbidden" in capsys.readouterr().err
+
+    def test_inlines_small_text_files(self, base_client: mock.Mock) -> None:
+        archive = _make_template_archive(
+            {
+                ".github/workflows/test.yml": "name: CI",
+                ".github/assets/logo.bin": "\x00\x01binary",
+                ".github/prompts/large.md": "x" * 64,
+            }
+        )
+        base_client.get_tree.return_value = {"tree": []}
+        base_client.create_blob.side_effect = lambda _owner, _repo, content: f"blob-{len(content)}"
+
+        result = _sync_workflows_remote(
+            base_client,
+            "owner/template",
+            archive,
+            "owner/repo",
+            branch=None,
+            clean=False,
+            commit_message=None,
+            force=False,
+            enable_pages=False,
+            extra_files=None,
+            overwrite_extras=False,
+            overwrite_github=True,
+            inline_max_bytes=32,
+        )
+
+        assert result == 0
+        assert base_client.create_blob.call_count == 2
+        entries = {entry["path"]: entry for entry in base_client.create_tree.call_args[0][2]}
+        assert entries[".github/workflows/test.yml"]["content"] == "name: CI"
+        assert "sha" not in entries[".github/workflows/test.yml"]
+        assert entries[".github/assets/logo.bin"]["sha"] == "blob-8"
+        assert entries[".github/prompts/large.md"]["sha"] == "blob-64"
+
+
+class TestSyncWorkflowsFleet:
+    """Pushing one template to several repositories."""
+
+    def test_reports_changed_current_and_failed(self, capsys: pytest.CaptureFixture[str]) -> None:
+        archive = _make_template_archive({".github/workflows/test.yml": "name: CI"})
+        current_tree = {
+            "tree": [
+                {
+                    "path": ".github/workflows/test.yml",
+                    "type": "blob",
+                    "mode": "100644",
+                    "sha": git_blob_sha(b"name: CI"),
+                }
+            ]
+        }
+        client = mock.Mock(spec=GitHubClient)
+
+        def default_branch(owner: str, repo: str) -> str:
+            if repo == "broken":
+                raise GitHubError("Not Found", status=404)
+            return "main"
+
+        client.get_default_branch.side_effect = default_branch
+        # Only "changed" is resolved through GraphQL; the others fall back to REST
+        client.resolve_branch_heads.return_value = {"owner/changed": BranchHead("main", "abc123", "tree123")}
+        client.get_ref.return_value = {"object": {"sha": "abc123"}}
+        client.get_git_commit.return_value = {"tree": {"sha": "tree123"}}
+        client.get_tree.side_effect = lambda owner, repo, sha, recursive=False: (
+            current_tree if repo == "current" else {"tree": []}
+        )
+        client.create_blob.return_value = "blob123"
+        client.create_tree.return_value = {"sha": "newtree"}
+        client.create_commit.return_value = {"sha": "commit1234567"}
+        client.scheduler.metrics.return_value = {
+            "limit": 5000,
+            "remaining": 4990,
+            "reset_at": None,
+            "requests": 10,
+            "retries": 0,
+            "throttled_seconds": 0.0,
+        }
+
+        exit_code = _sync_workflows_fleet(
+            client,
+            "owner/template",
+            archive,
+            ["owner/changed", "owner/current", "owner/broken"],
+            None,
+            fleet_concurrency=3,
+            extra_files=None,
+            workflow_files=None,
+            prompt_files=None,
+            agent_files=None,
+            use_remote=False,
+            clean=False,
+            commit_message=None,
+            force=False,
+            enable_pages=False,
+            overwrite_extras=False,
+            overwrite_github=False,
+        )
+
+        output = capsys.readouterr().out
+        assert exit_code == 1
+        assert "owner/changed: main@commit1" in output
+        assert "Already current (1)" in output
+        assert "owner/broken: Not Found" in output
+        assert "API budget: 4990/5000" in output
+        client.create_commit.assert_called_once()
+        assert client.update_ref.call_args.args[:2] == ("owner", "changed")
+        client.resolve_branch_heads.assert_called_once_with(
+            ["owner/changed", "owner/current", "owner/broken"], None
+        )
+        assert [call.args[1] for call in client.get_default_branch.call_args_list].count("changed") == 0
+        assert client.create_commit.call_args.kwargs["parents"] == ["abc123"]
+
+    @staticmethod
+    def _run(client: mock.Mock, target_repos: list[str], **options: object) -> int:
+        client.get_default_branch.return_value = "main"
+        client.resolve_branch_heads.return_value = {}
+        client.get_ref.return_value = {"object": {"sha": "abc123"}}
+        client.get_git_commit.return_value = {"tree": {"sha": "tree123"}}
+        client.get_tree.return_value = {"tree": []}
+        client.create_blob.return_value = "blob123"
+        client.create_tree.return_value = {"sha": "newtree"}
+        client.create_commit.return_value = {"sha": "commit1234567"}
+        client.scheduler.metrics.return_value = {"remaining": None}
+        push_options = {
+            "clean": False,
+            "commit_message": None,
+            "force": False,
+            "enable_pages": False,
+            "overwrite_extras": False,
+            "overwrite_github": False,
+            **options,
+        }
+        return _sync_workflows_fleet(
+            client,
+            "owner/template",
+            _make_template_archive({".github/workflows/test.yml": "name: CI"}),
+            target_repos,
+            None,
+            fleet_concurrency=2,
+            extra_files=None,
+            workflow_files=None,
+            prompt_files=None,
+            agent_files=None,
+            use_remote=False,
+            **push_options,
+        )
+
+    def test_connection_error_fails_only_that_repository(self, capsys: pytest.CaptureFixture[str]) -> None:
+        client = mock.Mock(spec=GitHubClient)
+
+        def get_tree(owner: str, repo: str, sha: str, recursive: bool = False) -> dict:
+            if repo == "offline":
+                raise requests.ConnectionError("connection refused")
+            return {"tree": []}
+
+        client.get_tree.side_effect = get_tree
+
+        exit_code = self._run(client, ["owner/a", "owner/offline", "owner/b"])
+
+        output = capsys.readouterr().out
+        assert exit_code == 1
+        assert "Changed (2)" in output
+        assert "owner/offline: connection refused" in output
+        assert client.create_commit.call_count == 2
+
+    def test_pages_failures_are_listed_in_the_summary(self, capsys: pytest.CaptureFixture[str]) -> None:
+        client = mock.Mock(spec=GitHubClient)
+        client.configure_pages_actions.side_effect = GitHubError("Forbidden", status=403)
+
+        exit_code = self._run(client, ["owner/a"], enable_pages=True)
+
+        captured = capsys.readouterr()
+        assert exit_code == 0
+        assert "owner/a: main@commit1; Failed to configure GitHub Pages: Forbidden" in captured.out
+        assert captured.err == ""
+
 
 class TestExtractSpecificWorkflow:
     """Tests for extracting specific workflow files."""
@@ -511,3 +934,190 @@ class TestExtractMultipleWorkflows:
                 destination,
                 workflow_files=["test1.yml", "missing.yml"],
             )
+
+
+class TestFetchGithubTreeArchive:
+    """Tests for fetching template files through the Git Trees API."""
+
+    @pytest.fixture
+    def client(self) -> mock.Mock:
+        trees = {
+            "root-tree": {
+                "tree": [
+                    {"path": ".github", "type": "tree", "sha": "github-tree"},
+                    {"path": "index.html", "type": "blob", "mode": "100644", "sha": "blob-index"},
+                    {"path": "generated-images", "type": "tree", "sha": "images-tree"},
+                ]
+            },
+            "github-tree": {
+                "tree": [
+                    {"path": "workflows", "type": "tree", "sha": "wf-tree"},
+                    {"path": "workflows/ci.yml", "type": "blob", "mode": "100644", "sha": "blob-ci"},
+                    {"path": "workflows_remote/ci.yml", "type": "blob", "mode": "100644", "sha": "blob-ci-remote"},
+                    {"path": "scripts/run.sh", "type": "blob", "mode": "100755", "sha": "blob-script"},
+                    {"path": "prompts/review.md", "type": "blob", "mode": "100644", "sha": "blob-prompt"},
+                ]
+            },
+        }
+        blobs = {
+            "blob-index": b"<html></html>",
+            "blob-ci": b"name: CI",
+            "blob-ci-remote": b"name: Remote CI",
+            "blob-script": b"#!/bin/sh",
+            "blob-prompt": b"Review this",
+        }
+        client = mock.Mock(spec=GitHubClient)
+        client.get_git_commit.return_value = {"tree": {"sha": "root-tree"}}
+        client.get_tree.side_effect = lambda _owner, _repo, sha, recursive=False: trees[sha]
+        client.get_blob.side_effect = lambda _owner, _repo, sha: blobs[sha]
+        return client
+
+    def test_fetches_whole_github_directory_and_extras(self, client: mock.Mock, tmp_path: Path) -> None:
+        archive = fetch_github_tree_archive(client, "owner", "template", "a" * 40, ["index.html"])
+
+        result = extract_github_directory(archive, tmp_path, extra_files=["index.html"])
+
+        assert sorted(path.relative_to(tmp_path).as_posix() for path in result.written) == [
+            ".github/prompts/review.md",
+            ".github/scripts/run.sh",
+            ".github/workflows/ci.yml",
+            ".github/workflows_remote/ci.yml",
+            "index.html",
+        ]
+        assert (tmp_path / "index.html").read_text() == "<html></html>"
+        fetched = {call.args[2] for call in client.get_tree.call_args_list}
+        assert "images-tree" not in fetched
+
+    def test_fetches_only_named_files(self, client: mock.Mock, tmp_path: Path) -> None:
+        archive = fetch_github_tree_archive(
+            client,
+            "owner",
+            "template",
+            "a" * 40,
+            workflow_files=["ci.yml"],
+            prompt_files=["review.md"],
+            use_remote=True,
+        )
+
+        result = extract_github_directory(
+            archive, tmp_path, workflow_files=["ci.yml"], prompt_files=["review.md"], use_remote=True
+        )
+
+        assert sorted(call.args[2] for call in client.get_blob.call_args_list) == ["blob-ci-remote", "blob-prompt"]
+        assert (tmp_path / ".github/workflows/ci.yml").read_text() == "name: Remote CI"
+        assert len(result.written) == 2
+
+    def test_missing_named_file_raises(self, client: mock.Mock) -> None:
+        with pytest.raises(WorkflowSyncError, match="Workflow file 'missing.yml' not found"):
+            fetch_github_tree_archive(client, "owner", "template", "a" * 40, workflow_files=["missing.yml"])
+        client.get_blob.assert_not_called()
+
+    def test_keeps_executable_and_symlink_modes(self, client: mock.Mock) -> None:
+        listing = client.get_tree.side_effect
+        link = {"path": "scripts/latest.sh", "type": "blob", "mode": "120000", "sha": "blob-link"}
+        client.get_tree.side_effect = lambda owner, repo, sha, recursive=False: (
+            {"tree": [*listing(owner, repo, sha)["tree"], link]} if recursive else listing(owner, repo, sha)
+        )
+        blob = client.get_blob.side_effect
+        client.get_blob.side_effect = lambda owner, repo, sha: (
+            b"run.sh" if sha == "blob-link" else blob(owner, repo, sha)
+        )
+
+        archive = fetch_github_tree_archive(client, "owner", "template", "a" * 40)
+
+        modes = {path: mode for path, mode, _ in iter_github_files(archive)}
+        assert modes[".github/scripts/latest.sh"] == "120000"
+        assert modes[".github/scripts/run.sh"] == "100755"
+        assert modes[".github/workflows/ci.yml"] == "100644"
+
+    def test_truncated_tree_raises(self, client: mock.Mock) -> None:
+        listing = client.get_tree.side_effect
+        client.get_tree.side_effect = lambda owner, repo, sha, recursive=False: (
+            {**listing(owner, repo, sha), "truncated": True} if recursive else listing(owner, repo, sha)
+        )
+
+        with pytest.raises(TruncatedTreeError):
+            fetch_github_tree_archive(client, "owner", "template", "a" * 40)
+        client.get_blob.assert_not_called()
+
+
+class TestSyncWorkflowsCommand:
+    """End-to-end runs of ``sync-workflows`` through the argument parser."""
+
+    @staticmethod
+    def _client(files: dict[str, bytes], commit_sha: str = "a" * 40) -> mock.Mock:
+        blobs = {git_blob_sha(content): content for content in files.values()}
+        github_tree = {
+            "tree": [
+                {"path": path, "type": "blob", "mode": "100644", "sha": git_blob_sha(content)}
+                for path, content in files.items()
+            ]
+        }
+        trees = {
+            "root-tree": {"tree": [{"path": ".github", "type": "tree", "sha": "github-tree"}]},
+            "github-tree": github_tree,
+        }
+        client = mock.Mock(spec=GitHubClient)
+        client.resolve_commit_sha.return_value = commit_sha
+        client.get_git_commit.return_value = {"tree": {"sha": "root-tree"}}
+        client.get_tree.side_effect = lambda _owner, _repo, sha, recursive=False: trees[sha]
+        client.get_blob.side_effect = lambda _owner, _repo, sha: blobs[sha]
+        return client
+
+    @staticmethod
+    def _run(client: mock.Mock, destination: Path, *options: str) -> int:
+        args = build_parser().parse_args(
+            [
+                "sync-workflows",
+                "--template-repo",
+                "owner/template",
+                "--destination",
+                str(destination),
+                "--template-source",
+                "tree",
+                "--no-cache",
+                *options,
+            ]
+        )
+        with mock.patch.object(cli, "GitHubClient", return_value=client):
+            return args.func(args)
+
+    def test_tree_source_writes_selected_workflows(self, tmp_path: Path) -> None:
+        client = self._client({"workflows/a.yml": b"name: A", "workflows/b.yml": b"name: B"})
+
+        assert self._run(client, tmp_path, "--workflows", "a.yml") == 0
+
+        assert (tmp_path / ".github/workflows/a.yml").read_text() == "name: A"
+        assert not (tmp_path / ".github/workflows/b.yml").exists()
+        client.download_repository_archive.assert_not_called()
+        client.stream_repository_archive.assert_not_called()
+        client.close.assert_called_once_with()
+
+    def test_truncated_tree_falls_back_to_archive(self, tmp_path: Path) -> None:
+        client = self._client({"workflows/a.yml": b"name: A"})
+        listing = client.get_tree.side_effect
+        client.get_tree.side_effect = lambda owner, repo, sha, recursive=False: {
+            **listing(owner, repo, sha),
+            "truncated": recursive,
+        }
+        zipball = _make_template_archive({".github/workflows/a.yml": "name: A", ".github/workflows/b.yml": "name: B"})
+        client.stream_repository_archive.side_effect = lambda owner, repo, handle, ref=None: handle.write(zipball)
+
+        assert self._run(client, tmp_path) == 0
+
+        assert (tmp_path / ".github/workflows/b.yml").read_text() == "name: B"
+        client.stream_repository_archive.assert_called_once()
+        client.get_blob.assert_not_called()
+
+    def test_narrow_sync_keeps_hashes_of_earlier_files(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        v1 = {"workflows/a.yml": b"name: A", "workflows/b.yml": b"name: B"}
+        v2 = {"workflows/a.yml": b"name: A2", "workflows/b.yml": b"name: B2"}
+
+        assert self._run(self._client(v1), tmp_path) == 0
+        assert self._run(self._client(v1), tmp_path, "--workflows", "a.yml") == 0
+        capsys.readouterr()
+        assert self._run(self._client(v2, commit_sha="b" * 40), tmp_path) == 0
+
+        assert (tmp_path / ".github/workflows/a.yml").read_text() == "name: A2"
+        assert (tmp_path / ".github/workflows/b.yml").read_text() == "name: B2"
+        assert "Preserved files" not in capsys.readouterr().out